@@ -0,0 +1,37 @@
+"""Optional native build of the hot lexer, parser and compile-time check modules.
+
+Regular builds are pure Python and configured entirely in pyproject.toml.
+Set SPICE_MYPYC=1 (with mypy installed) to compile the lexer, the parser and
+the AST-walking checkers with mypyc instead:
+
+    SPICE_MYPYC=1 python -m build --wheel --no-isolation
+"""
+
+import os
+
+from setuptools import setup
+
+# The single-walk checkers and the walker driving them. CompileTimeCheck stays
+# interpreted: the other checkers subclass it and compiled classes can't be
+# subclassed from interpreted code.
+MYPYC_MODULES = [
+    "spice/compilation/checks/composite_checker.py",
+    "spice/compilation/checks/final_checker.py",
+    "spice/compilation/checks/interface_checker.py",
+    "spice/compilation/checks/symbol_table_builder.py",
+    "spice/compilation/checks/type_checker.py",
+    "spice/lexer/tokenizer.py",
+    # The recursive-descent parser. parser/ast_nodes stays interpreted: mypyc
+    # can't build its slotted dataclass hierarchy.
+    "spice/parser/expression_parser.py",
+    "spice/parser/parser.py",
+]
+
+ext_modules = []
+if os.environ.get("SPICE_MYPYC") == "1":
+    from mypyc.build import mypycify
+
+    # Only the listed modules are type checked; the rest of the tree isn't mypy-clean yet.
+    ext_modules = mypycify(["--follow-imports=silent", *MYPYC_MODULES])
+
+setup(ext_modules=ext_modules)
@@ -1,8 +1,23 @@
 """Spice compiler - A Python superset with static typing features."""
+import importlib
 from importlib.metadata import version
 
-from spice import cli, lexer, parser, transformer, errors, printils, compilation
-
 __version__ = version("spice-lang")
 
-__all__ = ["cli", "lexer", "parser", "transformer", "compilation", "errors", "printils"]
\ No newline at end of file
+__all__ = ["cli", "lexer", "parser", "transformer", "compilation", "errors", "printils"]
+
+# Subpackages are imported on first attribute access (PEP 562), so `import spice`
+# (and the CLI entry point) doesn't pay for the whole compilation stack up front.
+_LAZY_SUBMODULES = frozenset(__all__)
+
+
+def __getattr__(name: str):
+    if name in _LAZY_SUBMODULES:
+        module = importlib.import_module(f"spice.{name}")
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module 'spice' has no attribute '{name}'")
+
+
+def __dir__():
+    return sorted(set(globals()) | _LAZY_SUBMODULES)
@@ -15,8 +15,11 @@ import click
 @click.option('-w', '--watch', is_flag=True, help='Watch file for changes. This option disables verbosity.')
 @click.option('-v', '--verbose', is_flag=True, help='Verbose output')
 @click.option('--runtime-checks', is_flag=True, help='Add runtime type checking to output')
+@click.option('--cache', is_flag=True, help='Skip files unchanged since the last cached build and reuse their parsed ASTs')
+@click.option('-j', '--jobs', type=click.IntRange(min=1), default=1, help='Parallel jobs for parsing imports, compile-time checks and exe C builds (default: 1)')
+@click.option('--release', is_flag=True, help='Optimize exe builds (-O3 and link-time optimization)')
 @click.version_option(package_name='spice-lang', prog_name='spicy')
-def from_cli(source: str, output: Optional[str], emit: str, keep_intermidiates: bool, check: bool, watch: bool, verbose: bool, runtime_checks: bool):
+def from_cli(source: str, output: Optional[str], emit: str, keep_intermidiates: bool, check: bool, watch: bool, verbose: bool, runtime_checks: bool, cache: bool, jobs: int, release: bool):
     """Compile Spice (.spc) files to Python, Cython, or standalone executables."""
     flags: BuildFlags = BuildFlags(
         source=Path(source),
@@ -26,7 +29,10 @@ def from_cli(source: str, output: Optional[str], emit: str, keep_intermidiates:
         check=check,
         watch=watch,
         verbose=verbose,
-        runtime_checks=runtime_checks
+        runtime_checks=runtime_checks,
+        cache=cache,
+        jobs=jobs,
+        release=release
     )
     spam_console(flags.verbose)
 
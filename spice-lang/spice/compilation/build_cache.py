@@ -0,0 +1,122 @@
+"""On-disk record of up-to-date build outputs (enabled with the `cache` build flag).
+
+A file is skipped by `verify_and_write` when its source, the flags that shape
+its output and the compiler version all match a previous successful build, and
+the output written back then is still on disk unchanged.
+
+The same flag also caches parsed ASTs by source hash, so an unchanged file
+(an entry point or any of its imports) skips the lexer and parser entirely.
+"""
+
+import hashlib
+import os
+import pickle
+import tempfile
+from importlib.metadata import version
+from pathlib import Path
+from typing import Optional
+
+from spice.compilation.build_flags import BuildFlags
+from spice.parser import Module
+
+CACHE_DIR: Path = Path.home().joinpath('.spice', 'cache')
+
+# Flags that change the generated code for a file.
+_OUTPUT_FLAGS = ("emit", "output", "runtime_checks")
+
+# Leading byte of every AST cache entry. Bump it when AST node classes change
+# shape in a way pickles from an older build can't be read back as
+# (\x05: LiteralExpression.folded).
+_AST_SCHEMA = b"\x05"
+
+
+def _digest(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def cache_key(path: Path, source: str, flags: BuildFlags) -> str:
+    """Key for one file's build: its resolved path + source, output flags and compiler version."""
+    flag_part = repr(tuple(str(flags.get(name)) for name in _OUTPUT_FLAGS))
+    full = "\0".join((path.resolve().as_posix(), source, flag_part, version("spice-lang")))
+    return _digest(full.encode("utf-8"))
+
+
+def _record_path(key: str) -> Path:
+    return CACHE_DIR / f"build_{key}.out"
+
+
+def _output_digest(output_path: Path) -> Optional[str]:
+    try:
+        return _digest(output_path.read_bytes())
+    except OSError:
+        return None
+
+
+def is_up_to_date(key: str, output_path: Path) -> bool:
+    """True if `key` was built before and `output_path` still holds that build's output."""
+    record = _record_path(key)
+    if not record.is_file():
+        return False
+    current = _output_digest(output_path)
+    return current is not None and record.read_text(encoding="utf-8") == current
+
+
+def record_build(key: str, output_path: Path) -> None:
+    """Remember that `output_path` now holds the output for `key`."""
+    digest = _output_digest(output_path)
+    if digest is None:
+        return
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    _record_path(key).write_text(digest, encoding="utf-8")
+
+
+def ast_key(source: str) -> str:
+    """Key for a file's parsed AST: its source and the compiler version that parsed it."""
+    data = "\0".join((source, version("spice-lang"))).encode("utf-8")
+    return hashlib.blake2b(data, digest_size=20).hexdigest()
+
+
+def _ast_path(key: str) -> Path:
+    return CACHE_DIR / "ast" / f"{key}.pkl"
+
+
+def load_ast(key: str) -> Optional[Module]:
+    """The cached AST for `key`, or None on a miss or an unreadable entry.
+
+    Every call unpickles a new tree, so callers may mutate what they get back.
+    """
+    try:
+        data = _ast_path(key).read_bytes()
+    except OSError:
+        return None
+    if not data.startswith(_AST_SCHEMA):
+        return None
+    try:
+        ast = pickle.loads(data[len(_AST_SCHEMA):])
+    except Exception:
+        # Truncated or written by an incompatible build; it is rewritten after the parse.
+        return None
+    return ast if isinstance(ast, Module) else None
+
+
+def store_ast(key: str, ast: Module) -> None:
+    """Cache `ast` under `key`. Best effort: failures leave the cache untouched."""
+    try:
+        data = _AST_SCHEMA + pickle.dumps(ast, protocol=pickle.HIGHEST_PROTOCOL)
+    except (pickle.PicklingError, RecursionError, TypeError):
+        return
+    target = _ast_path(key)
+    try:
+        target.parent.mkdir(parents=True, exist_ok=True)
+        # Written aside and renamed into place, so concurrent builds only ever
+        # see a complete entry (the last writer wins with identical content).
+        fd, tmp = tempfile.mkstemp(dir=target.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp, target)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+    except OSError:
+        return
@@ -30,11 +30,17 @@ class BuildFlags:
         watch: File watching mode
         verbose: Detailed logging of pipeline stages
         runtime_checks: Inject runtime type checking decorators
+        cache: Skip files whose source, output flags and output are unchanged,
+            and reuse the parsed AST of any unchanged source
+        jobs: Parallel workers for parsing imports, independent checks and exe C builds
+        release: Build exe targets with aggressive C optimization (-O3, LTO)
 
     Extra keys (for plugins/tools) live in the same dict and are reached with
     get()/set(), item access (flags["key"]) or as_dict().
     """
 
+    __slots__ = ("_data",)
+
     CORE_DEFAULTS: dict[str, Any] = {
         "source": None,
         "output": None,
@@ -44,6 +50,9 @@ class BuildFlags:
         "watch": False,
         "verbose": False,
         "runtime_checks": False,
+        "cache": False,
+        "jobs": 1,
+        "release": False,
     }
 
     def __init__(
@@ -56,6 +65,9 @@ class BuildFlags:
         watch: bool = False,
         verbose: bool = False,
         runtime_checks: bool = False,
+        cache: bool = False,
+        jobs: int = 1,
+        release: bool = False,
         **extra: Any,
     ) -> None:
         self._data: dict[str, Any] = dict(self.CORE_DEFAULTS)
@@ -68,6 +80,9 @@ class BuildFlags:
             "watch": watch,
             "verbose": verbose,
             "runtime_checks": runtime_checks,
+            "cache": cache,
+            "jobs": jobs,
+            "release": release,
         })
 
         self._data.update(extra)
@@ -80,6 +95,9 @@ class BuildFlags:
     watch = _core_field("watch")
     verbose = _core_field("verbose")
     runtime_checks = _core_field("runtime_checks")
+    cache = _core_field("cache")
+    jobs = _core_field("jobs")
+    release = _core_field("release")
 
     def get(self, key: str, default: Any = None) -> Any:
         return self._data.get(key, default)
@@ -4,6 +4,7 @@ from spice.compilation.checks.final_checker import FinalChecker
 from spice.compilation.checks.interface_checker import InterfaceChecker, CheckError
 from spice.compilation.checks.method_overload_resolver import MethodOverloadResolver
 from spice.compilation.checks.compile_time_check import CompileTimeCheck
+from spice.compilation.checks.composite_checker import CompositeChecker
 from spice.compilation.checks.symbol_table_builder import SymbolTableBuilder
 from spice.compilation.checks.type_checker import TypeChecker
 from spice.compilation.checks.generic_bound_checker import GenericBoundChecker
@@ -18,5 +19,6 @@ __all__ = [
     "TypeChecker",
     "GenericBoundChecker",
     "CompileTimeCheck",
+    "CompositeChecker",
     "AnnotationStage",
 ]
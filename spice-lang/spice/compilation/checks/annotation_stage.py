@@ -7,6 +7,7 @@ plugs into the pipeline and reports fatal errors the usual way.
 """
 
 import inspect
+from typing import Any, List
 
 from spice.compilation.checks.compile_time_check import CompileTimeCheck
 from spice.parser.ast_nodes import LiteralExpression
@@ -15,8 +16,8 @@ import spice.annotations.builtins
 
 
 class AnnotationStage(CompileTimeCheck):
-    def __init__(self):
-        self.errors = []
+    def __init__(self) -> None:
+        self.errors: List[Any] = []
 
     def check(self, file) -> bool:
         self.errors = []
@@ -1,7 +1,11 @@
 from abc import ABC, abstractmethod
+from typing import Any, Sequence
 from spice.compilation.spicefile import SpiceFile
 
 class CompileTimeCheck(ABC):
+    # Problems found by the last check(); checkers that report any replace this
+    errors: Sequence[Any] = ()
+
     @abstractmethod
     def check(self, file: SpiceFile) -> bool:
         """Perform the compile-time check on the given SpiceFile.
@@ -13,4 +17,21 @@ class CompileTimeCheck(ABC):
             bool: True if the check passes, False otherwise.
         """
         pass
-    
\ No newline at end of file
+
+    # Per-node hooks, driven by CompositeChecker's single AST walk.
+
+    def prepare(self, file: SpiceFile) -> None:
+        """Reset per-file state before the walk starts."""
+        pass
+
+    def visit(self, node) -> None:
+        """Called for every node of the walk, parents before children."""
+        pass
+
+    def leave(self, node) -> None:
+        """Called once all children of a scope-opening node were visited."""
+        pass
+
+    def finish(self, file: SpiceFile) -> bool:
+        """Run whole-file checks after the walk. Returns True if the check passes."""
+        return True
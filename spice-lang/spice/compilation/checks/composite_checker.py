@@ -0,0 +1,75 @@
+"""Run several compile-time checks over one shared AST walk."""
+
+from typing import Any, List, Sequence
+
+from spice.compilation.checks.compile_time_check import CompileTimeCheck
+from spice.compilation.spicefile import SpiceFile
+from spice.parser.ast_nodes import (
+    ClassDeclaration,
+    DataClassDeclaration,
+    EnumDeclaration,
+    FunctionDeclaration,
+    child_nodes,
+)
+
+# Nodes whose children live in their own scope; checkers get a `leave` call for them.
+SCOPE_NODE_TYPES = frozenset({
+    ClassDeclaration,
+    DataClassDeclaration,
+    EnumDeclaration,
+    FunctionDeclaration,
+})
+
+
+class _Leave:
+    """Stack marker: all children of `node` were visited."""
+    __slots__ = ("node",)
+
+    def __init__(self, node) -> None:
+        self.node = node
+
+
+class CompositeChecker(CompileTimeCheck):
+    """Visit the AST once and hand every node to each registered checker."""
+
+    def __init__(self, checkers: Sequence[CompileTimeCheck]) -> None:
+        self.checkers: List[CompileTimeCheck] = list(checkers)
+        self.errors: List[Any] = []
+
+    def check(self, file: SpiceFile) -> bool:
+        checkers = self.checkers
+        for checker in checkers:
+            checker.prepare(file)
+
+        # Bound hooks, skipping checkers that keep the no-op default.
+        visits = [c.visit for c in checkers if type(c).visit is not CompileTimeCheck.visit]
+        leaves = [c.leave for c in checkers if type(c).leave is not CompileTimeCheck.leave]
+        scope_types = SCOPE_NODE_TYPES
+        leave_type = _Leave
+        children_of = child_nodes
+
+        stack: List[Any] = list(reversed(file.ast.body))
+        pop = stack.pop
+        push = stack.append
+        extend = stack.extend
+        while stack:
+            node = pop()
+            node_type = type(node)
+            if node_type is leave_type:
+                for leave in leaves:
+                    leave(node.node)
+                continue
+
+            for visit in visits:
+                visit(node)
+
+            if leaves and node_type in scope_types:
+                push(leave_type(node))
+            children = children_of(node)
+            if children:
+                children.reverse()
+                extend(children)
+
+        results = [checker.finish(file) for checker in checkers]
+        self.errors = [error for checker in checkers for error in getattr(checker, "errors", [])]
+        return all(results)
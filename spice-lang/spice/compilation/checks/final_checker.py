@@ -1,16 +1,14 @@
-from dataclasses import fields, is_dataclass
-from typing import Dict, List, Optional, Set, TYPE_CHECKING, Union
+from typing import Any, Callable, Dict, FrozenSet, List, Set, TYPE_CHECKING, Union
 
 from spice.parser.ast_nodes import (
-    ASTNode,
     AssignmentExpression,
     ClassDeclaration,
-    ExpressionStatement,
     FinalDeclaration,
     FunctionDeclaration,
     IdentifierExpression,
 )
 from spice.compilation.checks.compile_time_check import CompileTimeCheck
+from spice.compilation.checks.composite_checker import CompositeChecker
 from spice.compilation.checks.interface_checker import CheckError
 
 if TYPE_CHECKING:
@@ -19,46 +17,93 @@ if TYPE_CHECKING:
 class FinalChecker(CompileTimeCheck):
     """Compile-time checker for final variable reassignments."""
 
-    def __init__(self):
+    def __init__(self) -> None:
+        self._dispatch: Dict[type, Callable[[Any], None]] = {
+            FinalDeclaration: self._visit_final_declaration,
+            AssignmentExpression: self._handle_assignment,
+            FunctionDeclaration: self._visit_function,
+            ClassDeclaration: self._visit_class,
+        }
         self._reset_state()
 
-    def _reset_state(self):
+    def _reset_state(self) -> None:
         self.final_variables: Dict[str, Set[str]] = {'global': set()}
         self.current_scope = 'global'
+        # Buckets of the global and current scope, kept in sync with `current_scope`
+        self._global_set: Set[str] = self.final_variables['global']
+        self._scope_set: Set[str] = self._global_set
+        # scope -> its finals | global finals, so an assignment is one membership test
+        self._effective_finals: Dict[str, Set[str]] = {'global': self._global_set}
+        self._effective_now: Set[str] = self._global_set
+        self.scope_history: List[str] = []
         self.errors: List[Union[str, CheckError]] = []
         self.class_nodes: Dict[str, ClassDeclaration] = {}
-        self.final_methods_by_class: Dict[str, Dict[str, FunctionDeclaration]] = {}
+        self.visited_classes: List[ClassDeclaration] = []
+        self.final_methods_by_class: Dict[str, FrozenSet[str]] = {}
+        self._inherited_cache: Dict[str, Dict[str, str]] = {}
 
     def check(self, file: "SpiceFile") -> bool:
+        return CompositeChecker([self]).check(file)
+
+    def prepare(self, file: "SpiceFile") -> None:
         self._reset_state()
-        self._collect_class_metadata(file.ast.body)
-        for node in file.ast.body:
-            self._visit_node(node)
+
+    def visit(self, node) -> None:
+        handler = self._dispatch.get(type(node))
+        if handler is not None:
+            handler(node)
+
+    def leave(self, node) -> None:
+        if type(node) in (FunctionDeclaration, ClassDeclaration):
+            self.enter_scope(self.scope_history.pop())
+
+    def finish(self, file: "SpiceFile") -> bool:
+        # Overrides can only be judged once every class (bases included) was seen.
+        for class_node in self.visited_classes:
+            self._check_final_method_overrides(class_node)
+        self.errors = self._dedupe_errors(self.errors)
         return not self.errors
 
+    @staticmethod
+    def _dedupe_errors(errors: List[Union[str, CheckError]]) -> List[Union[str, CheckError]]:
+        """Drop repeated diagnostics (same message at the same position), keeping order."""
+        seen = set()
+        unique: List[Union[str, CheckError]] = []
+        for error in errors:
+            key = (error.message, error.line, error.column) if isinstance(error, CheckError) else error
+            if key not in seen:
+                seen.add(key)
+                unique.append(error)
+        return unique
+
 
     def enter_scope(self, scope_name: str):
         """Enter a new scope (function/class)."""
         self.current_scope = scope_name
-        if scope_name not in self.final_variables:
-            self.final_variables[scope_name] = set()
+        self._scope_set = self.final_variables.setdefault(scope_name, set())
+        effective = self._effective_finals.get(scope_name)
+        if effective is None:
+            effective = self._scope_set | self._global_set
+            self._effective_finals[scope_name] = effective
+        self._effective_now = effective
 
     def exit_scope(self):
         """Exit current scope."""
-        self.current_scope = 'global'
+        self.enter_scope('global')
 
     def register_final(self, var_name: str):
         """Register a variable as final in current scope."""
-        if self.current_scope not in self.final_variables:
-            self.final_variables[self.current_scope] = set()
-        self.final_variables[self.current_scope].add(var_name)
+        self._scope_set.add(var_name)
+        if self._scope_set is self._global_set:
+            # Globals are visible from every scope seen so far.
+            for effective in self._effective_finals.values():
+                effective.add(var_name)
+        else:
+            self._effective_now.add(var_name)
 
     def check_assignment(self, var_name: str, line: int = 0, column: int = 0):
         """Check if assignment to variable is allowed."""
-        scope_vars = self.final_variables.get(self.current_scope, set())
-        global_vars = self.final_variables.get('global', set())
-
-        if var_name in scope_vars or var_name in global_vars:
+        if var_name in self._effective_now:
             self.errors.append(CheckError(
                 message=f"Cannot reassign final variable '{var_name}'",
                 line=line,
@@ -67,78 +112,36 @@ class FinalChecker(CompileTimeCheck):
             return False
         return True
 
-    def _visit_node(self, node):
-        """Visit a node and check for violations."""
-        if isinstance(node, FinalDeclaration):
-            if isinstance(node.target, IdentifierExpression):
-                self.register_final(node.target.name)
-
-        elif isinstance(node, ExpressionStatement):
-            self._visit_expression(node.expression)
-        elif isinstance(node, AssignmentExpression):
-            self._handle_assignment(node)
-        elif isinstance(node, FunctionDeclaration):
-            old_scope = self.current_scope
-            self.enter_scope(node.name)
-            for stmt in node.body:
-                self._visit_node(stmt)
-            self.current_scope = old_scope
-
-        elif isinstance(node, ClassDeclaration):
-            old_scope = self.current_scope
-            self.enter_scope(node.name)
-            self._check_final_method_overrides(node)
-            for member in node.body:
-                self._visit_node(member)
-            self.current_scope = old_scope
-
-        if hasattr(node, 'body') and isinstance(node.body, list):
-            for child in node.body:
-                self._visit_node(child)
-
-    def _visit_expression(self, expr: Optional[ASTNode]):
-        """Traverse expressions searching for assignments."""
-        if expr is None:
-            return
-
-        if isinstance(expr, AssignmentExpression):
-            self._handle_assignment(expr)
+    def _visit_final_declaration(self, node: FinalDeclaration):
+        if isinstance(node.target, IdentifierExpression):
+            self.register_final(node.target.name)
 
-        if is_dataclass(expr):
-            for field in fields(expr):
-                value = getattr(expr, field.name)
-                self._visit_expression_field(value)
+    def _visit_function(self, node: FunctionDeclaration):
+        self.scope_history.append(self.current_scope)
+        self.enter_scope(node.name)
 
-    def _visit_expression_field(self, value):
-        if isinstance(value, list):
-            for item in value:
-                if isinstance(item, ASTNode):
-                    self._visit_expression(item)
-        elif isinstance(value, ASTNode):
-            self._visit_expression(value)
+    def _visit_class(self, node: ClassDeclaration):
+        self._collect_class_metadata(node)
+        self.scope_history.append(self.current_scope)
+        self.enter_scope(node.name)
 
     def _handle_assignment(self, node: AssignmentExpression):
+        # Assignments nested in `node.value` are reached by the walk itself.
         if isinstance(node.target, IdentifierExpression):
             self.check_assignment(node.target.name, node.line, node.column)
-        self._visit_expression(node.value)
-
-    def _collect_class_metadata(self, nodes: List[ASTNode]):
-        """Collect class declarations and their final methods for later checks."""
-        for node in nodes:
-            if isinstance(node, ClassDeclaration):
-                self.class_nodes[node.name] = node
-
-                final_methods = {
-                    member.name: member
-                    for member in node.body
-                    if isinstance(member, FunctionDeclaration) and member.is_final
-                }
-                if final_methods:
-                    self.final_methods_by_class[node.name] = final_methods
-
-                self._collect_class_metadata(node.body)
-            elif hasattr(node, 'body') and isinstance(node.body, list):
-                self._collect_class_metadata(node.body)
+
+    def _collect_class_metadata(self, node: ClassDeclaration):
+        """Record a class and its final methods for the override checks run after the walk."""
+        self.class_nodes[node.name] = node
+        self.visited_classes.append(node)
+
+        final_methods = frozenset(
+            member.name
+            for member in node.body
+            if isinstance(member, FunctionDeclaration) and member.is_final
+        )
+        if final_methods:
+            self.final_methods_by_class[node.name] = final_methods
 
     def _check_final_method_overrides(self, class_node: ClassDeclaration):
         """Ensure subclasses do not override final methods declared in parents."""
@@ -146,10 +149,11 @@ class FinalChecker(CompileTimeCheck):
         if not inherited_final_methods:
             return
 
+        append_error = self.errors.append
         for member in class_node.body:
-            if isinstance(member, FunctionDeclaration) and member.name in inherited_final_methods:
+            if type(member) is FunctionDeclaration and member.name in inherited_final_methods:
                 base_name = inherited_final_methods[member.name]
-                self.errors.append(CheckError(
+                append_error(CheckError(
                     message=f"Class '{class_node.name}' cannot override final method '{member.name}' defined in '{base_name}'",
                     line=member.line,
                     column=member.column
@@ -158,32 +162,41 @@ class FinalChecker(CompileTimeCheck):
     def _collect_inherited_final_methods(self, class_node: ClassDeclaration) -> Dict[str, str]:
         """Gather final methods from all parent classes."""
         inherited: Dict[str, str] = {}
+        visited: Set[str] = set()
 
         for base_name in class_node.bases:
-            base_methods = self._collect_final_methods_from_base(base_name, set())
+            base_methods = self._collect_final_methods_from_base(base_name, visited)
             for method_name, origin in base_methods.items():
                 inherited.setdefault(method_name, origin)
 
         return inherited
 
     def _collect_final_methods_from_base(self, base_name: str, visited: Set[str]) -> Dict[str, str]:
-        """Collect final methods from the given base class and its parents."""
+        """Collect final methods from the given base class and its parents.
+
+        Results are memoized per class for the whole file. `visited` is shared by
+        the whole recursion and holds the classes on the current inheritance path
+        (added before recursing, removed after), so cycles terminate.
+        """
+        cached = self._inherited_cache.get(base_name)
+        if cached is not None:
+            return cached
         if base_name in visited:
             return {}
 
         visited.add(base_name)
         methods: Dict[str, str] = {
             method_name: base_name
-            for method_name in self.final_methods_by_class.get(base_name, {})
+            for method_name in self.final_methods_by_class.get(base_name, ())
         }
 
         base_node = self.class_nodes.get(base_name)
-        if not base_node:
-            return methods
-
-        for ancestor in base_node.bases:
-            ancestor_methods = self._collect_final_methods_from_base(ancestor, set(visited))
-            for method_name, origin in ancestor_methods.items():
-                methods.setdefault(method_name, origin)
-
+        if base_node:
+            for ancestor in base_node.bases:
+                ancestor_methods = self._collect_final_methods_from_base(ancestor, visited)
+                for method_name, origin in ancestor_methods.items():
+                    methods.setdefault(method_name, origin)
+
+        visited.remove(base_name)
+        self._inherited_cache[base_name] = methods
         return methods
@@ -11,7 +11,6 @@ typed as `T`. This checker validates those inferred bindings.
 
 from __future__ import annotations
 
-from dataclasses import fields, is_dataclass
 from typing import Dict, List, Optional
 
 from spice.compilation.checks.compile_time_check import CompileTimeCheck
@@ -22,6 +21,7 @@ from spice.parser.ast_nodes import (
     FunctionDeclaration,
     IdentifierExpression,
     LiteralExpression,
+    child_nodes,
 )
 
 
@@ -57,14 +57,14 @@ class GenericBoundChecker(CompileTimeCheck):
 
     def _iter_calls(self, node):
         """Yield every CallExpression anywhere in the tree."""
-        if is_dataclass(node):
-            if isinstance(node, CallExpression):
-                yield node
-            for f in fields(node):
-                yield from self._iter_calls(getattr(node, f.name))
-        elif isinstance(node, list):
-            for item in node:
-                yield from self._iter_calls(item)
+        stack = [node]
+        while stack:
+            current = stack.pop()
+            if type(current) is CallExpression:
+                yield current
+            children = child_nodes(current)
+            children.reverse()
+            stack.extend(children)
 
     def _check_constructor_call(self, call: CallExpression) -> None:
         callee = call.callee
@@ -3,21 +3,22 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Tuple
 
 from spice.compilation.checks.compile_time_check import CompileTimeCheck
+from spice.compilation.checks.composite_checker import CompositeChecker
 from spice.compilation.spicefile import SpiceFile
+from spice.utils.compat import DATACLASS_SLOTS
 from spice.parser.ast_nodes import (
     ClassDeclaration,
     FunctionDeclaration,
     InterfaceDeclaration,
     MethodSignature,
-    Module,
     Parameter,
 )
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class CheckError:
     """Structured error with position info."""
     message: str
@@ -35,40 +36,83 @@ class InterfaceChecker(CompileTimeCheck):
         self.errors: List[CheckError] = []
         self.interfaces: Dict[str, InterfaceDeclaration] = {}
         self.classes: Dict[str, ClassDeclaration] = {}
+        # id(method or signature node) -> parameter type tuple, built once per file
+        self._signatures: Dict[int, Tuple[str, ...]] = {}
 
     def check(self, file: SpiceFile) -> bool:
+        return CompositeChecker([self]).check(file)
+
+    def prepare(self, file: SpiceFile) -> None:
         self.errors = []
         self.interfaces = {}
         self.classes = {}
-
-        # First pass: collect all interfaces and classes
-        self._collect_declarations(file.ast)
-
-        # Second pass: validate interface implementations
+        self._signatures = {}
+
+    def visit(self, node) -> None:
+        """Collect interface and class declarations."""
+        node_type = type(node)
+        if node_type is InterfaceDeclaration:
+            self.interfaces[node.name] = node
+        elif node_type is ClassDeclaration:
+            self.classes[node.name] = node
+
+    def finish(self, file: SpiceFile) -> bool:
+        # Implementations are validated once every declaration was collected
         for class_name, class_decl in self.classes.items():
+            if not class_decl.interfaces:
+                continue
+            class_methods = self._collect_class_methods(class_decl)
             for interface_name in class_decl.interfaces:
-                self._check_implementation(class_decl, interface_name)
+                self._check_implementation(class_decl, interface_name, class_methods)
 
         return len(self.errors) == 0
 
-    def _collect_declarations(self, node: Module):
-        """Collect all interface and class declarations."""
-        for stmt in node.body:
-            if isinstance(stmt, InterfaceDeclaration):
-                self.interfaces[stmt.name] = stmt
-            elif isinstance(stmt, ClassDeclaration):
-                self.classes[stmt.name] = stmt
-
     def _get_param_signature(self, params: List[Parameter]) -> Tuple[str, ...]:
         """Get a tuple of parameter types for signature matching."""
         return tuple(p.type_annotation or "Any" for p in params)
 
     def _get_method_param_signature(self, method: FunctionDeclaration) -> Tuple[str, ...]:
         """Get parameter signature excluding 'self'."""
-        params = [p for p in method.params if p.name != 'self']
-        return self._get_param_signature(params)
+        sig = self._signatures.get(id(method))
+        if sig is None:
+            sig = self._get_param_signature([p for p in method.params if p.name != 'self'])
+            self._signatures[id(method)] = sig
+        return sig
+
+    def _get_interface_param_signature(self, method_sig: MethodSignature) -> Tuple[str, ...]:
+        """Get the parameter signature an interface method requires."""
+        sig = self._signatures.get(id(method_sig))
+        if sig is None:
+            sig = self._get_param_signature(method_sig.params)
+            self._signatures[id(method_sig)] = sig
+        return sig
+
+    @staticmethod
+    def _format_params(method_sig: MethodSignature) -> str:
+        """Render `name: type, ...` for error messages (only built once a check fails)."""
+        return ", ".join(f"{p.name}: {p.type_annotation}" for p in method_sig.params)
+
+    def _collect_class_methods(
+        self, class_decl: ClassDeclaration
+    ) -> Dict[str, Dict[Tuple[str, ...], FunctionDeclaration]]:
+        """Group a class's methods by name, shared by every interface it implements.
+
+        Each name maps to {param_signature: method}; the first method declared
+        with a given signature wins.
+        """
+        class_methods: Dict[str, Dict[Tuple[str, ...], FunctionDeclaration]] = {}
+        for member in class_decl.body:
+            if isinstance(member, FunctionDeclaration):
+                sig = self._get_method_param_signature(member)
+                class_methods.setdefault(member.name, {}).setdefault(sig, member)
+        return class_methods
 
-    def _check_implementation(self, class_decl: ClassDeclaration, interface_name: str):
+    def _check_implementation(
+        self,
+        class_decl: ClassDeclaration,
+        interface_name: str,
+        class_methods: Dict[str, Dict[Tuple[str, ...], FunctionDeclaration]],
+    ):
         """Check that a class properly implements an interface."""
         interface = self.interfaces.get(interface_name)
         if interface is None:
@@ -79,14 +123,6 @@ class InterfaceChecker(CompileTimeCheck):
             ))
             return
 
-        # Collect all methods from the class, grouped by name
-        # Each name maps to a list of (param_signature, method) tuples
-        class_methods: Dict[str, List[Tuple[Tuple[str, ...], FunctionDeclaration]]] = {}
-        for member in class_decl.body:
-            if isinstance(member, FunctionDeclaration):
-                sig = self._get_method_param_signature(member)
-                class_methods.setdefault(member.name, []).append((sig, member))
-
         # Check each interface method signature has a matching implementation
         for method_sig in interface.methods:
             self._check_method_implementation(
@@ -98,15 +134,14 @@ class InterfaceChecker(CompileTimeCheck):
         class_decl: ClassDeclaration,
         interface_name: str,
         method_sig: MethodSignature,
-        class_methods: Dict[str, List[Tuple[Tuple[str, ...], FunctionDeclaration]]],
+        class_methods: Dict[str, Dict[Tuple[str, ...], FunctionDeclaration]],
     ):
         """Check that a specific interface method signature is implemented correctly."""
         method_name = method_sig.name
-        expected_param_sig = self._get_param_signature(method_sig.params)
-        expected_return = method_sig.return_type
 
         # Check if any method with this name exists
-        if method_name not in class_methods:
+        overloads = class_methods.get(method_name)
+        if overloads is None:
             self.errors.append(CheckError(
                 message=f"Class '{class_decl.name}' does not implement method '{method_name}' "
                         f"required by interface '{interface_name}'",
@@ -116,17 +151,11 @@ class InterfaceChecker(CompileTimeCheck):
             return
 
         # Find a method with matching parameter signature
-        matching_impl: Optional[FunctionDeclaration] = None
-        for param_sig, impl in class_methods[method_name]:
-            if param_sig == expected_param_sig:
-                matching_impl = impl
-                break
+        matching_impl = overloads.get(self._get_interface_param_signature(method_sig))
 
         if matching_impl is None:
             # No method with matching params - format expected signature
-            param_str = ", ".join(
-                f"{p.name}: {p.type_annotation}" for p in method_sig.params
-            )
+            param_str = self._format_params(method_sig)
             self.errors.append(CheckError(
                 message=f"Class '{class_decl.name}' does not implement method "
                         f"'{method_name}({param_str})' required by interface '{interface_name}'",
@@ -137,10 +166,9 @@ class InterfaceChecker(CompileTimeCheck):
 
         # Check return type matches
         actual_return = matching_impl.return_type
+        expected_return = method_sig.return_type
         if expected_return != actual_return:
-            param_str = ", ".join(
-                f"{p.name}: {p.type_annotation}" for p in method_sig.params
-            )
+            param_str = self._format_params(method_sig)
             self.errors.append(CheckError(
                 message=f"Method '{class_decl.name}.{method_name}({param_str})' has return type "
                         f"'{actual_return}' but interface '{interface_name}' expects '{expected_return}'",
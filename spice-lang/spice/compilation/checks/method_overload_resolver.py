@@ -6,7 +6,7 @@ from typing import Dict, List, Optional, Union
 from spice.compilation.checks.compile_time_check import CompileTimeCheck
 from spice.compilation.checks.interface_checker import CheckError
 from spice.compilation.spicefile import SpiceFile
-from spice.parser.ast_nodes import ClassDeclaration, FunctionDeclaration, Parameter, Module
+from spice.parser.ast_nodes import BODY_CONTAINER_TYPES, ClassDeclaration, FunctionDeclaration, Parameter, Module
 
 
 class MethodOverloadResolver(CompileTimeCheck):
@@ -40,9 +40,8 @@ class MethodOverloadResolver(CompileTimeCheck):
         if isinstance(node, ClassDeclaration):
             self._process_class(node, file)
 
-        body = getattr(node, "body", None)
-        if isinstance(body, list):
-            for child in body:
+        if type(node) in BODY_CONTAINER_TYPES and node.body:
+            for child in node.body:
                 self._process_node(child, file)
 
     def _process_class(self, class_node: ClassDeclaration, file: SpiceFile):
@@ -82,7 +81,7 @@ class MethodOverloadResolver(CompileTimeCheck):
                 seen_signatures.add(signature_key)
                 decorator = self._build_dispatch_decorator(type_names)
                 if decorator not in method.decorators:
-                    method.decorators.append(decorator)
+                    method.decorators = [*method.decorators, decorator]
                 signature_map[signature_key] = decorator
 
     def _build_dispatch_decorator(self, type_names: List[str]) -> str:
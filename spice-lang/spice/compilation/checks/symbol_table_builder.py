@@ -1,10 +1,21 @@
 from __future__ import annotations
 
-from typing import List, Optional
+import sys
+from typing import Any, Callable, Dict, List, Optional
 
 from spice.compilation.checks.compile_time_check import CompileTimeCheck
+from spice.compilation.checks.composite_checker import CompositeChecker
 from spice.compilation.spicefile import SpiceFile
-from spice.compilation.symbol_table import SymbolTable, VariableSymbol, FunctionSymbol, ClassSymbol, InterfaceSymbol
+from spice.compilation.symbol_table import (
+    GLOBAL_SCOPE,
+    ClassSymbol,
+    FunctionSymbol,
+    InterfaceSymbol,
+    ScopeKey,
+    ScopeSymbol,
+    SymbolTable,
+    VariableSymbol,
+)
 from spice.parser.ast_nodes import (
     AssignmentExpression,
     ClassDeclaration,
@@ -16,7 +27,6 @@ from spice.parser.ast_nodes import (
     IdentifierExpression,
     InterfaceDeclaration,
     LiteralExpression,
-    Module,
     CallExpression,
 )
 
@@ -25,158 +35,135 @@ class SymbolTableBuilder(CompileTimeCheck):
     """Collect declarations and store them on the SpiceFile for later checks"""
 
     def __init__(self) -> None:
-        self.symbol_table: Optional[SymbolTable] = None
-        self.scope_stack: List[str] = []
+        self.symbol_table: SymbolTable = SymbolTable()
+        self.scope_stack: List[ScopeKey] = []
+        # Scope objects parallel to `scope_stack`; the top one is cached separately
+        self._scope_objects: List[ScopeSymbol] = []
+        self._current_scope_obj: ScopeSymbol = self.symbol_table.scopes[GLOBAL_SCOPE]
+        # id(method) -> owning class symbol, filled when the class is visited
+        self._method_owners: Dict[int, ClassSymbol] = {}
+        self._dispatch: Dict[type, Callable[[Any], None]] = {
+            ClassDeclaration: self._visit_class,
+            DataClassDeclaration: self._visit_data_class,
+            EnumDeclaration: self._visit_enum,
+            InterfaceDeclaration: self._visit_interface,
+            FunctionDeclaration: self._visit_function,
+            ExpressionStatement: self._visit_expression_statement,
+            FinalDeclaration: self._register_final_declaration,
+        }
 
     def check(self, file: SpiceFile) -> bool:
+        return CompositeChecker([self]).check(file)
+
+    def prepare(self, file: SpiceFile) -> None:
         self.symbol_table = SymbolTable()
-        self.scope_stack = ["global"]
-        self._visit_module(file.ast)
+        self.scope_stack = [GLOBAL_SCOPE]
+        self._current_scope_obj = self.symbol_table.scopes[GLOBAL_SCOPE]
+        self._scope_objects = [self._current_scope_obj]
+        self._method_owners = {}
+
+    def finish(self, file: SpiceFile) -> bool:
         file.symbol_table = self.symbol_table
         return True
 
-    def _current_scope(self) -> str:
+    def visit(self, node) -> None:
+        handler = self._dispatch.get(type(node))
+        if handler is not None:
+            handler(node)
+
+    def leave(self, node) -> None:
+        # Every scope-opening node pushed exactly one scope in `visit`.
+        self._pop_scope()
+
+    def _current_scope(self) -> ScopeKey:
         return self.scope_stack[-1]
 
-    def _push_scope(self, scope_name: str):
+    def _push_scope(self, name: str):
+        """Enter the scope of the declaration `name`, nested in the current one."""
         parent = self._current_scope()
-        self.symbol_table.ensure_scope(scope_name, parent)
-        self.scope_stack.append(scope_name)
+        key = parent + (sys.intern(name),)
+        scope = self.symbol_table.ensure_scope(key, parent)
+        self.scope_stack.append(key)
+        self._scope_objects.append(scope)
+        self._current_scope_obj = scope
 
     def _pop_scope(self):
         if len(self.scope_stack) > 1:
             self.scope_stack.pop()
+            self._scope_objects.pop()
+            self._current_scope_obj = self._scope_objects[-1]
 
     def _add_variable(self, name: str, type_annotation: Optional[str], node):
-        scope = self.symbol_table.scopes[self._current_scope()]
-        scope.variables[name] = VariableSymbol(
+        # Symbol-table keys are interned here rather than trusting the lexer's
+        # interning: ASTs unpickled from the build cache hold fresh copies.
+        name = sys.intern(name)
+        self._current_scope_obj.variables[name] = VariableSymbol(
             name=name,
-            type_annotation=type_annotation,
+            type_annotation=sys.intern(type_annotation) if type_annotation else type_annotation,
             node=node,
         )
 
-    def _add_function(self, func: FunctionDeclaration, owner_scope: Optional[str] = None):
-        scope_name = owner_scope or self._current_scope()
-        scope = self.symbol_table.scopes.get(scope_name)
-        if scope is None:
-            parent = self._current_scope() if owner_scope is None else owner_scope
-            scope = self.symbol_table.ensure_scope(scope_name, parent)
+    def _add_function(self, func: FunctionDeclaration):
+        """Register `func` in the current scope (the class scope, for methods)."""
+        scope = self._current_scope_obj
+        name = sys.intern(func.name)
         func_symbol = FunctionSymbol(
-            name=func.name,
+            name=name,
             params=func.params,
             return_type=func.return_type,
             node=func,
-            scope=scope_name,
+            scope=scope.name,
         )
-        scope.functions.setdefault(func.name, []).append(func_symbol)
+        scope.functions.setdefault(name, []).append(func_symbol)
         return func_symbol
 
-    def _visit_module(self, node: Module):
-        for stmt in node.body:
-            self._visit_node(stmt)
-
-    def _visit_node(self, node):
-        if isinstance(node, ClassDeclaration):
-            self._visit_class(node)
-        elif isinstance(node, DataClassDeclaration):
-            self._visit_data_class(node)
-        elif isinstance(node, EnumDeclaration):
-            self._visit_enum(node)
-        elif isinstance(node, InterfaceDeclaration):
-            self._visit_interface(node)
-        elif isinstance(node, FunctionDeclaration):
-            self._visit_function(node)
-        elif isinstance(node, ExpressionStatement):
-            self._visit_expression_statement(node)
-        elif isinstance(node, FinalDeclaration):
-            self._register_final_declaration(node)
-        elif hasattr(node, "body") and isinstance(node.body, list):
-            for child in node.body:
-                self._visit_node(child)
-
     def _visit_interface(self, node: InterfaceDeclaration):
-        interface_symbol = InterfaceSymbol(name=node.name, node=node, scope=self._current_scope())
-        self.symbol_table.interfaces[node.name] = interface_symbol
+        name = sys.intern(node.name)
+        interface_symbol = InterfaceSymbol(name=name, node=node, scope=self._current_scope())
+        self.symbol_table.interfaces[name] = interface_symbol
+
+    def _enter_class(self, node, class_symbol: ClassSymbol):
+        """Register a class-like symbol, open its scope and claim its methods."""
+        self.symbol_table.classes[class_symbol.name] = class_symbol
+        self._push_scope(class_symbol.name)
+        for member in node.body:
+            if isinstance(member, FunctionDeclaration):
+                self._method_owners[id(member)] = class_symbol
 
     def _visit_data_class(self, node: DataClassDeclaration):
         """Visit data class declaration - treat like a regular class."""
-        class_symbol = ClassSymbol(name=node.name, node=node, scope=self._current_scope())
-        self.symbol_table.classes[node.name] = class_symbol
-        class_scope = node.name
-        self._push_scope(class_scope)
+        class_symbol = ClassSymbol(name=sys.intern(node.name), node=node, scope=self._current_scope())
+        self._enter_class(node, class_symbol)
 
         # Register fields as variables in the class scope
         for field in node.fields:
             self._add_variable(field.name, field.type_annotation, field)
 
-        for member in node.body:
-            if isinstance(member, FunctionDeclaration):
-                method_symbol = self._add_function(member, owner_scope=class_scope)
-                class_symbol.methods.setdefault(member.name, []).append(method_symbol)
-                self._visit_function(member, owner_scope=class_scope)
-            else:
-                self._visit_node(member)
-        self._pop_scope()
-
     def _visit_enum(self, node: EnumDeclaration):
         """Visit enum declaration - treat like a class."""
-        class_symbol = ClassSymbol(name=node.name, node=node, scope=self._current_scope())
-        self.symbol_table.classes[node.name] = class_symbol
-        class_scope = node.name
-        self._push_scope(class_scope)
-
-        # Visit methods if any
-        for member in node.body:
-            if isinstance(member, FunctionDeclaration):
-                method_symbol = self._add_function(member, owner_scope=class_scope)
-                class_symbol.methods.setdefault(member.name, []).append(method_symbol)
-                self._visit_function(member, owner_scope=class_scope)
-            else:
-                self._visit_node(member)
-
-        self._pop_scope()
+        class_symbol = ClassSymbol(name=sys.intern(node.name), node=node, scope=self._current_scope())
+        self._enter_class(node, class_symbol)
 
     def _visit_class(self, node: ClassDeclaration):
-        type_param_names = [tp.name for tp in node.type_parameters]
+        type_param_names = [sys.intern(tp.name) for tp in node.type_parameters]
         class_symbol = ClassSymbol(
-            name=node.name,
+            name=sys.intern(node.name),
             node=node,
             scope=self._current_scope(),
             type_parameters=type_param_names
         )
-        self.symbol_table.classes[node.name] = class_symbol
-        class_scope = node.name
-        self._push_scope(class_scope)
-        for member in node.body:
-            if isinstance(member, FunctionDeclaration):
-                method_symbol = self._add_function(member, owner_scope=class_scope)
-                class_symbol.methods.setdefault(member.name, []).append(method_symbol)
-                self._visit_function(member, owner_scope=class_scope)
-            else:
-                self._visit_node(member)
-        self._pop_scope()
-
-    def _function_scope_name(self, node: FunctionDeclaration, owner_scope: Optional[str]) -> str:
-        if owner_scope:
-            return f"{owner_scope}.{node.name}"
-        return node.name
-
-    def _visit_function(self, node: FunctionDeclaration, owner_scope: Optional[str] = None):
-        if owner_scope is None:
-            self._add_function(node, owner_scope)
+        self._enter_class(node, class_symbol)
 
-        scope_name = self._function_scope_name(node, owner_scope)
-        self._push_scope(scope_name)
+    def _visit_function(self, node: FunctionDeclaration):
+        owner = self._method_owners.pop(id(node), None)
+        method_symbol = self._add_function(node)
+        if owner is not None:
+            owner.methods.setdefault(method_symbol.name, []).append(method_symbol)
 
+        self._push_scope(method_symbol.name)
         for param in node.params:
             self._add_variable(param.name, param.type_annotation, param)
 
-        if node.body:
-            for stmt in node.body:
-                self._visit_node(stmt)
-
-        self._pop_scope()
-
     def _visit_expression_statement(self, node: ExpressionStatement):
         expr = node.expression
         if isinstance(expr, AssignmentExpression):
@@ -198,7 +185,8 @@ class SymbolTableBuilder(CompileTimeCheck):
         inferred_type = None
         if isinstance(node.value, CallExpression):
             inferred_type = self._infer_call_type(node.value)
-        elif isinstance(node.value, LiteralExpression):
+        elif isinstance(node.value, LiteralExpression) and not node.value.folded:
+            # Folded literals (`1 + 2`) count as the expression they replaced
             inferred_type = self._literal_to_type(node.value)
 
         if inferred_type:
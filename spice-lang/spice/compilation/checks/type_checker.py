@@ -1,92 +1,183 @@
 from __future__ import annotations
 
-from typing import List, Optional, Tuple, Union
+import sys
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union, cast
 
 from spice.compilation.checks.compile_time_check import CompileTimeCheck
 from spice.compilation.checks.interface_checker import CheckError
 from spice.compilation.spicefile import SpiceFile
 from spice.compilation.symbol_table import (
+    GLOBAL_SCOPE,
+    ScopeSymbol,
     SymbolTable,
     VariableSymbol,
     FunctionSymbol,
     ClassSymbol,
 )
 from spice.parser.ast_nodes import (
+    BODY_CONTAINER_TYPES,
     AssignmentExpression,
     AttributeExpression,
     CallExpression,
     ClassDeclaration,
+    DataClassDeclaration,
+    EnumDeclaration,
     Expression,
     ExpressionStatement,
-    FinalDeclaration,
     FunctionDeclaration,
     IdentifierExpression,
     LiteralExpression,
     Module,
 )
 
+# Overloads grouped by arity, and fully-annotated signature -> first overload.
+OverloadIndex = Tuple[Dict[int, List[FunctionSymbol]], Dict[Tuple[str, ...], FunctionSymbol]]
+
+# Cache-miss marker (None is a valid cached result).
+_MISSING = object()
+
+# Interned literal types, so they compare against annotations by identity.
+_INT = sys.intern("int")
+_FLOAT = sys.intern("float")
+_LITERAL_TYPES = {
+    "string": sys.intern("str"),
+    "boolean": sys.intern("bool"),
+}
+
+# Declarations that open a scope of their own while their body is checked.
+_SCOPE_TYPES = frozenset({ClassDeclaration, DataClassDeclaration, EnumDeclaration, FunctionDeclaration})
+
+# Walk-stack entry closing the innermost scope.
+_POP_SCOPE = object()
+
+# Flat check program op codes (see _flatten_program).
+_OP_ENTER_SCOPE, _OP_EXIT_SCOPE, _OP_CHECK_STATEMENT = range(3)
+
+
+def _needs_check(stmt: ExpressionStatement) -> bool:
+    """Only calls and unannotated assignments have anything to type check."""
+    expr = stmt.expression
+    if isinstance(expr, CallExpression):
+        return True
+    return isinstance(expr, AssignmentExpression) and expr.type_annotation is None
+
+
+def _flatten_program(module: Module) -> List[Tuple[int, Any]]:
+    """Flatten `module` into the preorder sequence of scope changes and checkable statements.
+
+    Statements with nothing to check are dropped, and so are scopes that end
+    up empty, so running the program touches only the nodes that matter.
+    """
+    program: List[Tuple[int, Any]] = []
+    stack: List[Any] = list(reversed(module.body))
+    while stack:
+        current = stack.pop()
+        if current is _POP_SCOPE:
+            if program[-1][0] == _OP_ENTER_SCOPE:
+                program.pop()
+            else:
+                program.append((_OP_EXIT_SCOPE, None))
+            continue
+        kind = type(current)
+        if kind is ExpressionStatement:
+            if _needs_check(current):
+                program.append((_OP_CHECK_STATEMENT, current))
+        elif kind in _SCOPE_TYPES:
+            program.append((_OP_ENTER_SCOPE, current.name))
+            stack.append(_POP_SCOPE)
+            if current.body:
+                stack.extend(reversed(current.body))
+        elif kind in BODY_CONTAINER_TYPES and current.body:
+            stack.extend(reversed(current.body))
+    return program
+
 
 class TypeChecker(CompileTimeCheck):
     """Symbol Table parser for illegal type calls"""
 
     def __init__(self) -> None:
         self.errors: List[Union[str, CheckError]] = []
-        self.table: Optional[SymbolTable] = None
-        self.scope_stack: List[str] = []
-        self._current_node = None  # Track current node for line/column info
+        self.table: SymbolTable = SymbolTable()
+        # Exact scope of each open declaration (None when the table has no such scope)
+        self.scope_stack: List[Optional[ScopeSymbol]] = []
+        # Resolved scopes parallel to `scope_stack`, and id(scope) -> parent scope object,
+        # so variable lookups chase references instead of re-hashing scope keys.
+        self._scope_objects: List[Optional[ScopeSymbol]] = []
+        self._parent_scopes: Dict[int, Optional[ScopeSymbol]] = {}
+        self._current_node: Optional[ExpressionStatement] = None  # Track current node for line/column info
         # {var_name: {type_param: concrete_type}}
         self._generic_bindings: dict[str, dict[str, str]] = {}
+        # Per-check memo tables; the symbol table doesn't change while checking.
+        # Keyed by id() of the resolved scope.
+        self._type_cache: dict[tuple[int, int], Optional[str]] = {}
+        self._variable_cache: dict[tuple[str, int], Optional[VariableSymbol]] = {}
+        # id(overload list) -> (overloads by arity, exact signature -> overload)
+        self._overload_index: dict[int, OverloadIndex] = {}
+        # id(scope) -> names resolving to an annotated variable from that scope
+        self._annotated_names: dict[int, frozenset[str]] = {}
+        self._class_names: frozenset[str] = frozenset()
+        # Result type of calling a bare name: a class constructs itself, a global
+        # function returns its first declared return type.
+        self._name_call_types: dict[str, str] = {}
+        # class name -> {attribute: annotation}, from each class's own scope
+        self._class_attr_types: dict[str, dict[str, Optional[str]]] = {}
+        self._infer_dispatch: Dict[type, Callable[[Any], Optional[str]]] = {
+            IdentifierExpression: self._infer_identifier_type,
+            LiteralExpression: self._literal_to_type,
+            CallExpression: self._infer_call_return,
+            AttributeExpression: self._infer_attribute_type,
+        }
 
     def check(self, file: SpiceFile) -> bool:
-        if not getattr(file, "symbol_table", None):
+        table = getattr(file, "symbol_table", None)
+        if not table:
             return True
 
-        self.table = file.symbol_table
+        self.table = table
         self.errors = []
-        self.scope_stack = ["global"]
+        scopes = self.table.scopes
+        self.scope_stack = [scopes.get(GLOBAL_SCOPE)]
+        self._scope_objects = [scopes.get(GLOBAL_SCOPE)]
+        self._parent_scopes = {
+            id(scope): scopes.get(scope.parent) if scope.parent is not None else None
+            for scope in scopes.values()
+        }
+        self._type_cache = {}
+        self._variable_cache = {}
+        self._overload_index = {}
+        self._annotated_names = {}
+        self._class_names = frozenset(self.table.classes)
+        self._name_call_types = self._build_name_call_types()
+        self._class_attr_types = self._build_class_attr_types()
         self._visit_module(file.ast)
         return not self.errors
 
-    def _current_scope(self) -> str:
-        return self.scope_stack[-1]
+    def _current_scope(self) -> int:
+        """Identity of the scope names currently resolve through (a cache key)."""
+        return id(self._scope_objects[-1])
 
     def _push_scope(self, name: str):
-        self.scope_stack.append(name)
+        """Enter the scope of the declaration `name`, a child of the current one."""
+        parent = self.scope_stack[-1]
+        scope = parent.children.get(name) if parent is not None else None
+        self.scope_stack.append(scope)
+        # Unknown scopes resolve names through the enclosing one.
+        self._scope_objects.append(scope or self._scope_objects[-1])
 
     def _pop_scope(self):
         if len(self.scope_stack) > 1:
             self.scope_stack.pop()
+            self._scope_objects.pop()
 
     def _visit_module(self, node: Module):
-        for stmt in node.body:
-            self._visit_node(stmt)
-
-    def _visit_node(self, node):
-        if isinstance(node, ClassDeclaration):
-            self._visit_class(node)
-        elif isinstance(node, FunctionDeclaration):
-            self._visit_function(node)
-        elif isinstance(node, ExpressionStatement):
-            self._visit_expression_statement(node)
-        elif isinstance(node, FinalDeclaration):
-            pass
-        elif hasattr(node, "body") and isinstance(node.body, list):
-            for child in node.body:
-                self._visit_node(child)
-
-    def _visit_class(self, node: ClassDeclaration):
-        self._push_scope(node.name)
-        for member in node.body:
-            self._visit_node(member)
-        self._pop_scope()
-
-    def _visit_function(self, node: FunctionDeclaration):
-        scope_name = node.name if self._current_scope() == "global" else f"{self._current_scope()}.{node.name}"
-        self._push_scope(scope_name)
-        if node.body:
-            for stmt in node.body:
-                self._visit_node(stmt)
-        self._pop_scope()
+        """Check every statement in source order by running the flattened program."""
+        for op, payload in _flatten_program(node):
+            if op == _OP_CHECK_STATEMENT:
+                self._visit_expression_statement(payload)
+            elif op == _OP_ENTER_SCOPE:
+                self._push_scope(payload)
+            else:
+                self._pop_scope()
 
     def _visit_expression_statement(self, node: ExpressionStatement):
         self._current_node = node
@@ -108,43 +199,85 @@ class TypeChecker(CompileTimeCheck):
         if not callee_info:
             return
 
-        functions, owner, var_name = callee_info
-        arg_types = [self._infer_expression_type(arg) for arg in node.arguments]
-
+        functions, class_symbol, var_name = callee_info
         if not functions:
             return
 
+        # Arity is checked before any argument is inferred; the failing path
+        # only infers them to describe the call in the error.
+        owner = class_symbol.name if class_symbol else None
+        by_arity, by_signature = self._get_overload_index(functions)
+        candidates = by_arity.get(len(node.arguments))
+        if candidates is None:
+            arg_types = [self._infer_expression_type(arg) for arg in node.arguments]
+            self._report_no_overload(functions, owner, arg_types)
+            return
+
+        arg_types = [self._infer_expression_type(arg) for arg in node.arguments]
+        if None in arg_types:
+            # An uninferable argument can't match any annotated parameter.
+            self._report_no_overload(functions, owner, arg_types)
+            return
+
         # Get type parameters and existing bindings for generic classes
         type_params = []
         existing_bindings = {}
-        if owner and owner in self.table.classes:
-            class_symbol = self.table.classes[owner]
+        if class_symbol:
             type_params = class_symbol.type_parameters
             if var_name and var_name in self._generic_bindings:
                 existing_bindings = self._generic_bindings[var_name]
 
-        for func in functions:
+        if not type_params and tuple(arg_types) in by_signature:
+            return
+
+        for func in candidates:
             match_result = self._arguments_match_generic(
                 arg_types, func.params, type_params, existing_bindings
             )
             if match_result is not None:
                 # Update bindings if we inferred new types
                 if var_name and match_result:
-                    if var_name not in self._generic_bindings:
-                        self._generic_bindings[var_name] = {}
-                    self._generic_bindings[var_name].update(match_result)
+                    self._generic_bindings.setdefault(var_name, {}).update(match_result)
                 return
 
+        self._report_no_overload(functions, owner, arg_types)
+
+    def _get_overload_index(self, functions: List[FunctionSymbol]) -> OverloadIndex:
+        """Group an overload set by arity and by fully-annotated signature (memoized)."""
+        index = self._overload_index.get(id(functions))
+        if index is None:
+            by_arity: Dict[int, List[FunctionSymbol]] = {}
+            by_signature: Dict[Tuple[str, ...], FunctionSymbol] = {}
+            for func in functions:
+                by_arity.setdefault(len(func.params), []).append(func)
+                signature = tuple(param.type_annotation for param in func.params)
+                if None not in signature:
+                    by_signature.setdefault(cast(Tuple[str, ...], signature), func)
+            index = self._overload_index[id(functions)] = (by_arity, by_signature)
+        return index
+
+    def _report_no_overload(self, functions: List[FunctionSymbol], owner: Optional[str], arg_types: List[Optional[str]]):
         arg_desc = ", ".join(str(t) for t in arg_types) if arg_types else ""
         owner_desc = f"{owner}." if owner else ""
-        line = getattr(self._current_node, "line", 0) if self._current_node else 0
-        column = getattr(self._current_node, "column", 0) if self._current_node else 0
+        line, column = self._error_location()
         self.errors.append(CheckError(
             message=f"No overload of {owner_desc}{functions[0].name} matches argument types ({arg_desc})",
             line=line,
             column=column
         ))
 
+    def _error_location(self) -> Tuple[int, int]:
+        """(line, column) of the statement being checked.
+
+        Statements carry no position of their own; of the expressions they wrap
+        only assignments record one, so anything else reports (0, 0).
+        """
+        node = self._current_node
+        expr = node.expression if node is not None else None
+        if isinstance(expr, AssignmentExpression):
+            return expr.line, expr.column
+        return 0, 0
+
     def _arguments_match(self, arg_types: List[Optional[str]], params) -> bool:
         if len(arg_types) != len(params):
             return False
@@ -163,15 +296,13 @@ class TypeChecker(CompileTimeCheck):
         """
         if arg_type == param_type:
             return True
-        if self.table is None:
-            return False
         return param_type in self.table.ancestors(arg_type)
 
-    def _resolve_callee(self, node: CallExpression) -> Optional[Tuple[List[FunctionSymbol], Optional[str], Optional[str]]]:
-        """Resolve callee to (functions, owner_type, variable_name)."""
+    def _resolve_callee(self, node: CallExpression) -> Optional[Tuple[List[FunctionSymbol], Optional[ClassSymbol], Optional[str]]]:
+        """Resolve callee to (functions, owner_class, variable_name)."""
         callee = node.callee
         if isinstance(callee, IdentifierExpression):
-            scope = self.table.scopes.get("global")
+            scope = self.table.scopes.get(GLOBAL_SCOPE)
             if scope:
                 funcs = scope.functions.get(callee.name, [])
                 return funcs, None, None
@@ -183,7 +314,7 @@ class TypeChecker(CompileTimeCheck):
             if obj_type and obj_type in self.table.classes:
                 class_symbol = self.table.classes[obj_type]
                 funcs = class_symbol.methods.get(callee.attribute, [])
-                return funcs, obj_type, var_name
+                return funcs, class_symbol, var_name
         return None
 
     def _arguments_match_generic(
@@ -199,9 +330,12 @@ class TypeChecker(CompileTimeCheck):
         """
         if len(arg_types) != len(params):
             return None
+        if not type_params:
+            # Nothing to infer: plain assignability decides.
+            return {} if self._arguments_match(arg_types, params) else None
 
-        # Start with existing bindings
-        inferred = dict(existing_bindings)
+        # Only bindings inferred by this call; existing ones are read in place
+        new_bindings: dict[str, str] = {}
 
         for arg_type, param in zip(arg_types, params):
             param_type = param.type_annotation
@@ -210,38 +344,35 @@ class TypeChecker(CompileTimeCheck):
 
             if param_type in type_params:
                 # It's a generic type parameter
-                if param_type in inferred:
-                    # Already have a binding - check it matches
-                    if inferred[param_type] != arg_type:
-                        return None
-                else:
+                bound = existing_bindings.get(param_type) or new_bindings.get(param_type)
+                if bound is None:
                     # Infer the type from the argument
-                    inferred[param_type] = arg_type
+                    new_bindings[param_type] = arg_type
+                elif bound != arg_type:
+                    # Already have a binding and it doesn't match
+                    return None
             else:
                 # Regular type - arg must be the param type or a subtype of it.
                 if not self._is_assignable(arg_type, param_type):
                     return None
 
-        # Return only the newly inferred bindings (not existing ones)
-        new_bindings = {k: v for k, v in inferred.items() if k not in existing_bindings}
-        return new_bindings if new_bindings else {}
+        return new_bindings
 
     def _enforce_assignment_annotation(self, node: AssignmentExpression):
         if not isinstance(node.target, IdentifierExpression):
             return
 
-        symbol = self._lookup_variable(node.target.name)
-        if symbol and symbol.type_annotation:
+        if node.target.name in self._annotated_in(self._scope_objects[-1]):
             return
 
-        if isinstance(node.value, LiteralExpression):
+        # A literal the parser folded (`1 + 2`) was written as an expression
+        if isinstance(node.value, LiteralExpression) and not node.value.folded:
             return
 
         if isinstance(node.value, CallExpression) and self._is_constructor_call(node.value):
             return
 
-        line = getattr(self._current_node, "line", 0) if self._current_node else 0
-        column = getattr(self._current_node, "column", 0) if self._current_node else 0
+        line, column = self._error_location()
         self.errors.append(CheckError(
             message=f"Variable '{node.target.name}' must declare a type annotation when assigned from non-literal expression",
             line=line,
@@ -251,47 +382,91 @@ class TypeChecker(CompileTimeCheck):
     def _is_constructor_call(self, call: CallExpression) -> bool:
         callee = call.callee
         if isinstance(callee, IdentifierExpression):
-            return callee.name in self.table.classes
+            return callee.name in self._class_names
         return False
 
     def _infer_expression_type(self, expr: Expression) -> Optional[str]:
-        if isinstance(expr, IdentifierExpression):
-            symbol = self._lookup_variable(expr.name)
-            if symbol:
-                return symbol.type_annotation
-        elif isinstance(expr, LiteralExpression):
-            return self._literal_to_type(expr)
-        elif isinstance(expr, CallExpression):
-            return self._infer_call_return(expr)
-        elif isinstance(expr, AttributeExpression):
-            return self._infer_attribute_type(expr)
-        return None
+        key = (id(expr), self._current_scope())
+        cached = self._type_cache.get(key, _MISSING)
+        if cached is not _MISSING:
+            return cast(Optional[str], cached)
+        inferred = self._compute_expression_type(expr)
+        self._type_cache[key] = inferred
+        return inferred
+
+    def _compute_expression_type(self, expr: Expression) -> Optional[str]:
+        handler = self._infer_dispatch.get(type(expr))
+        return handler(expr) if handler is not None else None
+
+    def _infer_identifier_type(self, expr: IdentifierExpression) -> Optional[str]:
+        symbol = self._lookup_variable(expr.name)
+        return symbol.type_annotation if symbol else None
 
     def _lookup_variable(self, name: str) -> Optional[VariableSymbol]:
-        scope_name = self._current_scope()
-        while scope_name:
-            scope = self.table.scopes.get(scope_name)
-            if scope and name in scope.variables:
-                return scope.variables[name]
-            scope_name = scope.parent if scope else None
+        key = (name, self._current_scope())
+        cached = self._variable_cache.get(key, _MISSING)
+        if cached is not _MISSING:
+            return cast(Optional[VariableSymbol], cached)
+        symbol = self._find_variable(name)
+        self._variable_cache[key] = symbol
+        return symbol
+
+    def _find_variable(self, name: str) -> Optional[VariableSymbol]:
+        """Walk from the current scope outwards through the parent references."""
+        parents = self._parent_scopes
+        scope = self._scope_objects[-1]
+        while scope is not None:
+            symbol = scope.variables.get(name)
+            if symbol is not None:
+                return symbol
+            scope = parents.get(id(scope))
         return None
 
+    def _annotated_in(self, scope: Optional[ScopeSymbol]) -> frozenset[str]:
+        """Names that resolve to an annotated variable from `scope` (memoized)."""
+        if scope is None:
+            return frozenset()
+        names = self._annotated_names.get(id(scope))
+        if names is None:
+            # Local declarations shadow the enclosing scopes, annotated or not.
+            inherited = self._annotated_in(self._parent_scopes.get(id(scope))).difference(scope.variables)
+            names = inherited.union(name for name, symbol in scope.variables.items() if symbol.type_annotation)
+            self._annotated_names[id(scope)] = names
+        return names
+
+    def _build_name_call_types(self) -> dict[str, str]:
+        call_types: dict[str, str] = {}
+        scope = self.table.scopes.get(GLOBAL_SCOPE)
+        if scope:
+            for name, funcs in scope.functions.items():
+                for func in funcs:
+                    if func.return_type:
+                        call_types[name] = func.return_type
+                        break
+        # Constructors win over same-named functions.
+        for name in self._class_names:
+            call_types[name] = name
+        return call_types
+
+    def _build_class_attr_types(self) -> dict[str, dict[str, Optional[str]]]:
+        scopes = self.table.scopes
+        attr_types: dict[str, dict[str, Optional[str]]] = {}
+        for name, class_symbol in self.table.classes.items():
+            vars_scope = scopes.get(class_symbol.scope + (class_symbol.name,))
+            if vars_scope:
+                attr_types[name] = {
+                    attr: symbol.type_annotation for attr, symbol in vars_scope.variables.items()
+                }
+        return attr_types
+
     def _infer_call_return(self, call: CallExpression) -> Optional[str]:
         callee = call.callee
         if isinstance(callee, IdentifierExpression):
-            if callee.name in self.table.classes:
-                return callee.name
-            scope = self.table.scopes.get("global")
-            if scope:
-                for func in scope.functions.get(callee.name, []):
-                    if func.return_type:
-                        return func.return_type
+            return self._name_call_types.get(callee.name)
         elif isinstance(callee, AttributeExpression):
-            obj_type = self._infer_expression_type(callee.object)
-            if obj_type and obj_type in self.table.classes:
-                class_symbol = self.table.classes[obj_type]
-                methods = class_symbol.methods.get(callee.attribute, [])
-                for method in methods:
+            callee_info = self._resolve_callee(call)
+            if callee_info:
+                for method in callee_info[0]:
                     if method.return_type:
                         return method.return_type
         return None
@@ -300,22 +475,14 @@ class TypeChecker(CompileTimeCheck):
         obj_type = self._infer_expression_type(attr.object)
         if not obj_type:
             return None
-        if obj_type in self.table.classes:
-            class_symbol = self.table.classes[obj_type]
-            vars_scope = self.table.scopes.get(class_symbol.name)
-            if vars_scope and attr.attribute in vars_scope.variables:
-                return vars_scope.variables[attr.attribute].type_annotation
-        return None
+        attr_types = self._class_attr_types.get(obj_type)
+        return attr_types.get(attr.attribute) if attr_types else None
 
     def _literal_to_type(self, literal: LiteralExpression) -> Optional[str]:
         if literal.literal_type == "number":
             # A number is a float as soon as it has a fractional part or an
             # exponent ('.' / 'e' / 'E'); otherwise it is an int.
             text = str(literal.value)
-            return "float" if any(c in text for c in ".eE") else "int"
+            return _FLOAT if any(c in text for c in ".eE") else _INT
 
-        mapping = {
-            "string": "str",
-            "boolean": "bool",
-        }
-        return mapping.get(literal.literal_type)
+        return _LITERAL_TYPES.get(literal.literal_type)
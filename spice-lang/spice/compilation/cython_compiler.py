@@ -1,12 +1,13 @@
 """Cython compilation module for Spice exe mode."""
 
-import subprocess
 import sys
 import sysconfig
 import tempfile
+import threading
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, List, Tuple
 
 from spice.printils import pipeline_log
 
@@ -31,43 +32,59 @@ def compile_to_executable(pyx_path: Path, flags: "BuildFlags") -> Path:
     Raises:
         RuntimeError: If compilation fails at any stage
     """
-    pipeline_log.custom("cython", f"Compiling {pyx_path} to executable...")
+    return compile_to_executables([pyx_path], flags)[0]
 
-    # Determine output paths
-    c_path = pyx_path.with_suffix('.c')
-    if sys.platform == 'win32':
-        exe_path = pyx_path.with_suffix('.exe')
-    else:
-        exe_path = pyx_path.with_suffix('')
 
-    # Step 1: Cython .pyx -> .c with --embed for standalone executable
-    pipeline_log.custom("cython", "Step 1: Generating C code with embedded main()...")
-    cython_cmd = [
-        sys.executable, '-m', 'cython',
-        '--embed',  # Generate main() function for standalone executable
-        '-3',       # Python 3 mode
-        '-o', str(c_path),
-        str(pyx_path)
-    ]
+def compile_to_executables(pyx_paths: List[Path], flags: "BuildFlags") -> List[Path]:
+    """
+    Compile several .pyx files to standalone executables.
 
-    try:
-        result = subprocess.run(cython_cmd, capture_output=True, text=True, check=True)
-        if flags.verbose and result.stdout:
-            pipeline_log.info(result.stdout)
-    except subprocess.CalledProcessError as e:
-        raise RuntimeError(f"Cython compilation failed:\n{e.stderr}") from e
-    except FileNotFoundError:
-        raise RuntimeError(
-            "Cython not found. Install it with: pip install cython"
-        )
+    Cython translation runs one file at a time (its compiler state is global),
+    then the C compiles fan out over up to `flags.jobs` threads; each one
+    waits on an external compiler process, so they overlap freely.
 
-    pipeline_log.custom("cython", f"Generated C code: {c_path}")
+    Returns:
+        Paths to the generated executables, in the order of `pyx_paths`
+    """
+    c_paths = [_generate_c(pyx_path, flags) for pyx_path in pyx_paths]
+    exe_paths = [_exe_path_for(pyx_path) for pyx_path in pyx_paths]
 
     # Step 2: Compile C -> executable using distutils (handles MSVC setup)
     pipeline_log.custom("cython", "Step 2: Compiling C to executable...")
+    jobs = min(flags.jobs or 1, len(pyx_paths))
+    if jobs > 1:
+        with ThreadPoolExecutor(max_workers=jobs) as executor:
+            # list() re-raises the first compile failure
+            list(executor.map(lambda c_path, exe_path: _compile_c_to_exe(c_path, exe_path, flags), c_paths, exe_paths))
+    else:
+        for c_path, exe_path in zip(c_paths, exe_paths):
+            _compile_c_to_exe(c_path, exe_path, flags)
+
+    for pyx_path, c_path, exe_path in zip(pyx_paths, c_paths, exe_paths):
+        _cleanup_intermediates(pyx_path, c_path, flags)
+        pipeline_log.success(f"Generated executable: {exe_path}")
+    return exe_paths
+
+
+def _exe_path_for(pyx_path: Path) -> Path:
+    if sys.platform == 'win32':
+        return pyx_path.with_suffix('.exe')
+    return pyx_path.with_suffix('')
+
+
+def _generate_c(pyx_path: Path, flags: "BuildFlags") -> Path:
+    pipeline_log.custom("cython", f"Compiling {pyx_path} to executable...")
+    c_path = pyx_path.with_suffix('.c')
+
+    # Step 1: Cython .pyx -> .c with --embed for standalone executable
+    pipeline_log.custom("cython", "Step 1: Generating C code with embedded main()...")
+    _cythonize(pyx_path, c_path)
+
+    pipeline_log.custom("cython", f"Generated C code: {c_path}")
+    return c_path
 
-    _compile_c_to_exe(c_path, exe_path, flags)
 
+def _cleanup_intermediates(pyx_path: Path, c_path: Path, flags: "BuildFlags"):
     # Cleanup intermediate files for AOT compilation (unless --keep_intermediates)
     if not flags.keep_intermediates:
         pipeline_log.custom("cython", "Cleaning up intermediate files...")
@@ -83,22 +100,87 @@ def compile_to_executable(pyx_path: Path, flags: "BuildFlags") -> Path:
     else:
         pipeline_log.custom("cython", "Keeping intermediate files (.pyx, .c)")
 
-    pipeline_log.success(f"Generated executable: {exe_path}")
-    return exe_path
 
+def _cythonize(pyx_path: Path, c_path: Path):
+    """Translate .pyx -> .c in-process (equivalent to `cython --embed -3 -o c_path`).
 
-def _compile_c_to_exe(c_path: Path, exe_path: Path, flags: "BuildFlags"):
-    """Compile C file to executable using distutils for proper compiler setup."""
-    import distutils.ccompiler
-    from distutils.errors import CompileError, LinkError
+    Running Cython in this interpreter skips a Python startup and a Cython
+    import per file; the import is paid once per process.
+    """
+    try:
+        from Cython.Compiler import Options
+        from Cython.Compiler.Errors import CompileError
+        from Cython.Compiler.Main import CompilationOptions, compile as cython_compile
+    except ImportError:
+        raise RuntimeError(
+            "Cython not found. Install it with: pip install cython"
+        )
 
-    # Create a temporary build directory
-    build_dir = c_path.parent / '.spice_build'
-    build_dir.mkdir(exist_ok=True)
+    options = CompilationOptions(
+        language_level=3,
+        output_file=str(c_path),
+    )
+    # --embed is a global Cython option rather than a per-compilation one, so
+    # it is only set for this compile and then put back for other Cython users
+    previous_embed = Options.embed
+    Options.embed = "main"  # type: ignore[assignment]  # Generate main() for a standalone executable
+    try:
+        result = cython_compile(str(pyx_path), options)
+    except CompileError as e:
+        raise RuntimeError(f"Cython compilation failed:\n{e}") from e
+    finally:
+        Options.embed = previous_embed
+    if result.num_errors:
+        # Cython has already reported the individual errors on stderr
+        raise RuntimeError(f"Cython compilation failed with {result.num_errors} error(s)")
+
+
+def _optimization_args(compiler_type: str) -> Tuple[List[str], List[str]]:
+    """(compile, link) flags for --release builds of the generated C."""
+    if compiler_type == 'msvc':
+        return ['/O2', '/GL', '/Gy'], ['/LTCG']
+    if compiler_type == 'unix':
+        args = ['-O3', '-flto']
+        if sys.platform.startswith('linux'):
+            args.append('-fno-plt')
+        return args, list(args)
+    return [], []
 
+
+def _distutils():
+    """The `ccompiler` and `errors` modules of distutils.
+
+    The stdlib copy is gone in Python 3.12+, so setuptools' vendored copy is
+    preferred and the stdlib one is only a fallback for older interpreters.
+    """
     try:
+        from setuptools._distutils import ccompiler, errors
+    except ImportError:
+        try:
+            from distutils import ccompiler, errors  # type: ignore[no-redef]
+        except ImportError:
+            raise RuntimeError(
+                "No C toolchain support found. Install setuptools with: pip install setuptools"
+            )
+    return ccompiler, errors
+
+
+# Configured compiler per process. Creating one probes the toolchain (on
+# Windows that means locating MSVC and its environment), so it is done once.
+_TOOLCHAIN: dict = {}
+_TOOLCHAIN_LOCK = threading.Lock()
+
+
+def _get_compiler():
+    """The process-wide compiler instance, set up to build against libpython."""
+    with _TOOLCHAIN_LOCK:
+        compiler = _TOOLCHAIN.get(sys.platform)
+        if compiler is not None:
+            return compiler
+
+        ccompiler, _ = _distutils()
         # Get a compiler instance - this handles MSVC env setup on Windows
-        compiler = distutils.ccompiler.new_compiler()
+        compiler = ccompiler.new_compiler()
 
         # Add Python include directory
         compiler.add_include_dir(sysconfig.get_path('include'))
@@ -122,20 +204,46 @@ def _compile_c_to_exe(c_path: Path, exe_path: Path, flags: "BuildFlags"):
             python_lib = f'python{sys.version_info.major}.{sys.version_info.minor}'
             compiler.add_library(python_lib)
 
+        # MSVC locates its toolchain lazily on first compile; do it now so
+        # parallel builds don't race on it.
+        if getattr(compiler, 'initialized', True) is False:
+            compiler.initialize()
+
+        _TOOLCHAIN[sys.platform] = compiler
+        return compiler
+
+
+def _compile_c_to_exe(c_path: Path, exe_path: Path, flags: "BuildFlags"):
+    """Compile C file to executable with the cached compiler instance."""
+    _, errors = _distutils()
+
+    # Create a temporary build directory (per file: parallel builds share a folder)
+    build_dir = c_path.parent / f'.spice_build_{c_path.stem}'
+    build_dir.mkdir(exist_ok=True)
+
+    try:
+        compiler = _get_compiler()
+
+        compile_args, link_args = _optimization_args(compiler.compiler_type) if flags.release else ([], [])
+
         # Compile
         objects = compiler.compile(
             [str(c_path)],
             output_dir=str(build_dir),
+            # Keep GCC/clang intermediates in pipes rather than temp files
+            extra_preargs=['-pipe'] if compiler.compiler_type == 'unix' else None,
+            extra_postargs=compile_args,
         )
 
-        # Link to executable
+        # Link to executable (LTO needs the optimization flags again at link time)
         compiler.link_executable(
             objects,
             str(exe_path.stem),
             output_dir=str(exe_path.parent),
+            extra_postargs=link_args,
         )
 
-    except (CompileError, LinkError) as e:
+    except (errors.CompileError, errors.LinkError) as e:
         raise RuntimeError(f"C compilation failed: {e}") from e
     finally:
         # Cleanup build directory
@@ -6,144 +6,215 @@ from spice.errors import ImportError, SpiceCompileTimeError
 
 from pathlib import Path
 from spice.compilation.build_flags import BuildFlags
+from spice.compilation import build_cache
+from spice.compilation.pipeline_context import PipelineContext
 
 from spice.printils import pipeline_log
 
 from typing import Optional
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 
+import functools
+import os
 import sys
 import sysconfig
 import site
 
-# Per-build state. Reset at each top-level walk() so repeated builds in one
-# process (e.g. a build script compiling several targets) don't leak state.
-LOOKUP_PATHS: list[Path] = []
-RESOLVED_FILES: dict[Path, SpiceFile] = {}   # resolved .spc path -> shared SpiceFile (one node per module)
 
+@functools.lru_cache(maxsize=1)
+def _system_lookup_paths() -> tuple[Path, ...]:
+    """Interpreter library/site directories, in lookup order. Fixed for the process."""
+    return (
+        Path(sysconfig.get_path('purelib')),
+        Path(sysconfig.get_path('platlib')),
+        Path(site.getusersitepackages()),
+        Path(sysconfig.get_path('stdlib')),
+        *(Path(site_path_str) for site_path_str in site.getsitepackages()),
+    )
 
-def _reset_build_state():
-    """Clear the per-build import caches. Called at the root of walk()."""
-    LOOKUP_PATHS.clear()
-    RESOLVED_FILES.clear()
 
+def _display_path(path: Path, ctx: Optional[PipelineContext]) -> str:
+    """Resolved posix form of `path` for logs, through the build's memo when there is one."""
+    return (ctx.resolve(path) if ctx is not None else path.resolve()).as_posix()
 
-def add_and_check_lookup_path(path: Path):
-    global LOOKUP_PATHS
 
-    if path.resolve() in LOOKUP_PATHS or not path.exists():
-        return
+@functools.lru_cache(maxsize=None)
+def _lexer() -> Lexer:
+    """The process's pipeline Lexer. Only used by the (serial) parse stage."""
+    return Lexer()
 
-    LOOKUP_PATHS.append(path.resolve())
 
+@functools.lru_cache(maxsize=None)
+def _parser() -> Parser:
+    """The process's pipeline Parser; parse() resets its per-file state on entry."""
+    return Parser()
+
+
+def _tokenize_and_parse(source: str):
+    """Process-pool worker: (tokens, AST) for one file's source."""
+    tokens = _lexer().tokenize(source)
+    return tokens, _parser().parse(tokens)
+
+
+def _check_import_cycles(entry: SpiceFile, ctx: PipelineContext):
+    """Raise ImportError if the import graph under `entry` has a cycle."""
+    done: set[Path] = set()
+    stack: list[Path] = []
+
+    def visit(file: SpiceFile):
+        here = ctx.resolve(file.path)
+        stack.append(here)
+        for imported in file.spc_imports:
+            target = ctx.resolve(imported.path)
+            if target in stack:
+                # `target` is an ancestor on the current path -> cycle.
+                cycle = stack[stack.index(target):] + [target]
+                raise ImportError(
+                    "Circular import detected:\n" + " ->\n".join(f" - {p.as_posix()}" for p in cycle)
+                )
+            if target not in done:
+                visit(imported)
+        stack.pop()
+        done.add(here)
+
+    visit(entry)
 
 
 class SpicePipeline:
     @staticmethod
-    def tokenize(file: SpiceFile, flags: BuildFlags):
+    def tokenize(file: SpiceFile, flags: BuildFlags, ctx: Optional[PipelineContext] = None):
         """Tokenize and verify lexically the current Spice File"""
 
-        pipeline_log.custom("pipeline", f"Tokenizing file: {file.path.resolve().as_posix()}")
+        pipeline_log.custom("pipeline", f"Tokenizing file: {_display_path(file.path, ctx)}")
 
-        lexer: Lexer = Lexer()
-        file.tokens = lexer.tokenize(file.source)
+        file.tokens = _lexer().tokenize(file.source)
 
     @staticmethod
-    def parse(file: SpiceFile, flags: BuildFlags):
+    def parse(file: SpiceFile, flags: BuildFlags, ctx: Optional[PipelineContext] = None):
         """Parse and verify syntactically the current Spice File, generating the file's AST"""
 
-        pipeline_log.custom("pipeline", f"Parsing file: {file.path.resolve().as_posix()}")
+        pipeline_log.custom("pipeline", f"Parsing file: {_display_path(file.path, ctx)}")
 
-        parser: Parser = Parser()
-        file.ast = parser.parse(file.tokens)
+        file.ast = _parser().parse(file.tokens)
 
     @staticmethod
-    def resolve_imports(file: SpiceFile, lookup: list[Path], flags: BuildFlags):
+    def resolve_imports(file: SpiceFile, ctx: PipelineContext, flags: BuildFlags):
         """Resolve the imports for the current Spice File"""
 
-        pipeline_log.custom("pipeline", f"Resolving imports for file: {file.path.resolve().as_posix()}")
+        pipeline_log.custom("pipeline", f"Resolving imports for file: {ctx.resolve(file.path).as_posix()}")
 
-        left_to_resolve: list[ImportStatement] = []
-        for stmt in file.ast.body:
+        # Read once: the verbose-only messages below are only formatted when it's set.
+        verbose = flags.verbose
+
+        # Unresolved imports (with their source position) by id(), in source
+        # order; resolving one is an O(1) delete.
+        pending: dict[int, tuple[int, ImportStatement, str, str]] = {}
+        # (lookup path index, source position, kind, path) per resolved import
+        found: list[tuple[int, int, str, Path]] = []
+        for position, stmt in enumerate(file.ast.body):
             if isinstance(stmt, ImportStatement):
                 if stmt.module in sys.builtin_module_names:
                     continue
 
-                left_to_resolve.append(stmt)
-                if flags.verbose:
+                # A module another file already resolved maps to the same path:
+                # lookup paths are only ever appended, so its match stays first.
+                known = ctx.resolved_modules.get(stmt.module)
+                if known is not None:
+                    found.append((known[0], position, known[1], known[2]))
+                    continue
+
+                # Split once into the relative parent dir and the last
+                # component; each lookup path then only joins strings onto it.
+                subdir, _, name = stmt.module.rpartition('.')
+                pending[id(stmt)] = (position, stmt, subdir.replace('.', '/'), name)
+                if verbose:
                     pipeline_log.custom("pipeline", f"Added import statement: {stmt.module}")
 
-        for path in lookup:
-            if path.exists():
-                # Snapshot: the body removes resolved statements from
-                # left_to_resolve, so iterating it directly would skip every
-                # second import found under the same lookup path.
-                for stmt in list(left_to_resolve):
-                    found: bool = False
-                    relative_path: str = path.resolve().as_posix()
-
-                    if flags.verbose:
-                        pipeline_log.custom("pipeline", f"Searching for import statement '{stmt.module}' against path {relative_path}")
-
-                    module_path = Path(stmt.module.replace('.', '/'))
-                    possible_spc_paths = [
-                        path / (str(module_path) + ".spc"),
-                        path / module_path / "__init__.spc"
-                    ]
-                    possible_py_paths = [
-                        path / (str(module_path) + ".py"),
-                        path / module_path / "__init__.py"
-                    ]
-
-                    for possible_spc_path in possible_spc_paths:
-                        if (flags.verbose):
-                            pipeline_log.custom("pipeline", f"Checking possible .spc path: {possible_spc_path.resolve().as_posix()}")
-                        if possible_spc_path.is_file() or (possible_spc_path / "__main__.spc").is_file():
-                            left_to_resolve.remove(stmt)
-
-                            # Share one SpiceFile per module so diamond imports
-                            # (A->B->D, A->C->D) resolve to the same node instead
-                            # of being rebuilt or flagged as a false cycle.
-                            resolved = possible_spc_path.resolve()
-                            imported_file = RESOLVED_FILES.get(resolved)
-                            if imported_file is None:
-                                imported_file = SpiceFile(possible_spc_path)
-                                RESOLVED_FILES[resolved] = imported_file
-                            file.spc_imports.append(imported_file)
-
-                            found = True
-                            break
-
-                    for possible_py_path in possible_py_paths:
-                        if (flags.verbose):
-                            pipeline_log.custom("pipeline", f"Checking possible .py path: {possible_py_path.resolve().as_posix()}")
-                        if found:
-                            break
-
-                        if possible_py_path.is_file():
-                            resolved = possible_py_path.resolve()
-                            if resolved not in (p.resolve() for p in file.py_imports):
-                                file.py_imports.append(possible_py_path)
-                            left_to_resolve.remove(stmt)
-                            break
-
-        if len(left_to_resolve) > 0:
+        for index, path in enumerate(ctx.lookup_paths):
+            if pending and ctx.listing(path) is not None:
+                path_label = ctx.resolve(path).as_posix() if verbose else ""
+                # Snapshot: the body deletes resolved statements from `pending`.
+                for stmt_id, (position, stmt, subdir, name) in list(pending.items()):
+                    if verbose:
+                        pipeline_log.custom("pipeline", f"Searching for import statement '{stmt.module}' against path {path_label}")
+
+                    # Candidates are tested against cached directory listings
+                    # rather than with a stat() each.
+                    # Paths are only built for directories that exist.
+                    parent = path / subdir if subdir else path
+                    package = parent / name if ctx.is_dir(parent, name) else None
+                    spc_name = name + ".spc"
+
+                    kind = "spc"
+                    found_path: Optional[Path] = None
+                    if ctx.is_file(parent, spc_name) or (ctx.is_dir(parent, spc_name) and ctx.is_file(parent / spc_name, "__main__.spc")):
+                        found_path = parent / spc_name
+                    elif package is not None and (ctx.is_file(package, "__init__.spc") or (ctx.is_dir(package, "__init__.spc") and ctx.is_file(package / "__init__.spc", "__main__.spc"))):
+                        found_path = package / "__init__.spc"
+                    else:
+                        kind = "py"
+                        if ctx.is_file(parent, name + ".py"):
+                            found_path = parent / (name + ".py")
+                        elif package is not None and ctx.is_file(package, "__init__.py"):
+                            found_path = package / "__init__.py"
+
+                    if found_path is not None:
+                        if verbose:
+                            pipeline_log.custom("pipeline", f"Found .{kind} path: {ctx.resolve(found_path).as_posix()}")
+                        del pending[stmt_id]
+                        ctx.resolved_modules[stmt.module] = (index, kind, found_path)
+                        found.append((index, position, kind, found_path))
+
+        # Applied in lookup-path order, then source order, whether or not a
+        # module came from the memo.
+        for _, _, kind, found_path in sorted(found, key=lambda entry: entry[:2]):
+            resolved = ctx.resolve(found_path)
+            if kind == "spc":
+                # Share one SpiceFile per module so diamond imports
+                # (A->B->D, A->C->D) resolve to the same node instead
+                # of being rebuilt or flagged as a false cycle.
+                imported_file = ctx.resolved_files.get(resolved)
+                if imported_file is None:
+                    # walk() reads the next frontier's sources in one batch
+                    imported_file = SpiceFile(found_path, read_source=False)
+                    ctx.resolved_files[resolved] = imported_file
+                file.spc_imports.append(imported_file)
+            elif resolved not in (ctx.resolve(p) for p in file.py_imports):
+                file.py_imports.append(found_path)
+
+        if pending:
             exception = "\nUnresolved imports found: \n"
-            for stmt in left_to_resolve:
+            for _, stmt, _, _ in pending.values():
                 exception += f" - {stmt.module}\n"
             exception += "All available source sets: \n"
-            for path in LOOKUP_PATHS:
-                exception += f" - {path.resolve().as_posix()}\n"
+            for path in ctx.lookup_paths:
+                exception += f" - {ctx.resolve(path).as_posix()}\n"
             raise ImportError(exception)
 
-        if flags.verbose and len(file.spc_imports) > 0:
-            msg = f"Added pipeline divergence from file {file.path.resolve().as_posix()} to:\n"
+        if verbose and len(file.spc_imports) > 0:
+            msg = f"Added pipeline divergence from file {ctx.resolve(file.path).as_posix()} to:\n"
             for spc in file.spc_imports:
-                msg += f" - {spc.path.resolve().as_posix()}\n"
+                msg += f" - {ctx.resolve(spc.path).as_posix()}\n"
             pipeline_log.custom("pipeline", msg)
 
     @staticmethod
-    def transform_and_write(file: SpiceFile, flags: BuildFlags):
-        """Transform the AST of the current Spice File into target code and write it to disk."""
+    def _output_path(file: SpiceFile, flags: BuildFlags) -> Path:
+        """Where the generated code for `file` is written, based on emit mode and output dir."""
+        output_path = file.get_output_path(flags.emit)
+        if isinstance(flags.output, Path):
+            output_path = flags.output.resolve() / output_path.name
+        return output_path
+
+    @staticmethod
+    def transform_and_write(file: SpiceFile, flags: BuildFlags) -> Path:
+        """Transform the AST of the current Spice File into target code, write it to disk
+        and return the written path."""
+        output_code = SpicePipeline._transform(file, flags)
+        return SpicePipeline._write_output(SpicePipeline._output_path(file, flags), output_code)
+
+    @staticmethod
+    def _transform(file: SpiceFile, flags: BuildFlags) -> str:
+        """Generated target code for the current Spice File."""
         target = "Cython" if flags.emit in ("pyx", "exe") else "Python"
         pipeline_log.custom("pipeline", f"Transforming file to {target}: {file.path.resolve().as_posix()}")
 
@@ -151,74 +222,120 @@ class SpicePipeline:
             emit=flags.emit,
             enable_runtime_final_checks=flags.runtime_checks
         )
-        output_code = transformer.transform(file.ast, extra_imports=file.extra_imports)
-
-        # Determine output path based on emit mode
-        output_path = file.get_output_path(flags.emit)
-        if isinstance(flags.output, Path):
-            output_path = flags.output.resolve() / output_path.name
+        return transformer.transform(file.ast, extra_imports=file.extra_imports)
 
+    @staticmethod
+    def _write_output(output_path: Path, output_code: str) -> Path:
         with open(output_path, 'w', encoding='utf-8') as f:
             pipeline_log.custom("pipeline", f"Writing to {output_path}...")
             f.write(output_code)
-
-        # For exe mode, compile the generated .pyx to binary
-        if flags.emit == "exe":
-            from spice.compilation.cython_compiler import compile_to_executable
-            compile_to_executable(output_path, flags)
+        return output_path
 
     @staticmethod
-    def walk(root: Path, spc_file: Optional[SpiceFile], flags: BuildFlags, _stack: Optional[list[Path]] = None) -> SpiceFile:
-        """Recursively populate the import graph for the current Spice File."""
+    def walk(
+        root: Path,
+        spc_file: Optional[SpiceFile],
+        flags: BuildFlags,
+        ctx: Optional[PipelineContext] = None,
+    ) -> SpiceFile:
+        """Populate the import graph for the current Spice File.
+
+        Files are discovered breadth-first: each round tokenizes and parses the
+        whole frontier (over a process pool when `flags.jobs` > 1), then resolves
+        the frontier's imports serially, as that mutates `ctx`.
+
+        Lookup paths and import caches live in `ctx`; a fresh one is created
+        when none is given, so separate builds never share resolution state.
+        """
 
+        if ctx is None:
+            ctx = PipelineContext()
         if spc_file is None:
-            # Top-level entry: start from a clean per-build state.
-            _reset_build_state()
             spc_file = SpiceFile(root)
-            RESOLVED_FILES[spc_file.path.resolve()] = spc_file
-
-        if _stack is None:
-            _stack = []
-
-        add_and_check_lookup_path(root)
-        add_and_check_lookup_path(spc_file.path.parent)
-        add_and_check_lookup_path(Path.cwd())
-        add_and_check_lookup_path(Path(sysconfig.get_path('purelib')))
-        add_and_check_lookup_path(Path(sysconfig.get_path('platlib')))
-        add_and_check_lookup_path(Path(site.getusersitepackages()))
-        add_and_check_lookup_path(Path(sysconfig.get_path('stdlib')))
-
-        global_sites = site.getsitepackages()
-        for site_path_str in global_sites:
-            add_and_check_lookup_path(Path(site_path_str))
-
-
-        SpicePipeline.tokenize(spc_file, flags)
-        SpicePipeline.parse(spc_file, flags)
-        SpicePipeline.resolve_imports(spc_file, LOOKUP_PATHS, flags)
-
-        here = spc_file.path.resolve()
-        _stack.append(here)
-
-        for imported in spc_file.spc_imports:
-            target = imported.path.resolve()
-
-            if target in _stack:
-                # `target` is an ancestor on the current path -> cycle.
-                cycle = _stack[_stack.index(target):] + [target]
-                raise ImportError(
-                    "Circular import detected:\n" + " ->\n".join(f" - {p.as_posix()}" for p in cycle)
-                )
-
-            if imported.tokens:
-                # Already walked -> don't rebuild it.
-                continue
+        ctx.resolved_files.setdefault(ctx.resolve(spc_file.path), spc_file)
+
+        ctx.add_and_check_lookup_path(root)
+        ctx.add_and_check_lookup_path(spc_file.path.parent)
+        ctx.add_and_check_lookup_path(Path.cwd())
+        for system_path in _system_lookup_paths():
+            ctx.add_and_check_lookup_path(system_path)
+
+        jobs = flags.jobs or 1
+        executor = ProcessPoolExecutor(max_workers=min(jobs, os.cpu_count() or 1)) if jobs > 1 else None
+        try:
+            frontier = [spc_file]
+            seen = {id(spc_file)}
+            while frontier:
+                SpicePipeline._tokenize_and_parse_all(frontier, flags, executor, ctx)
+
+                next_frontier: list[SpiceFile] = []
+                for file in frontier:
+                    ctx.add_and_check_lookup_path(file.path.parent)
+                    SpicePipeline.resolve_imports(file, ctx, flags)
+                    for imported in file.spc_imports:
+                        # Shared nodes (diamond imports) and already-walked files are built once.
+                        # (Files whose AST came from the cache were never tokenized.)
+                        if id(imported) in seen or imported.tokens or imported.ast.body:
+                            continue
+                        seen.add(id(imported))
+                        pipeline_log.custom("pipeline", f"Walking imported file: {ctx.resolve(imported.path).as_posix()}")
+                        next_frontier.append(imported)
+                frontier = next_frontier
+        finally:
+            if executor is not None:
+                executor.shutdown()
+
+        _check_import_cycles(spc_file, ctx)
+        return spc_file
 
-            pipeline_log.custom("pipeline", f"Walking imported file: {target.as_posix()}")
-            SpicePipeline.walk(root, imported, flags, _stack)
+    @staticmethod
+    def _tokenize_and_parse_all(
+        files: list[SpiceFile],
+        flags: BuildFlags,
+        executor: Optional[ProcessPoolExecutor],
+        ctx: Optional[PipelineContext] = None,
+    ):
+        """Read, tokenize and parse `files`, spreading them over `executor` when there's more than one.
+
+        With the `cache` flag, files whose source was parsed by an earlier build
+        take their AST from the on-disk cache and skip the lexer and parser.
+        """
+        if executor is None or len(files) < 2:
+            for file in files:
+                file.read_source()
+        else:
+            # Reads are I/O bound (os.read drops the GIL), so a thread batch overlaps them.
+            with ThreadPoolExecutor(max_workers=min(flags.jobs, len(files))) as readers:
+                list(readers.map(SpiceFile.read_source, files))
+
+        ast_keys: dict[int, str] = {}
+        if flags.cache:
+            to_parse: list[SpiceFile] = []
+            for file in files:
+                key = ast_keys[id(file)] = build_cache.ast_key(file.source)
+                cached = build_cache.load_ast(key)
+                if cached is None:
+                    to_parse.append(file)
+                    continue
+                if flags.verbose:
+                    pipeline_log.custom("pipeline", f"Using cached AST for: {_display_path(file.path, ctx)}")
+                file.ast = cached
+            files = to_parse
+
+        if executor is None or len(files) < 2:
+            for file in files:
+                SpicePipeline.tokenize(file, flags, ctx)
+                SpicePipeline.parse(file, flags, ctx)
+        else:
+            pipeline_log.custom("pipeline", f"Tokenizing and parsing {len(files)} files in parallel")
+            results = executor.map(_tokenize_and_parse, [file.source for file in files])
+            for file, (tokens, ast) in zip(files, results):
+                file.tokens = tokens
+                file.ast = ast
 
-        _stack.pop()
-        return spc_file
+        if ast_keys:
+            for file in files:
+                build_cache.store_ast(ast_keys[id(file)], file.ast)
 
     @staticmethod
     def _run_analysis(file: SpiceFile, flags: BuildFlags, fatal: bool):
@@ -230,6 +347,7 @@ class SpicePipeline:
         and gate compilation.
         """
         from spice.compilation.checks import (
+            CompositeChecker,
             FinalChecker,
             GenericBoundChecker,
             InterfaceChecker,
@@ -238,59 +356,64 @@ class SpicePipeline:
             TypeChecker,
         )
 
-        SymbolTableBuilder().check(file)
+        # Declaration-level checks share a single walk over the tree; their
+        # errors are still reported in the usual order below.
+        interface_checker = InterfaceChecker()
+        final_checker = FinalChecker()
+        CompositeChecker([SymbolTableBuilder(), interface_checker, final_checker]).check(file)
 
+        # With the symbol table built these only read the tree (the overload
+        # resolver writes decorators/overload tables nobody else reads), so
+        # they may run side by side when more than one job is allowed.
         overload_resolver = MethodOverloadResolver()
-        if not overload_resolver.check(file) and fatal:
-            exception = "Invalid method overloads detected:\n"
-            for error in overload_resolver.errors:
-                exception += f" - {error}\n"
-            raise SpiceCompileTimeError(exception)
-
         type_checker = TypeChecker()
-        if not type_checker.check(file) and fatal:
-            exception = "Type checking failed:\n"
-            for error in type_checker.errors:
-                exception += f" - {error}\n"
-            raise SpiceCompileTimeError(exception)
-
-        interface_checker = InterfaceChecker()
-        if not interface_checker.check(file) and fatal:
-            exception = "Interface implementation errors:\n"
-            for error in interface_checker.errors:
-                exception += f" - {error}\n"
-            raise SpiceCompileTimeError(exception)
-
         bound_checker = GenericBoundChecker()
-        if not bound_checker.check(file) and fatal:
-            exception = "Generic bound errors:\n"
-            for error in bound_checker.errors:
-                exception += f" - {error}\n"
-            raise SpiceCompileTimeError(exception)
-
-        final_checker = FinalChecker()
-        if not final_checker.check(file) and fatal:
-            exception = "Instance(s) declared final found reassigned: \n"
-            for error in final_checker.errors:
-                exception += f" - {error}"
-            raise SpiceCompileTimeError(exception)
+        independent = [overload_resolver, type_checker, bound_checker]
 
-    @staticmethod
-    def verify_and_write(file: SpiceFile, flags: BuildFlags, _done: Optional[set] = None):
-        """Build -> Lower (annotations/tools) -> Rebuild -> transform, for the whole tree.
+        jobs = flags.jobs or 1
+        if jobs > 1:
+            with ThreadPoolExecutor(max_workers=min(jobs, len(independent))) as executor:
+                list(executor.map(lambda checker: checker.check(file), independent))
+        else:
+            for checker in independent:
+                checker.check(file)
 
-        `_done` tracks already-processed files
-        """
+        if not fatal:
+            return
 
-        if _done is None:
-            _done = set()
+        reports = [
+            (overload_resolver, "Invalid method overloads detected:\n", "\n"),
+            (type_checker, "Type checking failed:\n", "\n"),
+            (interface_checker, "Interface implementation errors:\n", "\n"),
+            (bound_checker, "Generic bound errors:\n", "\n"),
+            (final_checker, "Instance(s) declared final found reassigned: \n", ""),
+        ]
+        for checker, exception, separator in reports:
+            if checker.errors:
+                for error in checker.errors:
+                    exception += f" - {error}{separator}"
+                raise SpiceCompileTimeError(exception)
 
-        here = file.path.resolve()
-        if here in _done:
-            return
-        _done.add(here)
+    @staticmethod
+    def _collect_tree(file: SpiceFile) -> list[SpiceFile]:
+        """Every file in the import graph under `file`, once each, entry first (preorder)."""
+        files: list[SpiceFile] = []
+        done: set[Path] = set()
+        stack = [file]
+        while stack:
+            current = stack.pop()
+            here = current.path.resolve()
+            if here in done:
+                continue
+            done.add(here)
+            files.append(current)
+            stack.extend(reversed(current.spc_imports))
+        return files
 
-        pipeline_log.custom("pipeline", f"Verifying file: {here.as_posix()}")
+    @staticmethod
+    def _verify(file: SpiceFile, flags: BuildFlags):
+        """Build -> Lower (annotations/tools) -> Rebuild for one file; raises on fatal errors."""
+        pipeline_log.custom("pipeline", f"Verifying file: {file.path.resolve().as_posix()}")
 
         from spice.compilation.checks import AnnotationStage
 
@@ -311,7 +434,58 @@ class SpicePipeline:
         SpicePipeline._run_analysis(file, flags, fatal=True)
         pipeline_log.custom("pipeline", "All compile-time checks passed.")
 
-        SpicePipeline.transform_and_write(file, flags)
+    @staticmethod
+    def verify_and_write(file: SpiceFile, flags: BuildFlags):
+        """Build -> Lower (annotations/tools) -> Rebuild -> transform, for the whole tree.
 
-        for imported in file.spc_imports:
-            SpicePipeline.verify_and_write(imported, flags, _done)
+        Each file's checks only read and rewrite its own AST, so the files of
+        the tree are verified as one batch (over a thread pool when `flags.jobs`
+        > 1). Nothing is written until the whole batch has passed; for the exe
+        target the generated .pyx files are then compiled to binaries together.
+        """
+        to_build: list[SpiceFile] = []
+        cache_keys: dict[int, str] = {}
+        for current in SpicePipeline._collect_tree(file):
+            # The exe target also compiles a binary, which the cache doesn't track.
+            if flags.cache and flags.emit != "exe":
+                here = current.path.resolve()
+                cache_key = build_cache.cache_key(here, current.source, flags)
+                if build_cache.is_up_to_date(cache_key, SpicePipeline._output_path(current, flags)):
+                    pipeline_log.custom("pipeline", f"Up to date, skipping: {here.as_posix()}")
+                    continue
+                cache_keys[id(current)] = cache_key
+            to_build.append(current)
+
+        jobs = flags.jobs or 1
+        if jobs > 1 and len(to_build) > 1:
+            # map() re-raises the first failure in tree order, as the serial loop would.
+            with ThreadPoolExecutor(max_workers=min(jobs, len(to_build))) as executor:
+                list(executor.map(lambda current: SpicePipeline._verify(current, flags), to_build))
+        else:
+            for current in to_build:
+                SpicePipeline._verify(current, flags)
+
+        outputs = [SpicePipeline._output_path(current, flags) for current in to_build]
+        if jobs > 1 and len(to_build) > 1:
+            # Writes go to a thread pool, so each file is transformed while the
+            # previous outputs are still being written out.
+            with ThreadPoolExecutor(max_workers=min(jobs, len(to_build))) as writers:
+                writes = [
+                    writers.submit(SpicePipeline._write_output, output_path, SpicePipeline._transform(current, flags))
+                    for current, output_path in zip(to_build, outputs)
+                ]
+                for write in writes:
+                    write.result()
+        else:
+            for current, output_path in zip(to_build, outputs):
+                SpicePipeline._write_output(output_path, SpicePipeline._transform(current, flags))
+
+        for current, output_path in zip(to_build, outputs):
+            recorded_key = cache_keys.get(id(current))
+            if recorded_key is not None:
+                build_cache.record_build(recorded_key, output_path)
+
+        # For exe mode, compile the generated .pyx files to binaries in one batch
+        if flags.emit == "exe" and outputs:
+            from spice.compilation.cython_compiler import compile_to_executables
+            compile_to_executables(outputs, flags)
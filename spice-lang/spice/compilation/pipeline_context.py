@@ -0,0 +1,88 @@
+"""Per-build import-resolution state for the compilation pipeline."""
+
+from __future__ import annotations
+
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, List, Optional, Set, Tuple
+
+from spice.utils.compat import DATACLASS_SLOTS
+
+if TYPE_CHECKING:
+    from spice.compilation.spicefile import SpiceFile
+
+
+@dataclass(**DATACLASS_SLOTS)
+class PipelineContext:
+    """Lookup paths and caches shared by one build's walk.
+
+    A fresh context per top-level walk() keeps repeated builds in one process
+    (build scripts, the LSP) from leaking state into each other.
+    """
+
+    # Directories imports are searched in, in priority order (resolved)
+    lookup_paths: List[Path] = field(default_factory=list)
+    # Resolved .spc path -> shared SpiceFile (one node per module)
+    resolved_files: Dict[Path, "SpiceFile"] = field(default_factory=dict)
+    # Directory -> {entry name: is_dir}, None if not a directory
+    dir_listings: Dict[Path, Optional[Dict[str, bool]]] = field(default_factory=dict)
+    # Path -> path.resolve(), so each path is resolved once per build
+    resolved_paths: Dict[Path, Path] = field(default_factory=dict)
+    # Membership index over `lookup_paths`
+    lookup_path_set: Set[Path] = field(default_factory=set)
+    # Module name -> (index in `lookup_paths`, "spc" | "py", path) of its first match
+    resolved_modules: Dict[str, Tuple[int, str, Path]] = field(default_factory=dict)
+
+    def resolve(self, path: Path) -> Path:
+        """`path.resolve()`, memoized for this build (resolve() stats every component)."""
+        resolved = self.resolved_paths.get(path)
+        if resolved is None:
+            resolved = self.resolved_paths[path] = path.resolve()
+        return resolved
+
+    def add_and_check_lookup_path(self, path: Path) -> None:
+        """Append `path` to the lookup paths unless it is missing or already there."""
+        resolved = self.resolved_paths.get(path)
+        if resolved is not None:
+            if resolved in self.lookup_path_set or not os.path.exists(resolved):
+                return
+        else:
+            # A strict resolve doubles as the existence check (one realpath walk).
+            try:
+                resolved = path.resolve(strict=True)
+            except (OSError, RuntimeError):
+                return
+            self.resolved_paths[path] = resolved
+            if resolved in self.lookup_path_set:
+                return
+
+        self.lookup_paths.append(resolved)
+        self.lookup_path_set.add(resolved)
+
+    def listing(self, directory: Path) -> Optional[Dict[str, bool]]:
+        """Entries of `directory` as {name: is_dir}, read with one scandir per build."""
+        if directory in self.dir_listings:
+            return self.dir_listings[directory]
+        entries: Optional[Dict[str, bool]]
+        try:
+            with os.scandir(directory) as it:
+                entries = {}
+                for entry in it:
+                    try:
+                        entries[entry.name] = entry.is_dir()
+                    except OSError:
+                        # Broken symlink etc.: neither a file nor a directory we can use
+                        continue
+        except OSError:
+            entries = None
+        self.dir_listings[directory] = entries
+        return entries
+
+    def is_file(self, directory: Path, name: str) -> bool:
+        entries = self.listing(directory)
+        return entries is not None and entries.get(name) is False
+
+    def is_dir(self, directory: Path, name: str) -> bool:
+        entries = self.listing(directory)
+        return entries is not None and entries.get(name) is True
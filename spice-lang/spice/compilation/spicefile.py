@@ -1,12 +1,25 @@
 """Holder for a Spice source file and its data"""
 
+import os
+import stat
 from pathlib import Path
-from typing import Optional, List
+from typing import Optional, List, TYPE_CHECKING
 from spice.lexer import Token
 from spice.parser import Module
-from spice.parser.ast_nodes import ASTNode, RawCode
+from spice.parser.ast_nodes import ASTNode, RawCode, child_nodes
 from spice.utils import generate_spc_stub
 
+if TYPE_CHECKING:
+    from spice.compilation.symbol_table import SymbolTable
+
+
+# Extension mapping for different emit modes
+_EMIT_EXTENSIONS = {
+    "py": ".py",
+    "pyx": ".pyx",
+    "exe": ".pyx"
+}
+
 
 class SpiceFile:
     """
@@ -16,35 +29,60 @@ class SpiceFile:
     and import tracking throughout the compilation pipeline.
     """
 
-    # Extension mapping for different emit modes
-    EMIT_EXTENSIONS = {
-        "py": ".py",
-        "pyx": ".pyx",
-        "exe": ".pyx"
-    }
+    # Built for every module in an import tree; slots keep each one compact.
+    __slots__ = (
+        "is_directory", "path", "py_path", "_temp_path", "source", "_unread_size",
+        "tokens", "ast", "py_code", "import_paths", "spc_imports", "py_imports",
+        "method_overload_table", "symbol_table", "extra_imports", "diagnostics", "warnings",
+    )
+
+    # Kept for callers that read it off the class
+    EMIT_EXTENSIONS = _EMIT_EXTENSIONS
 
-    def __init__(self, path: Path) -> None:
-        self.is_directory: bool = path.is_dir()
+    def __init__(self, path: Path, read_source: bool = True) -> None:
+        # One stat decides directory vs file (and gives the size to read)
+        st = _stat(path)
+        self.is_directory: bool = st is not None and stat.S_ISDIR(st.st_mode)
 
         if self.is_directory:
             main_file = path / '__main__.spc'
-            if not main_file.is_file():
+            st = _stat(main_file)
+            if st is None or not stat.S_ISREG(st.st_mode):
                 raise FileNotFoundError(f"Directory '{path}' does not contain '__main__.spc'")
             path = main_file
-        elif not path.is_file():
+        elif st is None or not stat.S_ISREG(st.st_mode):
             raise FileNotFoundError(f"Expected a .spc file or a directory containing '__main__.spc', got: {path}")
 
         self.path: Path = path
         self.py_path: Path = self.path.with_suffix('.py')
-        self.temp_path: Path = Path.home().joinpath('.spice', 'cache', generate_spc_stub(self.path))
-        self.source: str = Path(self.path).read_text(encoding='utf-8')
+        self._temp_path: Optional[Path] = None
+        # With read_source=False the read is deferred to read_source(), so a
+        # caller can batch the reads of many files.
+        self._unread_size: Optional[int] = None if read_source else st.st_size
+        self.source: str = _read_source(self.path, st.st_size) if read_source else ""
 
         self._init_defaults()
 
+    @property
+    def temp_path(self) -> Path:
+        """Cache stub path for this file, derived from its path and contents.
+
+        Computed on first use: naming it reads and hashes the whole file again.
+        """
+        if self._temp_path is None:
+            self._temp_path = _CACHE_DIR / generate_spc_stub(self.path)
+        return self._temp_path
+
+    def read_source(self) -> str:
+        """Load the source if its read was deferred (a no-op once loaded)."""
+        if self._unread_size is not None:
+            self.source = _read_source(self.path, self._unread_size)
+            self._unread_size = None
+        return self.source
+
     def get_output_path(self, emit: str = "py") -> Path:
         """Get the output path for the given emit mode."""
-        ext = self.EMIT_EXTENSIONS.get(emit, ".py")
-        return self.path.with_suffix(ext)
+        return self.path.with_suffix(_EMIT_EXTENSIONS.get(emit, ".py"))
 
     def _init_defaults(self) -> None:
         """Initialize default values for all mutable attributes."""
@@ -56,7 +94,7 @@ class SpiceFile:
         self.spc_imports: list[SpiceFile] = []
         self.py_imports: list[Path] = []
         self.method_overload_table: dict[str, dict[str, str]] = {}
-        self.symbol_table = None
+        self.symbol_table: Optional["SymbolTable"] = None
 
         # Imports not introduced by parsed code
         self.extra_imports: set[str] = set()
@@ -133,22 +171,45 @@ class SpiceFile:
         instance.is_directory = False
         instance.path = Path("<memory>")
         instance.py_path = Path("<memory>.py")
-        instance.temp_path = Path("<memory>")
+        instance._temp_path = Path("<memory>")
         instance.source = source
+        instance._unread_size = None
         instance._init_defaults()
         return instance
 
 
+_READ_CHUNK = 64 * 1024
+_CACHE_DIR = Path.home().joinpath('.spice', 'cache')
+
+
+def _stat(path: Path) -> Optional[os.stat_result]:
+    """os.stat(path), or None if it doesn't exist / can't be reached."""
+    try:
+        return os.stat(path)
+    except OSError:
+        return None
+
+
+def _read_source(path: Path, size: int) -> str:
+    """Read a UTF-8 source file like Path.read_text, sized from a stat we already have.
+
+    Reads through a raw close-on-exec fd, so no buffered file object (and its
+    extra fstat) is created. Newlines are normalized as text mode would.
+    """
+    fd = os.open(path, os.O_RDONLY | getattr(os, 'O_CLOEXEC', 0) | getattr(os, 'O_BINARY', 0))
+    try:
+        chunks = [os.read(fd, size or _READ_CHUNK)]
+        # Keep going until EOF: short reads happen, and the file may have grown.
+        while chunks[-1]:
+            chunks.append(os.read(fd, _READ_CHUNK))
+    finally:
+        os.close(fd)
+    text = b''.join(chunks).decode('utf-8')
+    if '\r' in text:
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+    return text
+
+
 def _iter_child_nodes(node):
     """Yield the immediate AST-node children of `node` (through lists and dicts)."""
-    for value in vars(node).values():
-        if isinstance(value, ASTNode):
-            yield value
-        elif isinstance(value, list):
-            for item in value:
-                if isinstance(item, ASTNode):
-                    yield item
-        elif isinstance(value, dict):
-            for item in value.values():
-                if isinstance(item, ASTNode):
-                    yield item
+    return iter(child_nodes(node))
@@ -6,12 +6,18 @@ Will be used mostly as a better access point for checks / compiled code parsing.
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple, Union
 
-from spice.parser.ast_nodes import ClassDeclaration, FunctionDeclaration, InterfaceDeclaration, Parameter, ASTNode, TypeParameter
+from spice.utils.compat import DATACLASS_SLOTS
+from spice.parser.ast_nodes import ClassDeclaration, DataClassDeclaration, EnumDeclaration, FunctionDeclaration, InterfaceDeclaration, Parameter, ASTNode, TypeParameter
 
+# Scopes are keyed by the path of enclosing declaration names, e.g.
+# ("Stack", "push") for a method or ("outer", "inner") for a nested function.
+ScopeKey = Tuple[str, ...]
+GLOBAL_SCOPE: ScopeKey = ()
 
-@dataclass
+
+@dataclass(**DATACLASS_SLOTS)
 class VariableSymbol:
     name: str
     type_annotation: Optional[str]
@@ -22,29 +28,31 @@ class VariableSymbol:
     generic_bindings: Dict[str, str] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class FunctionSymbol:
     name: str
     params: List[Parameter]
     return_type: Optional[str]
     node: FunctionDeclaration
-    scope: str
+    scope: ScopeKey
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class ScopeSymbol:
-    name: str
-    parent: Optional[str]
+    name: ScopeKey
+    parent: Optional[ScopeKey]
     variables: Dict[str, VariableSymbol] = field(default_factory=dict)
     functions: Dict[str, List[FunctionSymbol]] = field(default_factory=dict)
+    # Nested scopes by their last key component
+    children: Dict[str, "ScopeSymbol"] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class ClassSymbol:
     name: str
-    node: ClassDeclaration
+    node: Union[ClassDeclaration, DataClassDeclaration, EnumDeclaration]
     methods: Dict[str, List[FunctionSymbol]] = field(default_factory=dict)
-    scope: str = "global"
+    scope: ScopeKey = GLOBAL_SCOPE
     # Generics
     type_parameters: List[str] = field(default_factory=list)
 
@@ -53,28 +61,33 @@ class ClassSymbol:
         return len(self.type_parameters) > 0
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class InterfaceSymbol:
     name: str
     node: InterfaceDeclaration
-    scope: str = "global"
+    scope: ScopeKey = GLOBAL_SCOPE
 
 
 class SymbolTable:
     """Represents declarations discovered during parsing."""
 
+    __slots__ = ("scopes", "classes", "interfaces")
+
     def __init__(self) -> None:
-        self.scopes: Dict[str, ScopeSymbol] = {
-            "global": ScopeSymbol(name="global", parent=None)
+        self.scopes: Dict[ScopeKey, ScopeSymbol] = {
+            GLOBAL_SCOPE: ScopeSymbol(name=GLOBAL_SCOPE, parent=None)
         }
         self.classes: Dict[str, ClassSymbol] = {}
         self.interfaces: Dict[str, InterfaceSymbol] = {}
 
-    def ensure_scope(self, name: str, parent: Optional[str]) -> ScopeSymbol:
+    def ensure_scope(self, name: ScopeKey, parent: Optional[ScopeKey]) -> ScopeSymbol:
         scope = self.scopes.get(name)
         if scope is None:
             scope = ScopeSymbol(name=name, parent=parent)
             self.scopes[name] = scope
+            parent_scope = self.scopes.get(parent) if parent is not None else None
+            if parent_scope is not None and name:
+                parent_scope.children[name[-1]] = scope
         return scope
 
     def ancestors(self, name: str, _seen: Optional[set] = None) -> set:
@@ -1,11 +1,24 @@
 """Tokenizer for Spice (Static Python) language."""
 
 import re
-from typing import List
+import sys
+from typing import ClassVar, Dict, List, Optional, Pattern, Tuple
 from spice.lexer.follow_set import check, IllegalFollow
 from spice.lexer.tokens import Token, TokenType
 
-from spice.printils import lexer_log
+from spice.printils import is_logging, lexer_log
+
+
+# Token types whose text is free-form (literals, comments) rather than a name or operator
+_UNINTERNED_TOKENS = frozenset({
+    TokenType.COMMENT,
+    TokenType.NUMBER,
+    TokenType.STRING,
+    TokenType.FSTRING,
+    TokenType.RSTRING,
+    TokenType.FRSTRING,
+    TokenType.REGEX,
+})
 
 
 class Lexer:
@@ -144,26 +157,48 @@ class Lexer:
         (r'[a-zA-Z_][a-zA-Z0-9_]*', TokenType.IDENTIFIER),
     ]
 
-    def __init__(self):
-        self.patterns = [(re.compile(pattern, re.MULTILINE), token_type) for pattern, token_type in self.TOKEN_PATTERNS]
+    # TOKEN_PATTERNS compiled once per process and shared by every Lexer
+    _compiled_patterns: ClassVar[Optional[List[Tuple[Pattern[str], TokenType]]]] = None
+
+    def __init__(self) -> None:
+        patterns = Lexer._compiled_patterns
+        if patterns is None:
+            patterns = Lexer._compiled_patterns = [
+                (re.compile(pattern, re.MULTILINE), token_type) for pattern, token_type in self.TOKEN_PATTERNS
+            ]
+        self.patterns = patterns
         self.errors: list[IllegalFollow] = []
+        # Whether lexer_log outputs anything; refreshed per tokenize() so the
+        # per-token log calls skip building their messages when it doesn't
+        self.verbose = is_logging(lexer_log)
 
     def tokenize(self, source: str) -> List[Token]:
         """Tokenize source code into a list of tokens."""
-        lexer_log.info(f"Starting tokenization of source code ({len(source)} characters)")
-        lexer_log.debug(f"Source code:\n{source}")
+        self.errors = []
+        self.verbose = is_logging(lexer_log)
+        if self.verbose:
+            lexer_log.info(f"Starting tokenization of source code ({len(source)} characters)")
+            lexer_log.debug(f"Source code:\n{source}")
 
-        tokens = []
+        tokens: List[Token] = []
         lines = source.split('\n')
 
-        lexer_log.info(f"Processing {len(lines)} lines of code")
+        if self.verbose:
+            lexer_log.info(f"Processing {len(lines)} lines of code")
 
         for line_num, line in enumerate(lines, 1):
             self._tokenize_line(line, line_num, tokens)
 
         # Add EOF token
         tokens.append(Token(TokenType.EOF, None, len(lines), 0))
-        token_types = {}
+        if self.verbose:
+            self._log_summary(tokens)
+
+        return tokens
+
+    def _log_summary(self, tokens: List[Token]) -> None:
+        """Log the token count, type distribution and first tokens of a finished tokenize()."""
+        token_types: Dict[str, int] = {}
         for token in tokens:
             if token.type != TokenType.COMMENT and token.type != TokenType.NEWLINE:
                 token_types[token.type.name] = token_types.get(token.type.name, 0) + 1
@@ -177,8 +212,6 @@ class Lexer:
         else:
             lexer_log.debug("All tokens: " + ', '.join(f"{token.type.name}({token.value})" for token in tokens if token.type != TokenType.COMMENT))
 
-        return tokens
-
     def _tokenize_line(self, line: str, line_num: int, tokens: List[Token]):
         """Tokenize a single line."""
         column = 0
@@ -190,13 +223,14 @@ class Lexer:
             if indent:
                 # TODO: Proper indent/dedent handling
                 column = len(indent)
-                if len(indent) > 0:
+                if len(indent) > 0 and self.verbose:
                     lexer_log.info(f"Line {line_num}: Found indentation of {len(indent)} spaces")
 
         # Skip empty lines
         if not line.strip():
             tokens.append(Token(TokenType.NEWLINE, '\\\\n', line_num, column))
-            lexer_log.info(f"Line {line_num}: Empty line, added NEWLINE token")
+            if self.verbose:
+                lexer_log.info(f"Line {line_num}: Empty line, added NEWLINE token")
             return
 
         # Tokenize the rest of the line
@@ -221,17 +255,24 @@ class Lexer:
                     else:
                         value = match.group(0)
 
+                    # Identifiers, keywords and operators end up as AST names, operators
+                    # and symbol-table keys; share one string object per spelling across
+                    # every file of the build. Literal text is left as is.
+                    if token_type not in _UNINTERNED_TOKENS:
+                        value = sys.intern(value)
+
                     # Handle keywords vs identifiers
                     if token_type == TokenType.IDENTIFIER and value in self.KEYWORDS:
                         token_type = self.KEYWORDS[value]
-                        lexer_log.info(f"Line {line_num}, Column {pos}: Identified keyword '{value}' as {token_type.name}")
-                    elif token_type != TokenType.COMMENT:
+                        if self.verbose:
+                            lexer_log.info(f"Line {line_num}, Column {pos}: Identified keyword '{value}' as {token_type.name}")
+                    elif token_type != TokenType.COMMENT and self.verbose:
                         lexer_log.info(f"Line {line_num}, Column {pos}: Matched '{value}' as {token_type.name}")
 
                     # Skip comments
                     if token_type != TokenType.COMMENT:
                         tokens.append(Token(token_type, value, line_num, pos))
-                    else:
+                    elif self.verbose:
                         lexer_log.info(f"Line {line_num}, Column {pos}: Skipping comment")
 
                     # Check for illegal follows
@@ -251,5 +292,5 @@ class Lexer:
 
         # Add newline token at end of non-empty lines
         tokens.append(Token(TokenType.NEWLINE, '\\\\n', line_num, len(line)))
-        if len(tokens) > 1 and tokens[-2].type != TokenType.NEWLINE:
+        if self.verbose and len(tokens) > 1 and tokens[-2].type != TokenType.NEWLINE:
             lexer_log.info(f"Line {line_num}: Added NEWLINE token at end of line")
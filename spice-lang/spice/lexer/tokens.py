@@ -4,6 +4,8 @@ from enum import Enum, auto
 from dataclasses import dataclass
 from typing import Any, Optional, Union
 
+from spice.utils.compat import DATACLASS_SLOTS
+
 
 class TokenType(Enum):
     """Token types for Spice language."""
@@ -116,7 +118,7 @@ class TokenType(Enum):
     BOOLEAN = auto()
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class Token:
     """Represents a token in the source code."""
     type: TokenType
@@ -1,39 +1,77 @@
 """AST node definitions for Spice language."""
 
-from dataclasses import dataclass, field
-from typing import List, Optional, Any, Dict
-from abc import ABC, abstractmethod
+import re
+from dataclasses import Field, dataclass, field, fields
+from typing import ClassVar, FrozenSet, List, Optional, Any, Dict, Sequence, Tuple
+from enum import Enum, IntFlag
 
+from spice.utils.compat import DATACLASS_SLOTS
 
-class ASTNode(ABC):
-    """Base class for all AST nodes."""
 
-    @abstractmethod
-    def accept(self, visitor):
-        """Accept a visitor for traversal."""
-        pass
-
-    @abstractmethod
-    def __str__(self) -> str:
-        pass
+class ASTNode:
+    """Base class for all AST nodes.
 
+    A plain class rather than an ABC: every node class defines __str__ anyway,
+    and under ABCMeta each `isinstance(x, ASTNode)` (done for every field of
+    every node by the tree walkers) goes through __instancecheck__.
+    """
 
-@dataclass
+    # Nodes are slotted dataclasses (see DATACLASS_SLOTS); an empty base slot
+    # list keeps a per-instance __dict__ from coming back through inheritance.
+    __slots__ = ()
+
+    # Fields that are usually empty (annotations, flags, bases, type parameters)
+    # default to a shared () instead of a fresh list per node; code that adds
+    # to one assigns a new list rather than appending.
+
+    # Filled in per class at the bottom of this module:
+    # the dataclass init fields (cached `fields(cls)`), the names of those that
+    # can hold child nodes (directly, or inside a list/dict), and the name of
+    # the class's visitor method ("visit_<ClassName>").
+    _ast_fields: ClassVar[Tuple[Field, ...]] = ()
+    _ast_children: ClassVar[Tuple[str, ...]] = ()
+    _visit_name: ClassVar[str] = ""
+
+    def accept(self, visitor):
+        """Accept a visitor for traversal: calls its visit_<ClassName> method."""
+        return getattr(visitor, self._visit_name)(self)
+
+    def __str__(self) -> str:
+        """One-line summary; child statement lists are shown as counts (see `dump`)."""
+        raise NotImplementedError(f"{type(self).__name__} does not define __str__")
+
+    def dump(self, indent: int = 0) -> str:
+        """Recursive multi-line rendering of this node and everything under it."""
+        pad = "  " * indent
+        lines = [f"{pad}{type(self).__name__}("]
+        for f in self._ast_fields:
+            value = getattr(self, f.name)
+            if isinstance(value, ASTNode):
+                lines.append(f"{pad}  {f.name}=")
+                lines.append(value.dump(indent + 2))
+            elif isinstance(value, (list, tuple, dict)) and any(isinstance(item, ASTNode) for item in _items(value)):
+                lines.append(f"{pad}  {f.name}=[")
+                lines.extend(
+                    item.dump(indent + 2) if isinstance(item, ASTNode) else f"{pad}    {item!r}"
+                    for item in _items(value)
+                )
+                lines.append(f"{pad}  ]")
+            else:
+                lines.append(f"{pad}  {f.name}={value!r}")
+        lines.append(f"{pad})")
+        return "\n".join(lines)
+
+
+@dataclass(**DATACLASS_SLOTS)
 class Module(ASTNode):
     """Root node representing a .spc file."""
     body: List[ASTNode]
 
-    def accept(self, visitor):
-        return visitor.visit_Module(self)
-
     def __str__(self) -> str:
-        ret = "Module: "
-        for stmt in self.body:
-            ret += f"\n  {stmt}"
-        return ret
+        return f"Module: {len(self.body)} statements"
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class Annotation(ASTNode):
     """An annotation applied to a declaration.
 
@@ -48,281 +86,298 @@ class Annotation(ASTNode):
     line: int = 0
     column: int = 0
 
-    def accept(self, visitor):
-        return visitor.visit_Annotation(self)
-
     def __str__(self) -> str:
         suffix = "()" if self.is_call else ""
         return f"Annotation(name={self.name}{suffix}, retention={self.retention}, args={self.args}, kwargs={self.kwargs})"
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class RawCode(ASTNode):
     """A block of directly injected code (either by tools / processors etc.)"""
     code: str
     line: int = 0
     column: int = 0
 
-    def accept(self, visitor):
-        return visitor.visit_RawCode(self)
-
     def __str__(self) -> str:
         return f"RawCode({self.code!r})"
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class InterfaceDeclaration(ASTNode):
     """Interface declaration node."""
     name: str
     methods: List['MethodSignature']
-    base_interfaces: List[str] = field(default_factory=list)
-    annotations: List["Annotation"] = field(default_factory=list)
+    base_interfaces: Sequence[str] = ()
+    annotations: Sequence["Annotation"] = ()
     line: int = 0
     column: int = 0
 
-    def accept(self, visitor):
-        return visitor.visit_InterfaceDeclaration(self)
-
     def __str__(self) -> str:
-        ret = f"InterfaceDeclaration(name={self.name}, methods=["
-        ret += ", ".join(f"{method}" for method in self.methods)
-        ret += f"], base_interfaces={self.base_interfaces})"
-        return ret
+        methods = ", ".join(f"{method}" for method in self.methods)
+        return f"InterfaceDeclaration(name={self.name}, methods=[{methods}], base_interfaces={self.base_interfaces})"
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class MethodSignature(ASTNode):
     """Method signature in an interface."""
     name: str
     params: List['Parameter']
     return_type: Optional[str] = None
-    annotations: List["Annotation"] = field(default_factory=list)
+    annotations: Sequence["Annotation"] = ()
     line: int = 0
     column: int = 0
 
-    def accept(self, visitor):
-        return visitor.visit_MethodSignature(self)
-
     def __str__(self) -> str:
-        ret = f"MethodSignature(name={self.name}, params=["
-        ret += ", ".join(f"{param}" for param in self.params)
-        ret += f"], return_type={self.return_type})"
-        return ret
+        params = ", ".join(f"{param}" for param in self.params)
+        return f"MethodSignature(name={self.name}, params=[{params}], return_type={self.return_type})"
+
+
+class _NoDefault(Enum):
+    """Type of NO_DEFAULT (an enum member, so it stays one object through pickling)."""
+    NO_DEFAULT = 0
+
+    def __repr__(self) -> str:
+        return "NO_DEFAULT"
 
+    __str__ = __repr__
 
-@dataclass
+
+# Parameter.default of a parameter without one (None can't mean that: `x = None` is a default)
+NO_DEFAULT = _NoDefault.NO_DEFAULT
+
+
+@dataclass(**DATACLASS_SLOTS)
 class Parameter(ASTNode):
     """Function/method parameter."""
     name: str
     type_annotation: Optional[str] = None
-    default: Optional[Any] = None
-    annotations: List["Annotation"] = field(default_factory=list)
-
-    def accept(self, visitor):
-        return visitor.visit_Parameter(self)
+    default: Any = NO_DEFAULT  # Python source of the default value
+    annotations: Sequence["Annotation"] = ()
 
     def __str__(self) -> str:
         return f"Parameter(name={self.name}, type_annotation={self.type_annotation}, default={self.default})"
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class TypeParameter(ASTNode):
     """Type parameter for generics: <T extends Bound>."""
     name: str
     bound: Optional[str] = None  # Upper bound constraint
-    annotations: List["Annotation"] = field(default_factory=list)
+    annotations: Sequence["Annotation"] = ()
     line: int = 0
     column: int = 0
 
-    def accept(self, visitor):
-        return visitor.visit_TypeParameter(self)
-
     def __str__(self) -> str:
         bound_str = f" extends {self.bound}" if self.bound else ""
         return f"TypeParameter(name={self.name}{bound_str})"
 
 
-@dataclass
+class Modifier(IntFlag):
+    """Declaration modifier keywords, packed into one int per class/function node."""
+    STATIC = 1 << 0
+    ABSTRACT = 1 << 1
+    FINAL = 1 << 2
+
+
+@dataclass(**DATACLASS_SLOTS)
 class ClassDeclaration(ASTNode):
     """Class declaration with modifiers."""
     name: str
     body: List[ASTNode]
-    type_parameters: List[TypeParameter] = field(default_factory=list)
-    bases: List[str] = field(default_factory=list)
-    interfaces: List[str] = field(default_factory=list)
-    is_abstract: bool = False
-    is_final: bool = False
-    compiler_flags: List[str] = field(default_factory=list)
-    annotations: List["Annotation"] = field(default_factory=list)
+    type_parameters: Sequence[TypeParameter] = ()
+    bases: Sequence[str] = ()
+    interfaces: Sequence[str] = ()
+    modifiers: int = 0  # Modifier bits
+    compiler_flags: Sequence[str] = ()
+    annotations: Sequence["Annotation"] = ()
     line: int = 0
     column: int = 0
 
-    def accept(self, visitor):
-        return visitor.visit_ClassDeclaration(self)
+    @property
+    def is_abstract(self) -> bool:
+        return bool(self.modifiers & Modifier.ABSTRACT)
+
+    @property
+    def is_final(self) -> bool:
+        return bool(self.modifiers & Modifier.FINAL)
 
     def __str__(self) -> str:
-        ret = f"ClassDeclaration(name={self.name}, bases={self.bases}, interfaces={self.interfaces}, "
-        ret += f"is_abstract={self.is_abstract}, is_final={self.is_final}, compiler_flags={self.compiler_flags})"
-        return ret
+        return (
+            f"ClassDeclaration(name={self.name}, bases={self.bases}, interfaces={self.interfaces}, "
+            f"is_abstract={self.is_abstract}, is_final={self.is_final}, compiler_flags={self.compiler_flags})"
+        )
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class FunctionDeclaration(ASTNode):
     """Function/method declaration."""
     name: str
     params: List[Parameter]
     body: Optional[List[ASTNode]] = None
     return_type: Optional[str] = None
-    type_parameters: List[TypeParameter] = field(default_factory=list)
-    is_static: bool = False
-    is_abstract: bool = False
-    is_final: bool = False
-    decorators: List[str] = field(default_factory=list)
-    compiler_flags: List[str] = field(default_factory=list)
-    annotations: List["Annotation"] = field(default_factory=list)
+    type_parameters: Sequence[TypeParameter] = ()
+    modifiers: int = 0  # Modifier bits
+    decorators: Sequence[str] = ()
+    compiler_flags: Sequence[str] = ()
+    annotations: Sequence["Annotation"] = ()
     line: int = 0
     column: int = 0
 
-    def accept(self, visitor):
-        return visitor.visit_FunctionDeclaration(self)
+    @property
+    def is_static(self) -> bool:
+        return bool(self.modifiers & Modifier.STATIC)
+
+    @property
+    def is_abstract(self) -> bool:
+        return bool(self.modifiers & Modifier.ABSTRACT)
+
+    @property
+    def is_final(self) -> bool:
+        return bool(self.modifiers & Modifier.FINAL)
 
     def __str__(self) -> str:
-        ret = f"FunctionDeclaration(name={self.name}, params=["
-        ret += ", ".join(f"{param}" for param in self.params)
-        ret += f"], body={self.body}, return_type={self.return_type}, "
-        ret += f"is_static={self.is_static}, is_abstract={self.is_abstract}, is_final={self.is_final}, "
-        ret += f"decorators={self.decorators}, compiler_flags={self.compiler_flags})"
-        return ret
+        params = ", ".join(f"{param}" for param in self.params)
+        body = f"{len(self.body)} statements" if self.body is not None else None
+        return (
+            f"FunctionDeclaration(name={self.name}, params=[{params}], body={body}, return_type={self.return_type}, "
+            f"is_static={self.is_static}, is_abstract={self.is_abstract}, is_final={self.is_final}, "
+            f"decorators={self.decorators}, compiler_flags={self.compiler_flags})"
+        )
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class BlockStatement(ASTNode):
     """Block statement using curly braces."""
     statements: List[ASTNode]
 
-    def accept(self, visitor):
-        return visitor.visit_BlockStatement(self)
-
     def __str__(self) -> str:
-        ret = "BlockStatement: "
-        for stmt in self.statements:
-            ret += f"\n  {stmt}"
-        return ret
+        return f"BlockStatement: {len(self.statements)} statements"
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class ExpressionStatement(ASTNode):
     """Expression statement (possibly with semicolon)."""
     expression: Optional[ASTNode]
     has_semicolon: bool = False
 
-    def accept(self, visitor):
-        return visitor.visit_ExpressionStatement(self)
-
     def __str__(self) -> str:
         return f"ExpressionStatement(expression={self.expression}, has_semicolon={self.has_semicolon})"
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class PassStatement(ASTNode):
     """Pass statement."""
     has_semicolon: bool = False
 
-    def accept(self, visitor):
-        return visitor.visit_PassStatement(self)
-
     def __str__(self) -> str:
         return f"PassStatement(has_semicolon={self.has_semicolon})"
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class ReturnStatement(ASTNode):
     """Return statement."""
     value: Optional["Expression"] = None
     has_semicolon: bool = False
 
-    def accept(self, visitor):
-        return visitor.visit_ReturnStatement(self)
-
     def __str__(self) -> str:
         return f"ReturnStatement(value={self.value}, has_semicolon={self.has_semicolon})"
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class IfStatement(ASTNode):
     """If statement."""
     condition: "Expression"
     then_body: List[ASTNode]
     else_body: List[ASTNode] = field(default_factory=list)
 
-    def accept(self, visitor):
-        return visitor.visit_IfStatement(self)
-
     def __str__(self) -> str:
-        return f"IfStatement(condition={self.condition}, then_body={self.then_body}, else_body={self.else_body})"
+        return (
+            f"IfStatement(condition={self.condition}, then_body={len(self.then_body)} statements, "
+            f"else_body={len(self.else_body)} statements)"
+        )
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class ForStatement(ASTNode):
     """For statement."""
     target: "Expression"
     body: List[ASTNode]
 
-    def accept(self, visitor):
-        return visitor.visit_ForStatement(self)
-
     def __str__(self) -> str:
-        return f"ForStatement(target={self.target}, body={self.body})"
+        return f"ForStatement(target={self.target}, body={len(self.body)} statements)"
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class WhileStatement(ASTNode):
     """While statement."""
     condition: "Expression"
     body: List[ASTNode]
 
-    def accept(self, visitor):
-        return visitor.visit_WhileStatement(self)
-
     def __str__(self) -> str:
-        return f"WhileStatement(condition={self.condition}, body={self.body})"
+        return f"WhileStatement(condition={self.condition}, body={len(self.body)} statements)"
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class SwitchStatement(ASTNode):
     """Switch statement."""
     expression: "Expression"
-    cases: List[ASTNode]
+    cases: List["CaseClause"]
     default: List[ASTNode] = field(default_factory=list)
-
-    def accept(self, visitor):
-        return visitor.visit_SwitchStatement(self)
+    # Filled by resolve(): constant case value -> first case body with it, and
+    # whether every case value is a constant
+    _literal_map: Optional[Dict[Any, list]] = field(default=None, init=False, repr=False, compare=False)
+    _all_literal: bool = field(default=False, init=False, repr=False, compare=False)
+
+    def resolve(self, value: Any) -> Optional[List[ASTNode]]:
+        """The statements this switch runs when its subject is the constant `value`.
+
+        That is the body of the first case equal to `value`, else `default`.
+        The case values are indexed on the first call, so later calls are one
+        dict lookup. Returns None when a non-constant case could still match.
+        """
+        if self._literal_map is None:
+            from spice.parser.constant_folding import NOT_CONSTANT, constant_value
+            literal_map: Dict[Any, list] = {}
+            self._all_literal = True
+            for case in self.cases:
+                key = constant_value(case.value)
+                if key is NOT_CONSTANT:
+                    # Cases after this one only apply if it doesn't match at runtime
+                    self._all_literal = False
+                    break
+                literal_map.setdefault(key, case.body)
+            self._literal_map = literal_map
+
+        body = self._literal_map.get(value)
+        if body is not None:
+            return body
+        return self.default if self._all_literal else None
 
     def __str__(self) -> str:
-        return f"SwitchStatement(expression={self.expression}, cases={self.cases}, default={self.default})"
+        return (
+            f"SwitchStatement(expression={self.expression}, cases={len(self.cases)} cases, "
+            f"default={len(self.default)} statements)"
+        )
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class CaseClause(ASTNode):
     """Case clause in a switch statement."""
     value: "Expression"
     body: List[ASTNode]
 
-    def accept(self, visitor):
-        return visitor.visit_CaseClause(self)
-
     def __str__(self) -> str:
-        return f"CaseClause(value={self.value}, body={self.body})"
+        return f"CaseClause(value={self.value}, body={len(self.body)} statements)"
 
 
 # Expression nodes
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class Expression(ASTNode):
     """Base class for expressions."""
     pass
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class AssignmentExpression(Expression):
     """
     Unified assignment expression supporting:
@@ -338,9 +393,6 @@ class AssignmentExpression(Expression):
     line: int = 0
     column: int = 0
 
-    def accept(self, visitor):
-        return visitor.visit_AssignmentExpression(self)
-
     def __str__(self) -> str:
         return (
             f"AssignmentExpression(target={self.target}, value={self.value}, "
@@ -348,202 +400,164 @@ class AssignmentExpression(Expression):
         )
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class IdentifierExpression(Expression):
     """Identifier expression."""
     name: str
 
-    def accept(self, visitor):
-        return visitor.visit_IdentifierExpression(self)
-
     def __str__(self) -> str:
         return f"IdentifierExpression(name={self.name})"
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class AttributeExpression(Expression):
     """Attribute access: object.attribute."""
     object: Expression
     attribute: str
 
-    def accept(self, visitor):
-        return visitor.visit_AttributeExpression(self)
-
     def __str__(self) -> str:
         return f"AttributeExpression(object={self.object}, attribute={self.attribute})"
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class LiteralExpression(Expression):
     """Literal value (string, number, etc.)."""
     value: Any
     literal_type: str  # 'string', 'number', 'boolean', etc.
-
-    def accept(self, visitor):
-        return visitor.visit_LiteralExpression(self)
+    # True when the parser computed this literal from a constant expression
+    # (`1 + 2`) rather than reading it from the source
+    folded: bool = field(default=False, init=False, repr=False, compare=False)
 
     def __str__(self) -> str:
         return f"LiteralExpression(value={self.value}, literal_type={self.literal_type})"
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class CallExpression(Expression):
     """Function or method call: callee(args)."""
     callee: Expression
     arguments: List[Expression]
 
-    def accept(self, visitor):
-        return visitor.visit_CallExpression(self)
-
     def __str__(self) -> str:
         return f"CallExpression(callee={self.callee}, arguments={self.arguments})"
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class ArgumentExpression(Expression):
     """Argument in a function call."""
     name: Optional[str] = None
     value: Optional[Expression] = None
 
-    def accept(self, visitor):
-        return visitor.visit_ArgumentExpression(self)
-
     def __str__(self) -> str:
         return f"ArgumentExpression(name={self.name}, value={self.value})"
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class LogicalExpression(Expression):
     """Logical expression: left and/or right."""
     operator: str  # 'and' or 'or'
     left: Expression
     right: Expression
 
-    def accept(self, visitor):
-        return visitor.visit_LogicalExpression(self)
-
     def __str__(self) -> str:
         return f"LogicalExpression(operator={self.operator}, left={self.left}, right={self.right})"
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class UnaryExpression(Expression):
     """Unary expression: not operand."""
     operator: str  # 'not'
     operand: Expression
 
-    def accept(self, visitor):
-        return visitor.visit_UnaryExpression(self)
-
     def __str__(self) -> str:
         return f"UnaryExpression(operator={self.operator}, operand={self.operand})"
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class BinaryExpression(Expression):
     """Binary expression: left operator right."""
     operator: str  # '+', '-', '*', '/'...
     left: Expression
     right: Expression
 
-    def accept(self, visitor):
-        return visitor.visit_BinaryExpression(self)
-
     def __str__(self) -> str:
         return f"BinaryExpression(operator={self.operator}, left={self.left}, right={self.right})"
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class LambdaExpression(Expression):
     """Lambda expression: (params) => body."""
     params: List[Parameter]
     body: Expression
     return_type: Optional[str] = None
 
-    def accept(self, visitor):
-        return visitor.visit_LambdaExpression(self)
-
     def __str__(self) -> str:
         return f"LambdaExpression(params={self.params}, body={self.body}, return_type={self.return_type})"
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class RaiseStatement(ASTNode):
     """Raise statement for exceptions."""
     exception: Optional["Expression"] = None
     has_semicolon: bool = False
 
-    def accept(self, visitor):
-        return visitor.visit_RaiseStatement(self)
-
     def __str__(self) -> str:
         return f"RaiseStatement(exception={self.exception}, has_semicolon={self.has_semicolon})"
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class ImportStatement(ASTNode):
     """Import statement: import module or from module import names."""
     module: str
-    names: List[str] = field(default_factory=list)  # Empty for 'import module'
-    aliases: List[Optional[str]] = field(default_factory=list)  # For 'as' aliases
+    # (name, 'as' alias or None) per imported name; empty for 'import module'
+    imports: Sequence[Tuple[str, Optional[str]]] = ()
+    alias: Optional[str] = None  # 'import module as alias'
     is_from_import: bool = False
     has_semicolon: bool = False
 
-    def accept(self, visitor):
-        return visitor.visit_ImportStatement(self)
-
     def __str__(self) -> str:
         ret = (
             "ImportStatement: \n"
             f"    module: {self.module},\n"
-            f"    names: {self.names},\n"
-            f"    aliases: {self.aliases},\n"
+            f"    imports: {self.imports},\n"
+            f"    alias: {self.alias},\n"
             f"    is_from_import: {self.is_from_import}"
         )
         return ret
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class DictEntry(Expression):
     """Dictionary key-value pair."""
     key: Expression
     value: Expression
 
-    def accept(self, visitor):
-        return visitor.visit_DictEntry(self)
-
     def __str__(self) -> str:
         return f"DictEntry(key={self.key}, value={self.value})"
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class SubscriptExpression(Expression):
     """Subscript expression: object[index] or object[slice]."""
     object: Expression
     index: Expression  # Can be a simple expression or SliceExpression
 
-    def accept(self, visitor):
-        return visitor.visit_SubscriptExpression(self)
-
     def __str__(self) -> str:
         return f"SubscriptExpression(object={self.object}, index={self.index})"
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class SliceExpression(Expression):
     """Slice expression: start:stop:step."""
     start: Optional[Expression] = None
     stop: Optional[Expression] = None
     step: Optional[Expression] = None
 
-    def accept(self, visitor):
-        return visitor.visit_SliceExpression(self)
-
     def __str__(self) -> str:
         return f"SliceExpression(start={self.start}, stop={self.stop}, step={self.step})"
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class ComprehensionExpression(Expression):
     """Comprehension expression: [expr for target in iter if condition]"""
     element: Expression
@@ -553,81 +567,136 @@ class ComprehensionExpression(Expression):
     comp_type: str = 'generator'
     key: Optional[Expression] = None
 
-    def accept(self, visitor):
-        return visitor.visit_ComprehensionExpression(self)
-
     def __str__(self) -> str:
         return (f"ComprehensionExpression(element={self.element}, target={self.target}, "
                 f"iter={self.iter}, condition={self.condition}, comp_type={self.comp_type}, "
                 f"key={self.key})")
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class FinalDeclaration(ASTNode):
     """Final variable declaration that cannot be reassigned."""
     target: Expression
     value: Expression
     type_annotation: Optional[str] = None
 
-    def accept(self, visitor):
-        return visitor.visit_FinalDeclaration(self)
-
     def __str__(self) -> str:
         return (f"FinalDeclaration(target={self.target}, value={self.value}, "
                 f"type_annotation={self.type_annotation})")
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class DataClassDeclaration(ASTNode):
     """Data class declaration: data class Point(x: int, y: int);"""
     name: str
     fields: List[Parameter]  # Fields defined in parentheses
     body: List[ASTNode] = field(default_factory=list)  # Optional methods
-    type_parameters: List['TypeParameter'] = field(default_factory=list)
-    bases: List[str] = field(default_factory=list)
-    annotations: List["Annotation"] = field(default_factory=list)
+    type_parameters: Sequence['TypeParameter'] = ()
+    bases: Sequence[str] = ()
+    annotations: Sequence["Annotation"] = ()
     line: int = 0
     column: int = 0
 
-    def accept(self, visitor):
-        return visitor.visit_DataClassDeclaration(self)
-
     def __str__(self) -> str:
         type_params = f"<{', '.join(tp.name for tp in self.type_parameters)}>" if self.type_parameters else ""
         fields_str = ", ".join(str(f) for f in self.fields)
         return f"DataClassDeclaration(name={self.name}{type_params}, fields=[{fields_str}], body={len(self.body)} members)"
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class EnumMember(ASTNode):
     """Enum member: RED or EARTH(a, b)"""
     name: str
     args: List[Expression] = field(default_factory=list)  # Constructor arguments
-    annotations: List["Annotation"] = field(default_factory=list)
+    annotations: Sequence["Annotation"] = ()
     line: int = 0
     column: int = 0
 
-    def accept(self, visitor):
-        return visitor.visit_EnumMember(self)
-
     def __str__(self) -> str:
         args_str = f"({', '.join(str(a) for a in self.args)})" if self.args else ""
         return f"EnumMember(name={self.name}{args_str})"
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class EnumDeclaration(ASTNode):
     """Enum declaration: enum Color { RED, GREEN, BLUE }"""
     name: str
     members: List[EnumMember]
     body: List[ASTNode] = field(default_factory=list)  # Constructor and methods after semicolon
-    annotations: List["Annotation"] = field(default_factory=list)
+    annotations: Sequence["Annotation"] = ()
     line: int = 0
     column: int = 0
 
-    def accept(self, visitor):
-        return visitor.visit_EnumDeclaration(self)
-
     def __str__(self) -> str:
         members_str = ", ".join(m.name for m in self.members)
         return f"EnumDeclaration(name={self.name}, members=[{members_str}], body={len(self.body)} members)"
+
+
+def child_nodes(node: ASTNode) -> List[ASTNode]:
+    """The direct child nodes of `node`, in field order (looks inside list, tuple and dict fields)."""
+    children: List[ASTNode] = []
+    for name in node._ast_children:
+        value = getattr(node, name)
+        if isinstance(value, ASTNode):
+            children.append(value)
+        elif isinstance(value, (list, tuple)):
+            children.extend(item for item in value if isinstance(item, ASTNode))
+        elif isinstance(value, dict):
+            children.extend(item for item in value.values() if isinstance(item, ASTNode))
+    return children
+
+
+def _items(value):
+    """Elements of a list/tuple field, or values of a dict field."""
+    return value.values() if isinstance(value, dict) else value
+
+
+def _all_node_classes(base: type = ASTNode):
+    """Yield every (transitive) subclass of `base`."""
+    for cls in base.__subclasses__():
+        # A slotted dataclass is a new class; the one it replaced can linger
+        # in __subclasses__() until the garbage collector gets to it.
+        if cls.__module__ == __name__ and globals().get(cls.__qualname__) is not cls:
+            continue
+        yield cls
+        yield from _all_node_classes(cls)
+
+
+def _annotation_text(f: Field) -> str:
+    return f.type if isinstance(f.type, str) else repr(f.type)
+
+
+def _register_ast_children() -> None:
+    """Precompute `_ast_fields`, `_ast_children` and `_visit_name` for every node class.
+
+    A field counts as a child slot when its annotation mentions a node class
+    (`Expression`, `List[ASTNode]`, `Optional['Expression']`, ...) or is `Any`,
+    since literal collections store their element nodes in `value`.
+    """
+    names = "|".join(cls.__name__ for cls in _all_node_classes())
+    holds_nodes = re.compile(rf"\b(ASTNode|Any|{names})\b")
+    for cls in _all_node_classes():
+        cls._visit_name = f"visit_{cls.__name__}"
+        # init=False fields are state derived from the node, not part of the tree
+        cls._ast_fields = tuple(f for f in fields(cls) if f.init)
+        cls._ast_children = tuple(
+            f.name for f in cls._ast_fields
+            if holds_nodes.search(_annotation_text(f))
+        )
+
+
+_register_ast_children()
+
+
+def _body_container_types() -> FrozenSet[type]:
+    """Node classes with a `body` field holding a list of statements (possibly None)."""
+    return frozenset(
+        cls for cls in _all_node_classes()
+        for f in cls._ast_fields
+        if f.name == "body" and "List[" in _annotation_text(f)
+    )
+
+
+# Node types whose `body` is a statement list; `type(node) in BODY_CONTAINER_TYPES`
+# replaces `hasattr(node, "body") and isinstance(node.body, list)` probes.
+BODY_CONTAINER_TYPES: FrozenSet[type] = _body_container_types()
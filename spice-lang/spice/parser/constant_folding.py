@@ -0,0 +1,182 @@
+"""Constant folding for operator expressions, applied as the parser builds them.
+
+The parser creates operator nodes through make_binary / make_logical /
+make_unary. When every operand is a constant, the node is replaced by the
+computed LiteralExpression, so later passes never walk trees like
+`1 + 6 / 2 + 4 * 5`. Anything that can't be folded with the exact Python
+result (division by zero, mixed types, huge powers...) is left as written.
+
+A literal that stands in for a folded expression has `folded` set, so rules
+about what the user wrote (such as "literal assignments need no annotation")
+still see an expression there.
+"""
+
+import math
+import operator
+from typing import Any, Callable, Dict
+
+from spice.parser.ast_nodes import (
+    BinaryExpression, Expression, LiteralExpression, LogicalExpression, UnaryExpression,
+)
+
+
+_ARITHMETIC: Dict[str, Callable[[Any, Any], Any]] = {
+    '+': operator.add,
+    '-': operator.sub,
+    '*': operator.mul,
+    '/': operator.truediv,
+    '//': operator.floordiv,
+    '%': operator.mod,
+    '**': operator.pow,
+}
+
+_COMPARISON: Dict[str, Callable[[Any, Any], bool]] = {
+    '==': operator.eq,
+    '!=': operator.ne,
+    '<': operator.lt,
+    '>': operator.gt,
+    '<=': operator.le,
+    '>=': operator.ge,
+}
+
+# Literal kinds whose Python value is the literal's `value` as-is
+_SCALAR_TYPES = frozenset({'string', 'boolean', 'none'})
+
+# Larger exponents could build enormous ints at compile time; leave them to runtime
+_MAX_EXPONENT = 64
+
+# Ints past this size are left to runtime rather than written out as literals
+# (repr() of an int also refuses more than 4300 digits)
+_MAX_INT_BITS = 4096
+
+# Marks an operand that isn't a compile-time constant
+NOT_CONSTANT = object()
+
+
+def make_binary(op: str, left: Expression, right: Expression) -> Expression:
+    """BinaryExpression(op, left, right), folded to a literal when both sides are constants."""
+    folded = _fold_binary(op, constant_value(left), constant_value(right))
+    return _mark_folded(folded) if folded is not None else BinaryExpression(operator=op, left=left, right=right)
+
+
+def make_logical(op: str, left: Expression, right: Expression) -> Expression:
+    """LogicalExpression(op, left, right), short-circuited when `left` is a constant.
+
+    As in Python, `a and b` is `b` when `a` is truthy and `a` otherwise (and
+    the reverse for `or`), so only the left operand needs to be constant.
+    """
+    value = constant_value(left)
+    if value is not NOT_CONSTANT:
+        if op == 'and':
+            return _mark_folded(right if value else left)
+        if op == 'or':
+            return _mark_folded(left if value else right)
+    return LogicalExpression(operator=op, left=left, right=right)
+
+
+def make_unary(op: str, operand: Expression) -> Expression:
+    """UnaryExpression(op, operand), folded to a literal when the operand is constant."""
+    # `-<number>` is already how negative numbers are spelled
+    if not (op == '-' and _is_number(operand)):
+        value = constant_value(operand)
+        if value is not NOT_CONSTANT:
+            if op == 'not':
+                return _mark_folded(LiteralExpression(value=not value, literal_type='boolean'))
+            if op == '-' and _is_numeric(value):
+                folded = _number_literal(-value)
+                if folded is not None:
+                    return _mark_folded(folded)
+    return UnaryExpression(operator=op, operand=operand)
+
+
+def _mark_folded(expr: Expression) -> Expression:
+    """Flag `expr` as the result of folding, if it is a literal; returns it."""
+    if isinstance(expr, LiteralExpression):
+        expr.folded = True
+    return expr
+
+
+def _fold_binary(op: str, left: Any, right: Any):
+    if left is NOT_CONSTANT or right is NOT_CONSTANT:
+        return None
+
+    compare = _COMPARISON.get(op)
+    if compare is not None:
+        # Only compare like with like (no 1 == True, no str < int)
+        if not (_is_numeric(left) and _is_numeric(right)) and type(left) is not type(right):
+            return None
+        try:
+            return LiteralExpression(value=bool(compare(left, right)), literal_type='boolean')
+        except TypeError:
+            return None
+
+    arithmetic = _ARITHMETIC.get(op)
+    if arithmetic is None:
+        return None
+    if isinstance(left, str) and isinstance(right, str):
+        if op != '+':
+            return None
+        return LiteralExpression(value=left + right, literal_type='string')
+    if not (_is_numeric(left) and _is_numeric(right)):
+        return None
+    if op == '**' and abs(right) > _MAX_EXPONENT:
+        return None
+    try:
+        result = arithmetic(left, right)
+    except (ArithmeticError, ValueError):
+        return None
+    return _number_literal(result)
+
+
+def constant_value(expr: Expression) -> Any:
+    """The Python value of a constant expression, or NOT_CONSTANT."""
+    if isinstance(expr, LiteralExpression):
+        if expr.literal_type == 'number':
+            return _parse_number(str(expr.value))
+        if expr.literal_type in _SCALAR_TYPES:
+            return expr.value
+        return NOT_CONSTANT
+    # A negative number is `-` applied to a number literal
+    if isinstance(expr, UnaryExpression) and expr.operator == '-':
+        operand = expr.operand
+        if not (isinstance(operand, LiteralExpression) and operand.literal_type == 'number'):
+            return NOT_CONSTANT
+        value = _parse_number(str(operand.value))
+        return NOT_CONSTANT if value is NOT_CONSTANT else -value
+    return NOT_CONSTANT
+
+
+def _parse_number(text: str) -> Any:
+    try:
+        return float(text) if any(c in text for c in ".eE") else int(text)
+    except ValueError:
+        return NOT_CONSTANT
+
+
+def _number_literal(value: Any):
+    """A number literal for `value` (written as the lexer would), or None if it has no literal form."""
+    if not _is_numeric(value):
+        return None
+    if isinstance(value, float):
+        if not math.isfinite(value):
+            return None
+        # copysign also catches -0.0; it would overflow on a big int
+        negative = math.copysign(1.0, value) < 0
+    else:
+        if value.bit_length() > _MAX_INT_BITS:
+            return None
+        negative = value < 0
+    if negative:
+        literal = _number_literal(-value)
+        return None if literal is None else UnaryExpression(operator='-', operand=literal)
+    # repr() keeps floats recognisable as floats ("3.0", "1e+16")
+    return LiteralExpression(value=repr(value), literal_type='number')
+
+
+def _is_number(expr: Expression) -> bool:
+    return isinstance(expr, LiteralExpression) and expr.literal_type == 'number'
+
+
+def _is_numeric(value: Any) -> bool:
+    # bool is an int subclass, but True + 1 isn't something to fold
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
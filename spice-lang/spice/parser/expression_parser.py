@@ -1,19 +1,33 @@
 """Restructured expression parsing methods for the Spice parser."""
 
-from typing import Optional, List
-from spice.lexer import TokenType
+from typing import TYPE_CHECKING, Optional, List
+from spice.lexer import Token, TokenType
 from spice.parser.ast_nodes import (
-    Expression, AssignmentExpression, BinaryExpression, UnaryExpression,
-    LogicalExpression, CallExpression, AttributeExpression,
+    Expression, AssignmentExpression, CallExpression, AttributeExpression,
     IdentifierExpression, LiteralExpression, ArgumentExpression,
     SubscriptExpression, SliceExpression, ComprehensionExpression,
     DictEntry
 )
-from spice.printils import expression_parser_log
+from spice.parser.constant_folding import make_binary, make_logical, make_unary
+from spice.printils import expression_parser_log, is_logging
+
+if TYPE_CHECKING:
+    from spice.parser.parser import Parser
+
+
+# Compound assignment token -> operator; one dict probe per expression
+_COMPOUND_ASSIGN_OPS = {
+    TokenType.PLUSASSIGN: '+=',
+    TokenType.MINUSASSIGN: '-=',
+    TokenType.STARASSIGN: '*=',
+    TokenType.SLASHASSIGN: '/=',
+    TokenType.PERCENTASSIGN: '%=',
+    TokenType.DOUBLESTARASSIGN: '**=',
+    TokenType.DOUBLESLASHASSIGN: '//=',
+}
 
 
 class ExpressionParser:
-    from spice.parser.parser import Parser
     """
     Clean expression parser using recursive descent with explicit precedence levels.
 
@@ -32,8 +46,9 @@ class ExpressionParser:
     12. Primary (literals, identifiers, parentheses)
     """
 
-    def __init__(self, parser: Parser):
+    def __init__(self, parser: "Parser") -> None:
         self.parser = parser  # Reference to main parser for helper methods
+        self.verbose = is_logging(expression_parser_log)  # Refreshed by Parser.parse()
 
     # Main entry point
     def parse_expression(self, context="general") -> Optional[Expression]:
@@ -58,24 +73,14 @@ class ExpressionParser:
                                         line=op_token.line, column=op_token.column)
 
         # +=, -=, *=, /=, %=, **=, //=
-        compound_ops = {
-            TokenType.PLUSASSIGN: '+=',
-            TokenType.MINUSASSIGN: '-=',
-            TokenType.STARASSIGN: '*=',
-            TokenType.SLASHASSIGN: '/=',
-            TokenType.PERCENTASSIGN: '%=',
-            TokenType.DOUBLESTARASSIGN: '**=',
-            TokenType.DOUBLESLASHASSIGN: '//='
-        }
-
-        for token_type, op in compound_ops.items():
-            if self.parser.check(token_type):
-                op_token = self.parser.advance()
-                right = self.parse_assignment(context=context)
-                if right is None:
-                    self.parser.raise_parser_error(f"Expected expression after {op}")
-                return AssignmentExpression(target=expr, value=right, operator=op,
-                                            line=op_token.line, column=op_token.column)
+        op = _COMPOUND_ASSIGN_OPS.get(self.parser.peek().type)
+        if op is not None:
+            op_token = self.parser.advance()
+            right = self.parse_assignment(context=context)
+            if right is None:
+                self.parser.raise_parser_error(f"Expected expression after {op}")
+            return AssignmentExpression(target=expr, value=right, operator=op,
+                                        line=op_token.line, column=op_token.column)
 
         return expr
 
@@ -83,13 +88,15 @@ class ExpressionParser:
     def parse_logical_or(self, context="general") -> Optional[Expression]:
         """Parse logical OR expressions."""
         expr = self.parse_logical_and(context=context)
+        if expr is None:
+            return None
 
         while self.parser.match(TokenType.OR, advance_at_newline=True):
             op = self.parser.previous().value
             right = self.parse_logical_and(context=context)
             if right is None:
                 self.parser.raise_parser_error("Expected expression after 'or'")
-            expr = LogicalExpression(operator=op, left=expr, right=right)
+            expr = make_logical(op, expr, right)
 
         return expr
 
@@ -97,13 +104,15 @@ class ExpressionParser:
     def parse_logical_and(self, context="general") -> Optional[Expression]:
         """Parse logical AND expressions."""
         expr = self.parse_membership(context=context)
+        if expr is None:
+            return None
 
         while self.parser.match(TokenType.AND, advance_at_newline=True):
             op = self.parser.previous().value
             right = self.parse_membership(context=context)
             if right is None:
                 self.parser.raise_parser_error("Expected expression after 'and'")
-            expr = LogicalExpression(operator=op, left=expr, right=right)
+            expr = make_logical(op, expr, right)
 
         return expr
 
@@ -111,6 +120,8 @@ class ExpressionParser:
     def parse_membership(self, context="general") -> Optional[Expression]:
         """Parse membership tests (in, not in, is, is not)."""
         expr = self.parse_equality(context=context)
+        if expr is None:
+            return None
 
         while True:
             # in
@@ -118,7 +129,7 @@ class ExpressionParser:
                 right = self.parse_equality(context=context)
                 if right is None:
                     self.parser.raise_parser_error("Expected expression after 'in'")
-                expr = BinaryExpression(operator='in', left=expr, right=right)
+                expr = make_binary('in', expr, right)
 
             # not
             elif self.parser.match(TokenType.NOT) and self.parser.check(TokenType.IN):
@@ -126,7 +137,7 @@ class ExpressionParser:
                 right = self.parse_equality(context=context)
                 if right is None:
                     self.parser.raise_parser_error("Expected expression after 'not in'")
-                expr = BinaryExpression(operator='not in', left=expr, right=right)
+                expr = make_binary('not in', expr, right)
 
             # is
             elif self.parser.match(TokenType.IS):
@@ -134,12 +145,12 @@ class ExpressionParser:
                     right = self.parse_equality(context=context)
                     if right is None:
                         self.parser.raise_parser_error("Expected expression after 'is not'")
-                    expr = BinaryExpression(operator='is not', left=expr, right=right)
+                    expr = make_binary('is not', expr, right)
                 else:
                     right = self.parse_equality(context=context)
                     if right is None:
                         self.parser.raise_parser_error("Expected expression after 'is'")
-                    expr = BinaryExpression(operator='is', left=expr, right=right)
+                    expr = make_binary('is', expr, right)
 
             else:
                 break
@@ -150,6 +161,8 @@ class ExpressionParser:
     def parse_equality(self, context="general") -> Optional[Expression]:
         """Parse equality comparisons (==, !=)."""
         expr = self.parse_comparison(context=context)
+        if expr is None:
+            return None
 
         # ==, !=
         while self.parser.match(TokenType.EQUAL, TokenType.NOTEQUAL):
@@ -157,7 +170,7 @@ class ExpressionParser:
             right = self.parse_comparison(context=context)
             if right is None:
                 self.parser.raise_parser_error(f"Expected expression after '{op}'")
-            expr = BinaryExpression(operator=op, left=expr, right=right)
+            expr = make_binary(op, expr, right)
 
         return expr
 
@@ -165,6 +178,8 @@ class ExpressionParser:
     def parse_comparison(self, context="general") -> Optional[Expression]:
         """Parse comparison operators (<, >, <=, >=)."""
         expr = self.parse_addition(context=context)
+        if expr is None:
+            return None
 
         # <, >, <=, >=
         while self.parser.match(TokenType.LESS, TokenType.GREATER,
@@ -173,7 +188,7 @@ class ExpressionParser:
             right = self.parse_addition(context=context)
             if right is None:
                 self.parser.raise_parser_error(f"Expected expression after '{op}'")
-            expr = BinaryExpression(operator=op, left=expr, right=right)
+            expr = make_binary(op, expr, right)
 
         return expr
 
@@ -181,6 +196,8 @@ class ExpressionParser:
     def parse_addition(self, context="general") -> Optional[Expression]:
         """Parse addition and subtraction."""
         expr = self.parse_multiplication(context=context)
+        if expr is None:
+            return None
 
         # +, -
         while self.parser.match(TokenType.PLUS, TokenType.MINUS):
@@ -188,7 +205,7 @@ class ExpressionParser:
             right = self.parse_multiplication(context=context)
             if right is None:
                 self.parser.raise_parser_error(f"Expected expression after '{op}'")
-            expr = BinaryExpression(operator=op, left=expr, right=right)
+            expr = make_binary(op, expr, right)
 
         return expr
 
@@ -196,6 +213,8 @@ class ExpressionParser:
     def parse_multiplication(self, context="general") -> Optional[Expression]:
         """Parse multiplication, division, and modulo."""
         expr = self.parse_exponentiation(context=context)
+        if expr is None:
+            return None
 
         # *, /, %, //
         while self.parser.match(TokenType.STAR, TokenType.SLASH,
@@ -204,7 +223,7 @@ class ExpressionParser:
             right = self.parse_exponentiation(context=context)
             if right is None:
                 self.parser.raise_parser_error(f"Expected expression after '{op}'")
-            expr = BinaryExpression(operator=op, left=expr, right=right)
+            expr = make_binary(op, expr, right)
 
         return expr
 
@@ -212,6 +231,8 @@ class ExpressionParser:
     def parse_exponentiation(self, context="general") -> Optional[Expression]:
         """Parse exponentiation (**). Right associative!"""
         expr = self.parse_unary(context=context)
+        if expr is None:
+            return None
 
         # **
         if self.parser.match(TokenType.DOUBLESTAR):
@@ -220,7 +241,7 @@ class ExpressionParser:
             right = self.parse_exponentiation(context=context)
             if right is None:
                 self.parser.raise_parser_error("Expected expression after '**'")
-            return BinaryExpression(operator=op, left=expr, right=right)
+            return make_binary(op, expr, right)
 
         return expr
 
@@ -234,7 +255,7 @@ class ExpressionParser:
             expr = self.parse_unary(context=context)  # Allow chaining: not not x
             if expr is None:
                 self.parser.raise_parser_error("Expected expression after 'not'")
-            return UnaryExpression(operator=op, operand=expr)
+            return make_unary(op, expr)
 
         # -
         if self.parser.match(TokenType.MINUS):
@@ -242,7 +263,7 @@ class ExpressionParser:
             expr = self.parse_unary(context=context)
             if expr is None:
                 self.parser.raise_parser_error("Expected expression after '-'")
-            return UnaryExpression(operator=op, operand=expr)
+            return make_unary(op, expr)
 
         return self.parse_postfix()
 
@@ -258,18 +279,21 @@ class ExpressionParser:
 
             # alpha.beta
             if self.parser.match(TokenType.DOT):
-                expression_parser_log.info("Parsing postfix .")
+                if self.verbose:
+                    expression_parser_log.info("Parsing postfix .")
 
                 if not self.parser.check(TokenType.IDENTIFIER):
                     self.parser.raise_parser_error("Expected attribute name after '.'")
                 else:
-                    expression_parser_log.info("Found attribute: ", self.parser.peek().value)
+                    if self.verbose:
+                        expression_parser_log.info("Found attribute: ", self.parser.peek().value)
                 attr = self.parser.advance().value
                 expr = AttributeExpression(object=expr, attribute=attr)
 
             # alpha()
             elif self.parser.match(TokenType.LPAREN):
-                expression_parser_log.info("Parsing postfix ()")
+                if self.verbose:
+                    expression_parser_log.info("Parsing postfix ()")
 
                 # Function/method call
                 args = self.parse_arguments()
@@ -278,7 +302,8 @@ class ExpressionParser:
 
             # alpha[]
             elif self.parser.match(TokenType.LBRACKET):
-                expression_parser_log.info("Parsing postfix []")
+                if self.verbose:
+                    expression_parser_log.info("Parsing postfix []")
 
                 # Parse the index/slice expression
                 index_expr = self.parse_subscript_or_slice()
@@ -514,7 +539,7 @@ class ExpressionParser:
 
     def parse_arguments(self, context="general") -> List[Expression]:
         """Parse function call arguments."""
-        args = []
+        args: List[Expression] = []
 
         # Skip newlines after opening paren
         self.parser.skip_newlines()
@@ -558,7 +583,7 @@ class ExpressionParser:
         return args
 
     # TBI
-    def parse_lambda(self) -> Expression:
+    def parse_lambda(self, context="general") -> Expression:
         """Parse lambda expressions."""
         raise NotImplementedError("Lambda parsing not implemented yet")
 
@@ -621,15 +646,18 @@ class ExpressionParser:
         flag3: bool = self.parser.tokens[current_pos + 1].type == TokenType.COLON
 
         if not flag1:
-            expression_parser_log.info("Not enough tokens to form a dictionary entry")
+            if self.verbose:
+                expression_parser_log.info("Not enough tokens to form a dictionary entry")
             return False
 
         if not flag2:
-            expression_parser_log.info("Next token is not a valid dictionary key: ", self.parser.tokens[current_pos])
+            if self.verbose:
+                expression_parser_log.info("Next token is not a valid dictionary key: ", self.parser.tokens[current_pos])
             return False
 
         if not flag3:
-            expression_parser_log.info("Next token is not a colon after key: ", self.parser.tokens[current_pos + 1])
+            if self.verbose:
+                expression_parser_log.info("Next token is not a colon after key: ", self.parser.tokens[current_pos + 1])
             return False
 
         return True
@@ -700,7 +728,7 @@ class ExpressionParser:
 
         # Parse a basic expression (without consuming stop tokens)
         # For now, we'll use a simple approach: parse until we hit a stop token
-        expr_tokens = []
+        expr_tokens: List[Token] = []
         depth = 0  # Track nesting depth for parentheses/brackets
 
         while not self.parser.is_at_end():
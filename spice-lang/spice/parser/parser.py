@@ -1,19 +1,48 @@
 """Parser for Spice language."""
 
-from typing import List, Optional, Any
+import sys
+from typing import Any, FrozenSet, List, NoReturn, Optional, Sequence
 from spice.lexer import Token, TokenType
 from spice.parser.ast_nodes import (
-    Module, InterfaceDeclaration, MethodSignature, Parameter,
+    ASTNode, Module, ClassDeclaration, InterfaceDeclaration, MethodSignature, Parameter,
     ExpressionStatement, PassStatement, Expression, ReturnStatement,
     IfStatement, ForStatement, WhileStatement, SwitchStatement, CaseClause,
     RaiseStatement, ImportStatement, FinalDeclaration, FunctionDeclaration,
     IdentifierExpression, AssignmentExpression,
     TypeParameter, DataClassDeclaration, EnumMember, EnumDeclaration,
-    Annotation, AttributeExpression, CallExpression, ArgumentExpression
+    Annotation, AttributeExpression, CallExpression, ArgumentExpression, Modifier, NO_DEFAULT
 )
 from spice.errors import SpiceError, ParserError
 
-from spice.printils import parser_log
+from spice.printils import expression_parser_log, is_logging, parser_log
+
+
+# TokenType.X is an Enum class attribute lookup; the hot paths use this instead
+_EOF = TokenType.EOF
+_NEWLINE = TokenType.NEWLINE
+_COMMENT = TokenType.COMMENT
+_RBRACE = TokenType.RBRACE
+_IDENTIFIER = TokenType.IDENTIFIER
+_LBRACKET = TokenType.LBRACKET
+_RBRACKET = TokenType.RBRACKET
+
+# How _parse_type_annotation_string writes each punctuation token it accepts
+_TYPE_ANNOTATION_PUNCTUATION = {
+    _LBRACKET: '[',
+    _RBRACKET: ']',
+    TokenType.COMMA: ', ',
+    TokenType.DOT: '.',
+}
+
+# Tokens that may follow a compiler flag block; anything else means the '['
+# opened a list literal instead
+_STATEMENT_FLAG_NEXT = frozenset({TokenType.ABSTRACT, TokenType.FINAL, TokenType.CLASS, TokenType.DEF})
+_CLASS_MEMBER_FLAG_NEXT = frozenset({TokenType.STATIC, TokenType.ABSTRACT, TokenType.FINAL, TokenType.DEF})
+
+# Tokens accepted as a single-token type name; class members may also name
+# their return type with a string
+_TYPE_NAME_TOKENS = frozenset({TokenType.IDENTIFIER, TokenType.NONE})
+_MEMBER_RETURN_TYPE_TOKENS = _TYPE_NAME_TOKENS | {TokenType.STRING}
 
 
 class ParseError(SpiceError):
@@ -24,9 +53,33 @@ class ParseError(SpiceError):
 class Parser:
     """Parse Spice tokens into an AST."""
 
-    def __init__(self):
+    # Slots make the self.tokens / self.current reads on every token cheaper
+    __slots__ = ('tokens', 'current', 'verbose', '_next_sig', '_statement_handlers', 'expr_parser')
+
+    def __init__(self) -> None:
         self.tokens: List[Token] = []
         self.current = 0
+        # _next_sig[i]: index of the first token at or after i that isn't a
+        # NEWLINE/COMMENT (len(tokens) if none); rebuilt by parse()
+        self._next_sig: List[int] = [0]
+        # Whether parser_log outputs anything; set per parse() so the many log
+        # calls (some per token) skip building their messages when it doesn't
+        self.verbose = is_logging(parser_log)
+
+        # Leading keyword -> handler for parse_statement, in place of an if/elif ladder
+        self._statement_handlers = {
+            TokenType.INTERFACE: self._parse_interface_statement,
+            TokenType.DATA: self._parse_data_class_statement,
+            TokenType.ENUM: self._parse_enum_statement,
+            TokenType.ABSTRACT: self._parse_class_statement,
+            TokenType.CLASS: self._parse_class_statement,
+            TokenType.FINAL: self._parse_final_statement,
+            TokenType.DEF: self._parse_function_statement,
+            TokenType.RETURN: self._parse_top_level_return,
+            TokenType.RAISE: self._parse_raise_statement,
+            TokenType.IMPORT: self._parse_import_statement,
+            TokenType.FROM: self._parse_import_statement,
+        }
 
         # Extensions
         from spice.parser.expression_parser import ExpressionParser
@@ -35,27 +88,31 @@ class Parser:
     def match(self, *types: TokenType, advance_at_newline: bool = False) -> bool:
         """Check if current token matches any of the given types."""
         if advance_at_newline and self.check(TokenType.NEWLINE):
-            parser_log.info("Skipped NewLine token on match.")
+            if self.verbose:
+                parser_log.info("Skipped NewLine token on match.")
             self.advance()
 
-        for token_type in types:
-            if self.check(token_type):
+        # check() and advance(), inlined: this runs for nearly every token
+        token_type = self.tokens[self.current].type
+        if token_type in types and token_type is not _EOF:
+            if self.verbose:
                 parser_log.success(f"Matched token {self.peek()} for: {', '.join([t.name for t in types])}")
-                self.advance()
-                return True
+            self.current += 1
+            return True
         return False
 
     def check(self, *types: TokenType) -> bool:
         """Check if current token is of given type(s)."""
-        if self.is_at_end():
-            return False
-        return self.peek().type in types
+        token_type = self.tokens[self.current].type
+        return token_type in types and token_type is not _EOF
 
     def advance(self) -> Token:
         """Consume current token and return it."""
-        if not self.is_at_end():
-            self.current += 1
-        return self.previous()
+        token = self.tokens[self.current]
+        if token.type is _EOF:
+            return self.tokens[self.current - 1]
+        self.current += 1
+        return token
 
     def back(self) -> Token:
         """Backtrack one token, return current"""
@@ -67,12 +124,12 @@ class Parser:
 
     def is_at_end(self) -> bool:
         """Check if we're at end of tokens."""
-        return self.peek().type == TokenType.EOF
+        return self.tokens[self.current].type is _EOF
 
     def skip_newlines(self) -> None:
         """Skip any newline tokens at current position."""
-        while self.check(TokenType.NEWLINE) and not self.is_at_end():
-            self.advance()
+        while self.tokens[self.current].type is _NEWLINE:
+            self.current += 1
 
     def peek(self, offset: int = 0) -> Token:
         """Return current (+ offset) token without advancing."""
@@ -84,9 +141,11 @@ class Parser:
 
     def consume(self, token_type: TokenType, message: str) -> Token:
         """Consume token of given type or raise error."""
-        if self.check(token_type):
-            token = self.advance()
-            parser_log.info(f"Consumed token: {token.type.name}" + (f" '{token.value}'" if token.value is not None else ""))
+        token = self.tokens[self.current]
+        if token.type is token_type and token_type is not _EOF:
+            self.current += 1
+            if self.verbose:
+                parser_log.info(f"Consumed token: {token.type.name}" + (f" '{token.value}'" if token.value is not None else ""))
             return token
 
         self.raise_parser_error(f"{message} at line {self.peek().line} - found {self.peek().type.name} instead")
@@ -99,7 +158,7 @@ class Parser:
             size = len(self.tokens) - self.current
         return self.tokens[start:(start + size)]
 
-    def raise_parser_error(self, message: str, context_radius: int = 5) -> None:
+    def raise_parser_error(self, message: str, context_radius: int = 5) -> NoReturn:
         """Raise ParserError with contextual token information."""
         token_count = len(self.tokens)
         context_radius = max(context_radius, 0)
@@ -152,20 +211,32 @@ class Parser:
         """Parse tokens into an AST."""
         self.tokens = tokens
         self.current = 0
-        parser_log.info(f"Starting parsing with {len(tokens)} tokens")
+        self._next_sig = self._build_next_significant(tokens)
+        self.verbose = is_logging(parser_log)
+        self.expr_parser.verbose = is_logging(expression_parser_log)
+        if self.verbose:
+            parser_log.info(f"Starting parsing with {len(tokens)} tokens")
 
         statements = []
-        while not self.is_at_end():
-            # Skip newlines at module level
-            if self.check(TokenType.NEWLINE):
-                self.advance()
-                continue
+        try:
+            while True:
+                # Skip newlines and comments at module level
+                self.current = self._next_sig[self.current]
+                if self.is_at_end():
+                    break
 
-            stmt = self.parse_statement()
-            if stmt:
-                parser_log.info(f"Added statement: {type(stmt).__name__}")
-                statements.append(stmt)
-        parser_log.success(f"Finished parsing: Generated AST with {len(statements)} top-level statements")
+                stmt = self.parse_statement()
+                if stmt:
+                    if self.verbose:
+                        parser_log.info(f"Added statement: {type(stmt).__name__}")
+                    statements.append(stmt)
+        finally:
+            # A Parser outlives its parse (the pipeline reuses one per process);
+            # don't let it keep the file's token list and lookup table alive
+            self.tokens = []
+            self._next_sig = [0]
+        if self.verbose:
+            parser_log.success(f"Finished parsing: Generated AST with {len(statements)} top-level statements")
         return Module(body=statements)
 
 
@@ -174,8 +245,12 @@ class Parser:
     ##########################################
 
     # Pretty empty atm :p
-    def _consume_compiler_flags(self, allowed_next: Optional[List[TokenType]] = None) -> List[str]:
+    def _consume_compiler_flags(self, allowed_next: Optional[FrozenSet[TokenType]] = None) -> Sequence[str]:
         """Consume zero or more compiler flag blocks like [flag1, flag2]."""
+        # Nearly every statement and member has none; don't build a list for them
+        if self.tokens[self.current].type is not _LBRACKET:
+            return ()
+
         flags: List[str] = []
         start_index = self.current
 
@@ -201,7 +276,7 @@ class Parser:
             if next_type not in allowed_next:
                 # Roll back and treat the '[' as normal token (likely a list literal)
                 self.current = start_index
-                return []
+                return ()
 
         return flags
 
@@ -227,29 +302,42 @@ class Parser:
 
     def _parse_type_annotation_string(self) -> str:
         """Parse a type annotation expression."""
+        tokens = self.tokens
+        current = self.current
         parts: List[str] = []
         bracket_depth = 0
 
-        stop_tokens = {TokenType.ASSIGN, TokenType.SEMICOLON, TokenType.NEWLINE, TokenType.RBRACE}
-        while not self.check(*stop_tokens):
-            if self.check(TokenType.IDENTIFIER):
-                parts.append(str(self.advance().value))
-            elif self.match(TokenType.LBRACKET):
-                parts.append('[')
-                bracket_depth += 1
-            elif self.match(TokenType.RBRACKET):
-                if bracket_depth == 0:
-                    break
-                parts.append(']')
-                bracket_depth -= 1
-            elif self.match(TokenType.COMMA):
-                parts.append(', ')
-            elif self.match(TokenType.DOT):
-                parts.append('.')
+        # Anything that isn't a name or type punctuation (including =, ;, a
+        # newline or }) ends the annotation
+        while True:
+            token = tokens[current]
+            token_type = token.type
+            if token_type is _IDENTIFIER:
+                parts.append(str(token.value))
             else:
-                break
-
-        return ''.join(parts).strip()
+                text = _TYPE_ANNOTATION_PUNCTUATION.get(token_type)
+                if text is None:
+                    break
+                if token_type is _LBRACKET:
+                    bracket_depth += 1
+                elif token_type is _RBRACKET:
+                    if bracket_depth == 0:
+                        break
+                    bracket_depth -= 1
+                parts.append(text)
+            current += 1
+        self.current = current
+
+        # Interned so type comparisons in the checkers hit the identity fast path
+        return sys.intern(''.join(parts).strip())
+
+    def _parse_type_name(self, accepted: FrozenSet[TokenType], message: str) -> Any:
+        """Consume a single-token type name (return type, parameter type) of an accepted kind."""
+        token = self.tokens[self.current]
+        if token.type not in accepted:
+            self.raise_parser_error(f"{message} at line {token.line}")
+        self.current += 1
+        return token.value
 
     def _looks_like_typed_declaration(self) -> bool:
         """Determine if the next tokens represent a typed variable declaration."""
@@ -261,12 +349,23 @@ class Parser:
     def _peek_next_non_newline_type(self, start_index: Optional[int] = None) -> TokenType:
         """Peek ahead to find the next non-newline/comment token type."""
         lookahead = self.current if start_index is None else start_index
-        while lookahead < len(self.tokens):
-            token_type = self.tokens[lookahead].type
-            if token_type not in (TokenType.NEWLINE, TokenType.COMMENT):
-                return token_type
-            lookahead += 1
-        return TokenType.EOF
+        if lookahead >= len(self.tokens):
+            return _EOF
+        index = self._next_sig[lookahead]
+        return self.tokens[index].type if index < len(self.tokens) else _EOF
+
+    @staticmethod
+    def _build_next_significant(tokens: List[Token]) -> List[int]:
+        """For each token index, the index of the next token that isn't a newline/comment."""
+        trivia = (TokenType.NEWLINE, TokenType.COMMENT)
+        next_sig = [0] * (len(tokens) + 1)
+        following = len(tokens)
+        next_sig[following] = following
+        for i in range(following - 1, -1, -1):
+            if tokens[i].type not in trivia:
+                following = i
+            next_sig[i] = following
+        return next_sig
 
     ##########################################
     ################ CLASSES #################
@@ -277,26 +376,31 @@ class Parser:
     def parse_interface(self, line: int = 0, column: int = 0) -> InterfaceDeclaration:
         """Parse interface declaration."""
         name = self.consume(TokenType.IDENTIFIER, "Expected interface name").value
-        parser_log.info(f"Parsing interface '{name}'")
+        if self.verbose:
+            parser_log.info(f"Parsing interface '{name}'")
 
         # Optional base interfaces
         bases = []
         if self.match(TokenType.EXTENDS):
             base = self.consume(TokenType.IDENTIFIER, "Expected base interface").value
             bases.append(base)
-            parser_log.info(f"Added base interface: {base}")
+            if self.verbose:
+                parser_log.info(f"Added base interface: {base}")
 
             while self.match(TokenType.COMMA):
                 base = self.consume(TokenType.IDENTIFIER, "Expected base interface").value
                 bases.append(base)
-                parser_log.info(f"Added base interface: {base}")
+                if self.verbose:
+                    parser_log.info(f"Added base interface: {base}")
 
         # Interface body
         self.consume(TokenType.LBRACE, "Expected '{' after interface declaration")
-        parser_log.info("Parsing C-style interface body")
+        if self.verbose:
+            parser_log.info("Parsing C-style interface body")
 
         methods = self.parse_interface_body()
-        parser_log.info(f"Completed interface '{name}' with {len(methods)} methods")
+        if self.verbose:
+            parser_log.info(f"Completed interface '{name}' with {len(methods)} methods")
 
         return InterfaceDeclaration(name, methods, bases if bases else [], line=line, column=column)
 
@@ -305,17 +409,22 @@ class Parser:
         """Parse interface body with curly braces."""
         methods = []
 
-        while not self.check(TokenType.RBRACE) and not self.is_at_end():
-            if self.check(TokenType.NEWLINE):
-                self.advance()
+        tokens = self.tokens
+        while True:
+            token_type = tokens[self.current].type
+            if token_type is _NEWLINE:
+                self.current += 1
                 continue
+            if token_type is _RBRACE or token_type is _EOF:
+                break
 
-            if self.check(TokenType.DEF):
+            if token_type is TokenType.DEF:
                 start_token = self.peek()
                 self.advance()  # consume DEF
                 method = self.parse_method_signature(line=start_token.line, column=start_token.column)
                 methods.append(method)
-                parser_log.info(f"Added method signature: {method.name}")
+                if self.verbose:
+                    parser_log.info(f"Added method signature: {method.name}")
             else:
                 self.raise_parser_error(f"Expected method signature, got {self.peek()}")
 
@@ -323,83 +432,94 @@ class Parser:
         return methods
 
 
-    def parse_class(self, compiler_flags: Optional[List[str]] = None):
+    def parse_class(self, compiler_flags: Optional[Sequence[str]] = None):
         """Parse class declaration."""
-        from spice.parser.ast_nodes import ClassDeclaration
-
         # Capture position at start of class declaration
         start_token = self.peek()
         start_line = start_token.line
         start_column = start_token.column
 
         # Handle modifiers
-        is_abstract = False
-        is_final = False
+        modifiers = 0
 
         if self.match(TokenType.ABSTRACT):
-            is_abstract = True
-            parser_log.info("Class is abstract")
+            modifiers = Modifier.ABSTRACT
+            if self.verbose:
+                parser_log.info("Class is abstract")
         elif self.match(TokenType.FINAL):
-            is_final = True
-            parser_log.info("Class is final")
+            modifiers = Modifier.FINAL
+            if self.verbose:
+                parser_log.info("Class is final")
 
         # Consume 'class' keyword
         self.consume(TokenType.CLASS, "Expected 'class' keyword")
 
         # Class name
         name = self.consume(TokenType.IDENTIFIER, "Expected class name").value
-        parser_log.info(f"Parsing class '{name}'")
+        if self.verbose:
+            parser_log.info(f"Parsing class '{name}'")
 
         # Optional type parameters: <T, U>
         type_parameters = []
         if self.match(TokenType.LESS):
             type_parameters = self.parse_type_parameters()
-            parser_log.info(f"Class '{name}' has {len(type_parameters)} type parameters")
+            if self.verbose:
+                parser_log.info(f"Class '{name}' has {len(type_parameters)} type parameters")
 
         # Optional base classes and interfaces
         bases = []  # For extended classes
         interfaces = []  # For implemented interfaces
 
         if self.match(TokenType.LPAREN):
-            parser_log.info("Parsing Python-style inheritance")
+            if self.verbose:
+                parser_log.info("Parsing Python-style inheritance")
             # Python-style: class Dog(Animal)
             if not self.check(TokenType.RPAREN):
                 base = self.consume(TokenType.IDENTIFIER, "Expected base class").value
                 bases.append(base)
-                parser_log.info(f"Added base class: {base}")
+                if self.verbose:
+                    parser_log.info(f"Added base class: {base}")
                 while self.match(TokenType.COMMA):
                     base = self.consume(TokenType.IDENTIFIER, "Expected base class").value
                     bases.append(base)
-                    parser_log.info(f"Added base class: {base}")
+                    if self.verbose:
+                        parser_log.info(f"Added base class: {base}")
             self.consume(TokenType.RPAREN, "Expected ')' after base classes")
         elif self.match(TokenType.EXTENDS):
-            parser_log.info("Parsing Java-style inheritance")
+            if self.verbose:
+                parser_log.info("Parsing Java-style inheritance")
             # Java-style: class Dog extends Animal
             base = self.consume(TokenType.IDENTIFIER, "Expected base class").value
             bases.append(base)
-            parser_log.info(f"Added base class: {base}")
+            if self.verbose:
+                parser_log.info(f"Added base class: {base}")
 
         # Handle implements keyword for interfaces
         if self.match(TokenType.IMPLEMENTS):
-            parser_log.info("Parsing implemented interfaces")
+            if self.verbose:
+                parser_log.info("Parsing implemented interfaces")
             # implements Interface1, Interface2, ...
             interface = self.consume(TokenType.IDENTIFIER, "Expected interface name").value
             interfaces.append(interface)
-            parser_log.info(f"Added implemented interface: {interface}")
+            if self.verbose:
+                parser_log.info(f"Added implemented interface: {interface}")
             while self.match(TokenType.COMMA):
                 interface = self.consume(TokenType.IDENTIFIER, "Expected interface name").value
                 interfaces.append(interface)
-                parser_log.info(f"Added implemented interface: {interface}")
+                if self.verbose:
+                    parser_log.info(f"Added implemented interface: {interface}")
 
         # Class body
         self.consume(TokenType.LBRACE, "Expected '{' after class declaration")
 
         # Parse class body
-        parser_log.info("Parsing class body")
+        if self.verbose:
+            parser_log.info("Parsing class body")
         body = self.parse_class_body()
 
         self.consume(TokenType.RBRACE, "Expected '}' after class body")
-        parser_log.info(f"Completed class '{name}' with {len(body)} members")
+        if self.verbose:
+            parser_log.info(f"Completed class '{name}' with {len(body)} members")
 
         declaration = ClassDeclaration(
             name=name,
@@ -407,13 +527,13 @@ class Parser:
             type_parameters=type_parameters,
             bases=bases,
             interfaces=interfaces,
-            is_abstract=is_abstract,
-            is_final=is_final,
+            modifiers=modifiers,
             line=start_line,
             column=start_column
         )
 
-        declaration.compiler_flags = list(compiler_flags or [])
+        if compiler_flags:
+            declaration.compiler_flags = compiler_flags
         return declaration
 
     def parse_type_parameters(self) -> List[TypeParameter]:
@@ -423,7 +543,8 @@ class Parser:
         while True:
             start_token = self.peek()
             name = self.consume(TokenType.IDENTIFIER, "Expected type parameter name").value
-            parser_log.info(f"Parsing type parameter '{name}'")
+            if self.verbose:
+                parser_log.info(f"Parsing type parameter '{name}'")
 
             # A bound accepts either keyword interchangeably: `T extends C` and
             # `T implements C` mean the same thing - C must be an ancestor of the
@@ -432,7 +553,8 @@ class Parser:
             bound = None
             if self.match(TokenType.EXTENDS) or self.match(TokenType.IMPLEMENTS):
                 bound = self.consume(TokenType.IDENTIFIER, "Expected bound type after 'extends'/'implements'").value
-                parser_log.info(f"Type parameter '{name}' has bound: {bound}")
+                if self.verbose:
+                    parser_log.info(f"Type parameter '{name}' has bound: {bound}")
 
             params.append(TypeParameter(
                 name=name,
@@ -445,7 +567,8 @@ class Parser:
                 break
 
         self.consume(TokenType.GREATER, "Expected '>' after type parameters")
-        parser_log.info(f"Parsed {len(params)} type parameters")
+        if self.verbose:
+            parser_log.info(f"Parsed {len(params)} type parameters")
         return params
 
     def parse_data_class(self) -> DataClassDeclaration:
@@ -458,7 +581,8 @@ class Parser:
         self.consume(TokenType.CLASS, "Expected 'class' after 'data'")
 
         name = self.consume(TokenType.IDENTIFIER, "Expected data class name").value
-        parser_log.info(f"Parsing data class '{name}'")
+        if self.verbose:
+            parser_log.info(f"Parsing data class '{name}'")
 
         # Optional type parameters: <T, U>
         type_parameters = []
@@ -469,18 +593,21 @@ class Parser:
         self.consume(TokenType.LPAREN, "Expected '(' after data class name")
         fields = self.parse_parameters()
         self.consume(TokenType.RPAREN, "Expected ')' after data class fields")
-        parser_log.info(f"Data class '{name}' has {len(fields)} fields")
+        if self.verbose:
+            parser_log.info(f"Data class '{name}' has {len(fields)} fields")
 
         # Optional body or semicolon
         body = []
         if self.match(TokenType.LBRACE):
-            parser_log.info(f"Parsing data class '{name}' body")
+            if self.verbose:
+                parser_log.info(f"Parsing data class '{name}' body")
             body = self.parse_class_body()
             self.consume(TokenType.RBRACE, "Expected '}' after data class body")
         else:
             self.match(TokenType.SEMICOLON)
 
-        parser_log.info(f"Completed data class '{name}'")
+        if self.verbose:
+            parser_log.info(f"Completed data class '{name}'")
         return DataClassDeclaration(
             name=name,
             fields=fields,
@@ -499,7 +626,8 @@ class Parser:
         self.consume(TokenType.ENUM, "Expected 'enum'")
 
         name = self.consume(TokenType.IDENTIFIER, "Expected enum name").value
-        parser_log.info(f"Parsing enum '{name}'")
+        if self.verbose:
+            parser_log.info(f"Parsing enum '{name}'")
 
         self.consume(TokenType.LBRACE, "Expected '{' after enum name")
 
@@ -512,14 +640,16 @@ class Parser:
 
             member_token = self.peek()
             member_name = self.consume(TokenType.IDENTIFIER, "Expected enum member name").value
-            parser_log.info(f"Parsing enum member '{member_name}'")
+            if self.verbose:
+                parser_log.info(f"Parsing enum member '{member_name}'")
 
             # Optional constructor arguments: EARTH(a, b)
             args = []
             if self.match(TokenType.LPAREN):
                 args = self.parse_arguments()
                 self.consume(TokenType.RPAREN, "Expected ')' after enum member arguments")
-                parser_log.info(f"Enum member '{member_name}' has {len(args)} arguments")
+                if self.verbose:
+                    parser_log.info(f"Enum member '{member_name}' has {len(args)} arguments")
 
             members.append(EnumMember(
                 name=member_name,
@@ -539,12 +669,14 @@ class Parser:
         # Optional body after semicolon (constructor + methods)
         body = []
         if self.match(TokenType.SEMICOLON):
-            parser_log.info(f"Parsing enum '{name}' body (constructor and methods)")
+            if self.verbose:
+                parser_log.info(f"Parsing enum '{name}' body (constructor and methods)")
             body = self.parse_class_body()
 
         self.consume(TokenType.RBRACE, "Expected '}' after enum declaration")
 
-        parser_log.info(f"Completed enum '{name}' with {len(members)} members and {len(body)} body members")
+        if self.verbose:
+            parser_log.info(f"Completed enum '{name}' with {len(members)} members and {len(body)} body members")
         return EnumDeclaration(
             name=name,
             members=members,
@@ -581,30 +713,28 @@ class Parser:
         """Parse class body statements."""
         body = []
 
-        while not self.check(TokenType.RBRACE) and not self.is_at_end():
-            # Skip newlines
-            if self.check(TokenType.NEWLINE):
-                self.advance()
-                continue
-
-            # Skip comments
-            if self.check(TokenType.COMMENT):
-                self.advance()
-                continue
+        tokens = self.tokens
+        next_sig = self._next_sig
+        while True:
+            # Skip any run of newlines and comments in one step
+            self.current = next_sig[self.current]
+            token_type = tokens[self.current].type
+            if token_type is _RBRACE or token_type is _EOF:
+                break
 
             # Parse class member
-            parser_log.info("Parsing class member")
+            if self.verbose:
+                parser_log.info("Parsing class member")
             member_annotations = self.parse_annotations() if self.check(TokenType.AT, TokenType.AT_BANG) else []
-            member_flags = self._consume_compiler_flags(
-                [TokenType.STATIC, TokenType.ABSTRACT, TokenType.FINAL, TokenType.DEF]
-            )
+            member_flags = self._consume_compiler_flags(_CLASS_MEMBER_FLAG_NEXT)
             stmt = self.parse_class_member(compiler_flags=member_flags)
             if stmt:
                 if member_flags and not isinstance(stmt, FunctionDeclaration):
                     self.raise_parser_error("Compiler flags can only be applied to methods inside classes")
                 if member_annotations:
                     self._attach_annotations(stmt, member_annotations)
-                parser_log.info(f"Added class member: {type(stmt).__name__}")
+                if self.verbose:
+                    parser_log.info(f"Added class member: {type(stmt).__name__}")
                 body.append(stmt)
             elif member_flags:
                 self.raise_parser_error("Compiler flags must be followed by a method declaration inside classes")
@@ -612,7 +742,7 @@ class Parser:
         return body
 
 
-    def parse_class_member(self, is_interface: bool = False, compiler_flags: Optional[List[str]] = None):
+    def parse_class_member(self, is_interface: bool = False, compiler_flags: Optional[Sequence[str]] = None):
         """Parse a class member (method or field)."""
         # Capture position at start of member
         start_token = self.peek()
@@ -620,24 +750,26 @@ class Parser:
         start_column = start_token.column
 
         # Check for static modifier
-        is_static = False
-        is_abstract = False
-        is_final = False
+        modifiers = 0
 
         if self.match(TokenType.STATIC):
-            is_static = True
-            parser_log.info("Method is static")
+            modifiers = Modifier.STATIC
+            if self.verbose:
+                parser_log.info("Method is static")
         elif self.match(TokenType.ABSTRACT):
-            is_abstract = True
-            parser_log.info("Method is abstract")
+            modifiers = Modifier.ABSTRACT
+            if self.verbose:
+                parser_log.info("Method is abstract")
         elif self.match(TokenType.FINAL):
-            is_final = True
-            parser_log.info("Method is final")
+            modifiers = Modifier.FINAL
+            if self.verbose:
+                parser_log.info("Method is final")
 
         # Method declaration
         if self.match(TokenType.DEF):
             name = self.consume(TokenType.IDENTIFIER, "Expected method name").value
-            parser_log.info(f"Parsing method '{name}'")
+            if self.verbose:
+                parser_log.info(f"Parsing method '{name}'")
 
             # Parameters
             self.consume(TokenType.LPAREN, "Expected '(' after method name")
@@ -648,20 +780,15 @@ class Parser:
             return_type = None
             if self.match(TokenType.ARROW):
                 # Handle `-> return_type` syntax
-                if self.check(TokenType.IDENTIFIER):
-                    return_type = self.advance().value
-                elif self.check(TokenType.NONE):
-                    return_type = self.advance().value
-                elif self.check(TokenType.STRING):
-                    return_type = self.advance().value
-                else:
-                    self.raise_parser_error(f"Expected return type after '->' at line {self.peek().line}")
-                parser_log.info(f"Method '{name}' has return type: {return_type}")
+                return_type = self._parse_type_name(_MEMBER_RETURN_TYPE_TOKENS, "Expected return type after '->'")
+                if self.verbose:
+                    parser_log.info(f"Method '{name}' has return type: {return_type}")
 
             # Method body - abstract methods don't have bodies
-            body = []
-            if is_abstract or is_interface:
-                parser_log.info(f"Registered abstract/interface method '{name}'")
+            body: List[ASTNode] = []
+            if modifiers & Modifier.ABSTRACT or is_interface:
+                if self.verbose:
+                    parser_log.info(f"Registered abstract/interface method '{name}'")
                 has_semicolon = self.match(TokenType.SEMICOLON)
                 body.append(PassStatement(has_semicolon=has_semicolon))
 
@@ -669,29 +796,31 @@ class Parser:
             else:
                 # Concrete methods need a body
                 self.consume(TokenType.LBRACE, "Expected '{' after method signature")
-                parser_log.info(f"Parsing body of method '{name}'")
+                if self.verbose:
+                    parser_log.info(f"Parsing body of method '{name}'")
                 body = self.parse_method_body()
                 self.consume(TokenType.RBRACE, "Expected '}' after method body")
-                parser_log.info(f"Completed body of method '{name}'")
+                if self.verbose:
+                    parser_log.info(f"Completed body of method '{name}'")
 
             func_decl = FunctionDeclaration(
                 name=name,
                 params=params,
                 body=body,
                 return_type=return_type,
-                is_static=is_static,
-                is_abstract=is_abstract,
-                is_final=is_final,
+                modifiers=modifiers,
                 line=start_line,
                 column=start_column
             )
-            func_decl.compiler_flags = list(compiler_flags or [])
+            if compiler_flags:
+                func_decl.compiler_flags = compiler_flags
             return func_decl
 
         # Field declaration or other statements
         else:
             # Try to parse as a simple statement (e.g., assignment, expression, etc.)
-            parser_log.info("Parsing class member as simple statement")
+            if self.verbose:
+                parser_log.info("Parsing class member as simple statement")
             stmt = self.parse_simple_statement()
             return stmt
 
@@ -706,7 +835,8 @@ class Parser:
         """Parse a method signature."""
         name = self.consume(TokenType.IDENTIFIER, "Expected method name").value
 
-        parser_log.info(f"Parsing method signature '{name}'")
+        if self.verbose:
+            parser_log.info(f"Parsing method signature '{name}'")
 
         # Parameters
         self.consume(TokenType.LPAREN, "Expected '(' after method name")
@@ -716,15 +846,10 @@ class Parser:
         # Return type
         return_type = None
         if self.match(TokenType.ARROW):
-            # Accept both IDENTIFIER and special types like None
-            if self.check(TokenType.IDENTIFIER):
-                return_type = self.advance().value
-            elif self.check(TokenType.NONE):
-                return_type = self.advance().value
-            else:
-                self.raise_parser_error(f"Expected return type at line {self.peek().line}")
+            return_type = self._parse_type_name(_TYPE_NAME_TOKENS, "Expected return type")
 
-            parser_log.info(f"Method '{name}' has return type: {return_type}")
+            if self.verbose:
+                parser_log.info(f"Method '{name}' has return type: {return_type}")
 
         # Consume semicolon if present
         self.match(TokenType.SEMICOLON)
@@ -742,19 +867,22 @@ class Parser:
         if not self.check(TokenType.RPAREN):
             param = self.parse_parameter()
             params.append(param)
-            parser_log.info(f"Added parameter: {param.name}" + (f" with type {param.type_annotation}" if param.type_annotation else ""))
+            if self.verbose:
+                parser_log.info(f"Added parameter: {param.name}" + (f" with type {param.type_annotation}" if param.type_annotation else ""))
 
             while self.match(TokenType.COMMA):
                 # Skip newlines after comma
                 self.skip_newlines()
                 param = self.parse_parameter()
                 params.append(param)
-                parser_log.info(f"Added parameter: {param.name}" + (f" with type {param.type_annotation}" if param.type_annotation else ""))
+                if self.verbose:
+                    parser_log.info(f"Added parameter: {param.name}" + (f" with type {param.type_annotation}" if param.type_annotation else ""))
 
         # Skip newlines before closing paren
         self.skip_newlines()
 
-        parser_log.info(f"Parsed {len(params)} parameters")
+        if self.verbose:
+            parser_log.info(f"Parsed {len(params)} parameters")
         return params
 
 
@@ -765,20 +893,17 @@ class Parser:
         # Type annotation
         type_annotation = None
         if self.match(TokenType.COLON):
-            # Accept both IDENTIFIER and special types like None
-            if self.check(TokenType.IDENTIFIER):
-                type_annotation = self.advance().value
-            elif self.check(TokenType.NONE):
-                type_annotation = self.advance().value
-            else:
-                self.raise_parser_error(f"Expected type annotation at line {self.peek().line}")
+            type_annotation = self._parse_type_name(_TYPE_NAME_TOKENS, "Expected type annotation")
 
         # Default value
-        default = None
+        default: Any = NO_DEFAULT
         if self.match(TokenType.ASSIGN):
             # TODO: Parse expression
-            default = self.advance().value
-            parser_log.info(f"Parameter {name} has default value: {default}")
+            token = self.advance()
+            # String tokens hold the text between the quotes
+            default = repr(token.value) if token.type == TokenType.STRING else token.value
+            if self.verbose:
+                parser_log.info(f"Parameter {name} has default value: {default}")
 
         return Parameter(name, type_annotation, default)
 
@@ -787,34 +912,34 @@ class Parser:
         """Parse method body statements."""
         body = []
 
-        while not self.check(TokenType.RBRACE) and not self.is_at_end():
-            # Skip newlines
-            if self.check(TokenType.NEWLINE):
-                self.advance()
-                continue
-
-            # Skip comments
-            if self.check(TokenType.COMMENT):
-                self.advance()
-                continue
+        tokens = self.tokens
+        next_sig = self._next_sig
+        while True:
+            # Skip any run of newlines and comments in one step
+            self.current = next_sig[self.current]
+            token_type = tokens[self.current].type
+            if token_type is _RBRACE or token_type is _EOF:
+                break
 
             # For now, just parse simple expression statements
-            parser_log.info("Parsing statement in method body")
+            if self.verbose:
+                parser_log.info("Parsing statement in method body")
             stmt = self.parse_simple_statement()
             if stmt:
-                parser_log.info(f"Added statement to method body: {type(stmt).__name__}")
+                if self.verbose:
+                    parser_log.info(f"Added statement to method body: {type(stmt).__name__}")
                 body.append(stmt)
 
-        parser_log.info(f"Method body contains {len(body)} statements")
+        if self.verbose:
+            parser_log.info(f"Method body contains {len(body)} statements")
         return body
 
 
-    def parse_function(self, compiler_flags: Optional[List[str]] = None, line: int = 0, column: int = 0):
+    def parse_function(self, compiler_flags: Optional[Sequence[str]] = None, line: int = 0, column: int = 0):
         """Parse function declaration."""
-        from spice.parser.ast_nodes import FunctionDeclaration
-
         name = self.consume(TokenType.IDENTIFIER, "Expected function name").value
-        parser_log.info(f"Parsing function '{name}'")
+        if self.verbose:
+            parser_log.info(f"Parsing function '{name}'")
 
         # Parameters
         self.consume(TokenType.LPAREN, "Expected '(' after function name")
@@ -825,42 +950,34 @@ class Parser:
         return_type = None
         if self.match(TokenType.COLON):
             # Handle `: return_type` syntax
-            if self.check(TokenType.IDENTIFIER):
-                return_type = self.advance().value
-            elif self.check(TokenType.NONE):
-                return_type = self.advance().value
-            else:
-                self.raise_parser_error(f"Expected return type after ':' at line {self.peek().line}")
-            parser_log.info(f"Function '{name}' has return type: {return_type}")
+            return_type = self._parse_type_name(_TYPE_NAME_TOKENS, "Expected return type after ':'")
+            if self.verbose:
+                parser_log.info(f"Function '{name}' has return type: {return_type}")
         elif self.match(TokenType.ARROW):
             # Handle `-> return_type` syntax
-            if self.check(TokenType.IDENTIFIER):
-                return_type = self.advance().value
-            elif self.check(TokenType.NONE):
-                return_type = self.advance().value
-            else:
-                self.raise_parser_error(f"Expected return type after '->' at line {self.peek().line}")
-            parser_log.info(f"Function '{name}' has return type: {return_type}")
+            return_type = self._parse_type_name(_TYPE_NAME_TOKENS, "Expected return type after '->'")
+            if self.verbose:
+                parser_log.info(f"Function '{name}' has return type: {return_type}")
 
         # Function body
         self.consume(TokenType.LBRACE, "Expected '{' after function signature")
-        parser_log.info(f"Parsing body of function '{name}'")
+        if self.verbose:
+            parser_log.info(f"Parsing body of function '{name}'")
         body = self.parse_method_body()
         self.consume(TokenType.RBRACE, "Expected '}' after function body")
-        parser_log.info(f"Completed body of function '{name}'")
+        if self.verbose:
+            parser_log.info(f"Completed body of function '{name}'")
 
         func_decl = FunctionDeclaration(
             name=name,
             params=params,
             body=body,
             return_type=return_type,
-            is_static=False,
-            is_abstract=False,
-            is_final=False,
             line=line,
             column=column
         )
-        func_decl.compiler_flags = list(compiler_flags or [])
+        if compiler_flags:
+            func_decl.compiler_flags = compiler_flags
         return func_decl
 
 
@@ -926,7 +1043,7 @@ class Parser:
             self.raise_parser_error("Annotations can only precede declarations")
         node.annotations = list(annotations)
 
-    def parse_statement(self, context="general"):
+    def parse_statement(self, context="general") -> Optional[ASTNode]:
         """Parse a statement, consuming any leading annotations first."""
         annotations: List[Annotation] = []
         if self.check(TokenType.AT, TokenType.AT_BANG):
@@ -940,97 +1057,115 @@ class Parser:
 
     def _parse_statement_core(self, context="general"):
         """Parse a statement."""
-        parser_log.info(f"Parsing statement at token: {self.peek().type.name}")
+        if self.verbose:
+            parser_log.info(f"Parsing statement at token: {self.peek().type.name}")
 
         # Skip comments
         if self.check(TokenType.COMMENT):
             self.advance()
             return None
 
-        compiler_flags = self._consume_compiler_flags(
-            [TokenType.ABSTRACT, TokenType.FINAL, TokenType.CLASS, TokenType.DEF]
-        )
+        compiler_flags = self._consume_compiler_flags(_STATEMENT_FLAG_NEXT)
 
-        # Interface declaration
-        if self.check(TokenType.INTERFACE):
-            start_token = self.peek()
-            self.advance()  # consume INTERFACE
-            if compiler_flags:
-                self.raise_parser_error("Compiler flags are only supported for classes and functions")
+        # Statements opened by a keyword go straight to that keyword's handler
+        handler = self._statement_handlers.get(self.tokens[self.current].type)
+        if handler is not None:
+            return handler(compiler_flags, context)
+
+        if compiler_flags:
+            self.raise_parser_error("Compiler flags must precede a class or function declaration")
+
+        if self._looks_like_typed_declaration():
+            if self.verbose:
+                parser_log.info("Parsing typed declaration at top level")
+            return self.parse_typed_declaration()
+
+        # Expression statement
+        if self.verbose:
+            parser_log.info("Parsing expression statement")
+        return self.parse_expression_statement()
+
+    # Handlers for _statement_handlers. Each is called with the keyword as the
+    # current token, plus the compiler flags that preceded it and the context.
+
+    def _parse_interface_statement(self, compiler_flags: Sequence[str], context: str):
+        start_token = self.advance()  # consume INTERFACE
+        if compiler_flags:
+            self.raise_parser_error("Compiler flags are only supported for classes and functions")
+        if self.verbose:
             parser_log.info("Parsing interface declaration")
-            return self.parse_interface(start_token.line, start_token.column)
+        return self.parse_interface(start_token.line, start_token.column)
 
-        # Data class declaration
-        if self.check(TokenType.DATA):
-            if compiler_flags:
-                self.raise_parser_error("Compiler flags are not supported for data classes")
+    def _parse_data_class_statement(self, compiler_flags: Sequence[str], context: str):
+        if compiler_flags:
+            self.raise_parser_error("Compiler flags are not supported for data classes")
+        if self.verbose:
             parser_log.info("Parsing data class declaration")
-            return self.parse_data_class()
+        return self.parse_data_class()
 
-        # Enum declaration
-        if self.check(TokenType.ENUM):
-            if compiler_flags:
-                self.raise_parser_error("Compiler flags are not supported for enums")
+    def _parse_enum_statement(self, compiler_flags: Sequence[str], context: str):
+        if compiler_flags:
+            self.raise_parser_error("Compiler flags are not supported for enums")
+        if self.verbose:
             parser_log.info("Parsing enum declaration")
-            return self.parse_enum()
-
-        # Class declaration with modifiers (final can also start a variable declaration)
-        is_final_class = False
-        if self.check(TokenType.FINAL):
-            next_type = self._peek_next_non_newline_type(self.current + 1)
-            is_final_class = next_type == TokenType.CLASS
+        return self.parse_enum()
 
-        if self.check(TokenType.ABSTRACT, TokenType.CLASS) or is_final_class:
+    def _parse_class_statement(self, compiler_flags: Sequence[str], context: str):
+        if self.verbose:
             parser_log.info("Parsing class declaration")
-            return self.parse_class(compiler_flags=compiler_flags)
-
-        # Function declaration
-        if self.check(TokenType.DEF):
-            start_token = self.peek()
-            self.advance()  # consume DEF
-            parser_log.info("Parsing function declaration")
-            return self.parse_function(compiler_flags=compiler_flags, line=start_token.line, column=start_token.column)
+        return self.parse_class(compiler_flags=compiler_flags)
 
+    def _parse_final_statement(self, compiler_flags: Sequence[str], context: str):
+        # `final` opens either a final class or a final variable declaration
+        if self._peek_next_non_newline_type(self.current + 1) == TokenType.CLASS:
+            return self._parse_class_statement(compiler_flags, context)
         if compiler_flags:
             self.raise_parser_error("Compiler flags must precede a class or function declaration")
-
-        # Final declaration (top-level)
-        if self.match(TokenType.FINAL):
+        self.advance()  # consume FINAL
+        if self.verbose:
             parser_log.info("Parsing top-level final declaration")
-            return self.parse_final_declaration()
+        return self.parse_final_declaration()
 
+    def _parse_function_statement(self, compiler_flags: Sequence[str], context: str):
+        start_token = self.advance()  # consume DEF
+        if self.verbose:
+            parser_log.info("Parsing function declaration")
+        return self.parse_function(compiler_flags=compiler_flags, line=start_token.line, column=start_token.column)
+
+    def _parse_top_level_return(self, compiler_flags: Sequence[str], context: str):
         # Return statement at top-level (not recommended, but parseable)
-        if self.match(TokenType.RETURN):
+        if compiler_flags:
+            self.raise_parser_error("Compiler flags must precede a class or function declaration")
+        self.advance()  # consume RETURN
+        if self.verbose:
             parser_log.info("Parsing return statement at top-level")
-            value = None
-            if not self.check(TokenType.SEMICOLON, TokenType.NEWLINE, TokenType.RBRACE):
-                value = self.parse_expression(context)
-            has_semicolon = self.match(TokenType.SEMICOLON)
+        value = None
+        if not self.check(TokenType.SEMICOLON, TokenType.NEWLINE, TokenType.RBRACE):
+            value = self.parse_expression(context)
+        has_semicolon = self.match(TokenType.SEMICOLON)
+        if self.verbose:
             parser_log.info(f"Parsed return statement with value: {value}")
-            from spice.parser.ast_nodes import ReturnStatement
-            return ReturnStatement(value=value, has_semicolon=has_semicolon)
+        return ReturnStatement(value=value, has_semicolon=has_semicolon)
 
-        # Raise statement
-        if self.match(TokenType.RAISE):
+    def _parse_raise_statement(self, compiler_flags: Sequence[str], context: str):
+        if compiler_flags:
+            self.raise_parser_error("Compiler flags must precede a class or function declaration")
+        self.advance()  # consume RAISE
+        if self.verbose:
             parser_log.info("Parsing raise statement")
-            return self.parse_raise_statement()
+        return self.parse_raise_statement()
 
-        # Import statement
-        if self.check(TokenType.IMPORT, TokenType.FROM):
+    def _parse_import_statement(self, compiler_flags: Sequence[str], context: str):
+        if compiler_flags:
+            self.raise_parser_error("Compiler flags must precede a class or function declaration")
+        if self.verbose:
             parser_log.info("Parsing import statement")
-            return self.parse_import_statement()
+        return self.parse_import_statement()
 
-        if self._looks_like_typed_declaration():
-            parser_log.info("Parsing typed declaration at top level")
-            return self.parse_typed_declaration()
-
-        # Expression statement
-        parser_log.info("Parsing expression statement")
-        return self.parse_expression_statement()
-
-    def parse_expression(self, context="general") -> Optional[Expression]:
+    def parse_expression(self, context="general") -> Expression:
         """Parse an expression using the clean expression parser."""
-        parser_log.info(f"Parsing expression at token: {self.peek().type.name}")
+        if self.verbose:
+            parser_log.info(f"Parsing expression at token: {self.peek().type.name}")
 
         expr = self.expr_parser.parse_expression()
 
@@ -1041,7 +1176,8 @@ class Parser:
 
     def parse_expression_statement(self, context="general") -> Optional[ExpressionStatement]:
         """Parse expression statement."""
-        parser_log.info("Parsing expression statement")
+        if self.verbose:
+            parser_log.info("Parsing expression statement")
 
         expr = self.parse_expression(context=context)
 
@@ -1051,7 +1187,8 @@ class Parser:
         has_semicolon = self.match(TokenType.SEMICOLON)
 
         if has_semicolon:
-            parser_log.info("Expression has semicolon")
+            if self.verbose:
+                parser_log.info("Expression has semicolon")
 
         return ExpressionStatement(expression=expr, has_semicolon=has_semicolon)
 
@@ -1060,7 +1197,8 @@ class Parser:
         # Pass statement
         if self.match(TokenType.PASS):
             has_semicolon = self.match(TokenType.SEMICOLON)
-            parser_log.info("Parsed pass statement")
+            if self.verbose:
+                parser_log.info("Parsed pass statement")
             return PassStatement(has_semicolon=has_semicolon)
 
         # Final declaration
@@ -1073,7 +1211,8 @@ class Parser:
 
         # Return statement
         if self.match(TokenType.RETURN):
-            parser_log.info("Parsing return statement")
+            if self.verbose:
+                parser_log.info("Parsing return statement")
             value = None
             if not self.check(TokenType.SEMICOLON, TokenType.NEWLINE, TokenType.RBRACE):
                 value = self.parse_expression()
@@ -1132,7 +1271,8 @@ class Parser:
 
     def parse_typed_declaration(self) -> ExpressionStatement:
         """Parse a typed variable declaration."""
-        parser_log.info("Parsing typed variable declaration")
+        if self.verbose:
+            parser_log.info("Parsing typed variable declaration")
         identifier_token = self.consume(TokenType.IDENTIFIER, "Expected identifier in typed declaration")
         target = IdentifierExpression(name=identifier_token.value)
         self.consume(TokenType.COLON, "Expected ':' in typed declaration")
@@ -1156,7 +1296,8 @@ class Parser:
 
     def parse_final_declaration(self) -> FinalDeclaration:
         """Parse final variable declaration."""
-        parser_log.info("Parsing final variable declaration")
+        if self.verbose:
+            parser_log.info("Parsing final variable declaration")
 
         # Parse the identifier
         if not self.check(TokenType.IDENTIFIER):
@@ -1185,7 +1326,8 @@ class Parser:
 
     def parse_if_statement(self) -> IfStatement:
         """Parse if statement with clean condition parsing."""
-        parser_log.info("Parsing if statement")
+        if self.verbose:
+            parser_log.info("Parsing if statement")
 
         # Parse condition
         condition = self.parse_expression(context="condition")
@@ -1193,14 +1335,13 @@ class Parser:
             self.raise_parser_error("Expected condition after 'if'")
 
         # Validate it's not an assignment
-        from spice.parser.ast_nodes import AssignmentExpression
         if isinstance(condition, AssignmentExpression):
             self.raise_parser_error("Assignment expressions are not allowed as 'if' conditions")
 
         self.consume(TokenType.LBRACE, "Expected '{' after if condition")
         then_body = self.parse_block()
 
-        else_body = []
+        else_body: List[ASTNode] = []
         if self.check(TokenType.ELIF):
             # `elif cond { ... }` is sugar for `else { if cond { ... } }`: consume
             # the keyword and parse the rest of the chain as a nested if.
@@ -1219,7 +1360,8 @@ class Parser:
 
     def parse_while_statement(self) -> WhileStatement:
         """Parse while statement."""
-        parser_log.info("Parsing while statement")
+        if self.verbose:
+            parser_log.info("Parsing while statement")
 
         # Optional parentheses
         has_parens = self.match(TokenType.LPAREN)
@@ -1232,7 +1374,6 @@ class Parser:
             self.consume(TokenType.RPAREN, "Expected ')' after while condition")
 
         # Validate it's not an assignment
-        from spice.parser.ast_nodes import AssignmentExpression
         if isinstance(condition, AssignmentExpression):
             self.raise_parser_error("Assignment expressions are not allowed as 'while' conditions")
 
@@ -1243,7 +1384,8 @@ class Parser:
 
     def parse_for_statement(self) -> ForStatement:
         """Parse for statement."""
-        parser_log.info("Parsing for statement")
+        if self.verbose:
+            parser_log.info("Parsing for statement")
 
         # Optional parentheses
         has_parens = self.match(TokenType.LPAREN)
@@ -1262,7 +1404,8 @@ class Parser:
 
     def parse_switch_statement(self) -> SwitchStatement:
         """Parse switch statement."""
-        parser_log.info("Parsing switch statement")
+        if self.verbose:
+            parser_log.info("Parsing switch statement")
 
         self.consume(TokenType.LPAREN, "Expected '(' after 'switch'")
 
@@ -1273,7 +1416,7 @@ class Parser:
         self.consume(TokenType.RPAREN, "Expected ')' after switch expression")
         self.consume(TokenType.LBRACE, "Expected '{' after switch header")
 
-        cases = []
+        cases: List[CaseClause] = []
         default = []
 
         while not self.check(TokenType.RBRACE) and not self.is_at_end():
@@ -1312,7 +1455,8 @@ class Parser:
         return SwitchStatement(expression=expr, cases=cases, default=default)
 
     def parse_raise_statement(self) -> RaiseStatement:
-        parser_log.info("Parsing raise statement")
+        if self.verbose:
+            parser_log.info("Parsing raise statement")
 
         exception = None
 
@@ -1320,66 +1464,63 @@ class Parser:
         if not self.check(TokenType.SEMICOLON, TokenType.NEWLINE, TokenType.RBRACE):
             exception = self.parse_expression()
             if exception:
-                parser_log.info(f"Parsed raise exception: {type(exception).__name__}")
+                if self.verbose:
+                    parser_log.info(f"Parsed raise exception: {type(exception).__name__}")
 
         has_semicolon = self.match(TokenType.SEMICOLON)
 
-        parser_log.info(f"Completed raise statement (has_semicolon: {has_semicolon})")
+        if self.verbose:
+            parser_log.info(f"Completed raise statement (has_semicolon: {has_semicolon})")
 
         return RaiseStatement(exception=exception, has_semicolon=has_semicolon)
 
 
     def parse_import_statement(self) -> ImportStatement:
         """Parse import statement."""
-        parser_log.info("Parsing import statement")
+        if self.verbose:
+            parser_log.info("Parsing import statement")
 
         # Check for 'from module import names' syntax
         if self.match(TokenType.FROM):
             # from module import name1, name2, ...
             module = self.consume(TokenType.IDENTIFIER, "Expected module name after 'from'").value
-            parser_log.info(f"Parsing 'from {module} import ...'")
+            if self.verbose:
+                parser_log.info(f"Parsing 'from {module} import ...'")
 
             # Build module path for dotted imports
             while self.match(TokenType.DOT):
                 submodule = self.consume(TokenType.IDENTIFIER, "Expected module name after '.'").value
                 module += f".{submodule}"
-                parser_log.info(f"Extended module path: {module}")
+                if self.verbose:
+                    parser_log.info(f"Extended module path: {module}")
 
             self.consume(TokenType.IMPORT, "Expected 'import' after module name")
 
-            # Parse imported names
-            names = []
-            aliases = []
+            # Parse imported names: (name, alias) pairs
+            imports = []
 
-            # First name
-            name = self.consume(TokenType.IDENTIFIER, "Expected name to import").value
-            names.append(name)
-
-            alias = None
-            if self.match(TokenType.AS):
-                alias = self.consume(TokenType.IDENTIFIER, "Expected alias after 'as'").value
-                parser_log.info(f"Import alias: {name} as {alias}")
-            aliases.append(alias)
-
-            # Additional names
-            while self.match(TokenType.COMMA):
+            while True:
                 name = self.consume(TokenType.IDENTIFIER, "Expected name to import").value
-                names.append(name)
 
                 alias = None
                 if self.match(TokenType.AS):
                     alias = self.consume(TokenType.IDENTIFIER, "Expected alias after 'as'").value
-                    parser_log.info(f"Import alias: {name} as {alias}")
-                aliases.append(alias)
+                    if self.verbose:
+                        parser_log.info(f"Import alias: {name} as {alias}")
+                imports.append((name, alias))
+
+                # Additional names
+                if not self.match(TokenType.COMMA):
+                    break
 
             has_semicolon = self.match(TokenType.SEMICOLON)
 
-            parser_log.info(f"Parsed from import: from {module} import {', '.join(names)}")
+            if self.verbose:
+                parser_log.info(f"Parsed from import: from {module} import {', '.join(name for name, _ in imports)}")
 
             return ImportStatement(
                 module=module,
-                names=names,
-                aliases=aliases,
+                imports=imports,
                 is_from_import=True,
                 has_semicolon=has_semicolon
             )
@@ -1387,28 +1528,31 @@ class Parser:
         elif self.match(TokenType.IMPORT):
             # import module
             module = self.consume(TokenType.IDENTIFIER, "Expected module name after 'import'").value
-            parser_log.info(f"Parsing 'import {module}'")
+            if self.verbose:
+                parser_log.info(f"Parsing 'import {module}'")
 
             # Build module path for dotted imports
             while self.match(TokenType.DOT):
                 submodule = self.consume(TokenType.IDENTIFIER, "Expected module name after '.'").value
                 module += f".{submodule}"
-                parser_log.info(f"Extended module path: {module}")
+                if self.verbose:
+                    parser_log.info(f"Extended module path: {module}")
 
             # Optional alias
             alias = None
             if self.match(TokenType.AS):
                 alias = self.consume(TokenType.IDENTIFIER, "Expected alias after 'as'").value
-                parser_log.info(f"Import alias: {module} as {alias}")
+                if self.verbose:
+                    parser_log.info(f"Import alias: {module} as {alias}")
 
             has_semicolon = self.match(TokenType.SEMICOLON)
 
-            parser_log.info(f"Parsed import: import {module}" + (f" as {alias}" if alias else ""))
+            if self.verbose:
+                parser_log.info(f"Parsed import: import {module}" + (f" as {alias}" if alias else ""))
 
             return ImportStatement(
                 module=module,
-                names=[],
-                aliases=[alias] if alias else [],
+                alias=alias,
                 is_from_import=False,
                 has_semicolon=has_semicolon
             )
@@ -1421,11 +1565,14 @@ class Parser:
         """Parse a block of statements enclosed in braces."""
         body = []
 
-        while not self.check(TokenType.RBRACE) and not self.is_at_end():
-            if self.match(TokenType.NEWLINE):
-                continue
-            if self.match(TokenType.COMMENT):
-                continue
+        tokens = self.tokens
+        next_sig = self._next_sig
+        while True:
+            # Skip any run of newlines and comments in one step
+            self.current = next_sig[self.current]
+            token_type = tokens[self.current].type
+            if token_type is _RBRACE or token_type is _EOF:
+                break
 
             stmt = self.parse_simple_statement()
             if stmt:
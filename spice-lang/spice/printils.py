@@ -27,6 +27,11 @@ add_custom_styles(transformer_log)
 add_custom_styles(spice_compiler_log)
 add_custom_styles(pipeline_log)
 
+def is_logging(logger: Logger) -> bool:
+    """Whether `logger` outputs anywhere. Its methods format (and timestamp) every
+    message even when it doesn't, so hot paths check this before calling them."""
+    return logger.should_print_to_console or logger.should_log_to_file
+
 def spam_console(verbose: bool):
     lexer_log.should_print(verbose)
     parser_log.should_print(verbose)
@@ -1,6 +1,6 @@
 """Transform Spice AST to Python code."""
 
-from typing import Dict, List, Any, Optional
+from typing import Callable, Dict, List, Any, Optional
 
 # Import line will be very long but CTRL + Click doesn't work on * imports and I hate it
 from spice.parser import (
@@ -13,6 +13,8 @@ from spice.parser import (
     ImportStatement, DictEntry, SubscriptExpression, ComprehensionExpression,
     FinalDeclaration, DataClassDeclaration, EnumDeclaration, EnumMember, TypeParameter
 )
+from spice.parser.ast_nodes import BODY_CONTAINER_TYPES, NO_DEFAULT
+from spice.parser.constant_folding import NOT_CONSTANT, constant_value
 
 from spice.printils import transformer_log
 from spice import version
@@ -54,6 +56,7 @@ class Transformer:
         self.class_names: set[str] = set()
         self._class_stack: List[str] = []  # Track nested class context for constructor name transformation
         self._type_params: set[str] = set()  # Track current scope's generic type parameters
+        self._visit_methods: Dict[type, Callable[[Any], Any]] = {}  # node class -> bound visit_* method
 
     @property
     def is_cython(self) -> bool:
@@ -230,9 +233,8 @@ class Transformer:
             if isinstance(current, FunctionDeclaration):
                 if any(decorator.strip().startswith("@dispatch") for decorator in current.decorators):
                     return True
-            body = getattr(current, "body", None)
-            if isinstance(body, list):
-                stack.extend(body)
+            if type(current) in BODY_CONTAINER_TYPES and current.body:
+                stack.extend(current.body)
         return False
 
     def _render_expression(self, node) -> str:
@@ -244,9 +246,11 @@ class Transformer:
         return rendered
 
     def _infer_assignment_annotation(self, node: AssignmentExpression) -> Optional[str]:
-        if not isinstance(node.target, IdentifierExpression):
+        # A written annotation always wins, and a folded literal's type is not
+        # one the user wrote (`7 / 2` folds to a float, `"" and y` to a str)
+        if node.type_annotation is not None or not isinstance(node.target, IdentifierExpression):
             return None
-        if isinstance(node.value, LiteralExpression):
+        if isinstance(node.value, LiteralExpression) and not node.value.folded:
             return {
                 "string": "str",
                 "number": "int",
@@ -260,8 +264,12 @@ class Transformer:
 
     def visit(self, node):
         """Generic visitor method."""
-        method_name = f"visit_{type(node).__name__}"
-        method = getattr(self, method_name, self.generic_visit)
+        node_type = type(node)
+        method = self._visit_methods.get(node_type)
+        if method is None:
+            # Resolved once per node class, then a single dict probe per node.
+            method = getattr(self, f"visit_{node_type.__name__}", self.generic_visit)
+            self._visit_methods[node_type] = method
         return method(node)
 
     def generic_visit(self, node):
@@ -435,7 +443,7 @@ class Transformer:
         # Fields as class attributes with type hints
         for field in node.fields:
             type_ann = f": {field.type_annotation}" if field.type_annotation else ""
-            default = f" = {field.default}" if field.default else ""
+            default = f" = {field.default}" if field.default is not NO_DEFAULT else ""
             self.output.append(self._indent(f"{field.name}{type_ann}{default}\n"))
 
         # Add blank line between fields and methods if there are both
@@ -899,6 +907,15 @@ class Transformer:
     def visit_SwitchStatement(self, node: SwitchStatement):
         """Visit switch statement node."""
         transformer_log.custom("transform", "Transforming switch statement (using if-elif-else)")
+        # A constant subject picks its case at compile time
+        subject = constant_value(node.expression)
+        if subject is not NOT_CONSTANT:
+            body = node.resolve(subject)
+            if body:
+                for stmt in body:
+                    self.visit(stmt)
+                return
+
         # Python doesn't have switch, so use if-elif-else
         subject_str = self.expr_to_str(node.expression)
         for i, case in enumerate(node.cases):
@@ -974,19 +991,14 @@ class Transformer:
 
         if node.is_from_import:
             # from module import name1, name2, ...
-            import_items = []
-            for i, name in enumerate(node.names):
-                if i < len(node.aliases) and node.aliases[i]:
-                    import_items.append(f"{name} as {node.aliases[i]}")
-                else:
-                    import_items.append(name)
-
-            import_list = ", ".join(import_items)
+            import_list = ", ".join(
+                f"{name} as {alias}" if alias else name for name, alias in node.imports
+            )
             self.output.append(f"from {node.module} import {import_list}\n")
         else:
             # import module
-            if node.aliases and node.aliases[0]:
-                self.output.append(f"import {node.module} as {node.aliases[0]}\n")
+            if node.alias:
+                self.output.append(f"import {node.module} as {node.alias}\n")
             else:
                 self.output.append(f"import {node.module}\n")
 
@@ -1111,7 +1123,7 @@ class Transformer:
                 result += f": {cython_type}"
             else:
                 result += f": {param.type_annotation}"
-        if param.default:
+        if param.default is not NO_DEFAULT:
             result += f" = {param.default}"
         return result
 
@@ -1,3 +1,4 @@
 from spice.utils.hashing import generate_spc_stub
+from spice.utils.compat import DATACLASS_SLOTS
 
-__all__ = ["generate_spc_stub"]
\ No newline at end of file
+__all__ = ["generate_spc_stub", "DATACLASS_SLOTS"]
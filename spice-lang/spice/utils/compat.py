@@ -0,0 +1,7 @@
+"""Small shims over differences between supported Python versions."""
+
+import sys
+
+# `@dataclass(**DATACLASS_SLOTS)` gives slotted dataclasses where the
+# interpreter supports it (3.10+) and plain ones elsewhere.
+DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
@@ -0,0 +1,66 @@
+"""The opt-in build cache skips files that are unchanged since their last build."""
+
+from pathlib import Path
+
+import pytest
+
+from spice.compilation import BuildFlags, SpicePipeline, build_cache
+
+
+def _build(entry: Path, cache: bool = True) -> None:
+    flags = BuildFlags(source=entry, emit="py", cache=cache)
+    tree = SpicePipeline.walk(entry, None, flags)
+    SpicePipeline.verify_and_write(tree, flags)
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(build_cache, "CACHE_DIR", tmp_path / "cache")
+    entry = tmp_path / "main.spc"
+    entry.write_text("def main() -> None {\n    pass;\n}\n", encoding="utf-8")
+    return entry
+
+
+def _fail_analysis(*args, **kwargs):
+    raise AssertionError("file should have been skipped")
+
+
+class TestBuildCache:
+    def test_unchanged_file_is_skipped(self, project, monkeypatch):
+        _build(project)
+        assert project.with_suffix(".py").is_file()
+
+        monkeypatch.setattr(SpicePipeline, "_run_analysis", staticmethod(_fail_analysis))
+        _build(project)
+
+    def test_changed_source_is_rebuilt(self, project):
+        _build(project)
+        project.write_text("def other() -> None {\n    pass;\n}\n", encoding="utf-8")
+        _build(project)
+
+        assert "def other" in project.with_suffix(".py").read_text(encoding="utf-8")
+
+    def test_edited_output_is_rebuilt(self, project):
+        _build(project)
+        output = project.with_suffix(".py")
+        output.write_text("", encoding="utf-8")
+        _build(project)
+
+        assert "def main" in output.read_text(encoding="utf-8")
+
+    def test_unchanged_source_reuses_cached_ast(self, project, monkeypatch):
+        _build(project)
+        assert list((build_cache.CACHE_DIR / "ast").glob("*.pkl"))
+
+        monkeypatch.setattr(SpicePipeline, "tokenize", staticmethod(_fail_analysis))
+        monkeypatch.setattr(SpicePipeline, "parse", staticmethod(_fail_analysis))
+        flags = BuildFlags(source=project, emit="py", cache=True)
+        first = SpicePipeline.walk(project, None, flags)
+        second = SpicePipeline.walk(project, None, flags)
+
+        assert first.ast.body and first.ast is not second.ast
+
+    def test_cache_is_off_by_default(self, project):
+        _build(project, cache=False)
+        assert not build_cache.CACHE_DIR.exists()
@@ -4,7 +4,7 @@ from types import SimpleNamespace
 
 from spice.lexer import Lexer
 from spice.parser import Parser
-from spice.compilation.checks import FinalChecker
+from spice.compilation.checks import CompositeChecker, FinalChecker, SymbolTableBuilder
 
 
 class TestFinalCheckerFinalMethods:
@@ -97,3 +97,62 @@ a = 2;
 
         assert not result
         assert any("Cannot reassign final variable 'a'" in str(error) for error in checker.errors)
+
+    def test_reassignment_in_function_reported_once(self):
+        source = """
+final a: int = 1;
+
+def f() -> None {
+    a = 2;
+}
+"""
+        checker = FinalChecker()
+        spice_file = self._file_from_source(source)
+        result = checker.check(spice_file)
+
+        assert not result
+        assert len(checker.errors) == 1
+
+    def test_detects_override_of_base_declared_later(self):
+        source = """
+class B extends A {
+    def func() -> None {
+        return;
+    }
+}
+
+class A {
+    final def func() -> None {
+        return;
+    }
+}
+"""
+        checker = FinalChecker()
+        spice_file = self._file_from_source(source)
+        result = checker.check(spice_file)
+
+        assert not result
+        assert any("Class 'B' cannot override final method 'func'" in str(error) for error in checker.errors)
+
+    def test_composite_walk_reports_final_errors(self):
+        source = """
+class A {
+    final def func() -> None {
+        return;
+    }
+}
+
+class B extends A {
+    def func() -> None {
+        return;
+    }
+}
+"""
+        final_checker = FinalChecker()
+        spice_file = self._file_from_source(source)
+        result = CompositeChecker([SymbolTableBuilder(), final_checker]).check(spice_file)
+
+        assert not result
+        assert final_checker.errors
+        assert "B" in spice_file.symbol_table.classes
+        assert "func" in spice_file.symbol_table.classes["B"].methods
@@ -177,3 +177,69 @@ b: List[int] = [];
                    f"Expected interface name 'Drawable', got '{interface.name}'")
         safe_assert(len(interface.methods) == 2,
                    f"Expected 2 methods, got {len(interface.methods)}")
+
+    def test_str_is_shallow_and_dump_is_deep(self):
+        """A node's str() summarizes child statements; dump() renders all of them."""
+        source = """def f(a: int) -> int {
+    if a > 1 {
+        return a;
+    }
+    return 0;
+}
+"""
+        func = self.parse_source(source).body[0]
+
+        safe_assert("body=2 statements" in str(func), f"Expected a body count, got: {func}")
+        safe_assert("ReturnStatement" not in str(func), f"str() should not render children: {func}")
+        safe_assert(func.dump().count("ReturnStatement(") == 2, f"dump() should render every statement: {func.dump()}")
+
+    def test_constant_expressions_are_folded(self):
+        """Operators over literals become one literal; anything else is kept as written."""
+        def value_of(source):
+            return self.parse_source(source).body[0].expression.value
+
+        folded = value_of("x = 1 + 6 / 2 + 4 * 5;")
+        safe_assert(type(folded).__name__ == "LiteralExpression", f"Expected a literal, got: {folded}")
+        safe_assert(folded.value == "24.0", f"Expected 24.0, got: {folded.value}")
+
+        negative = value_of("x = 2 - 5;")
+        safe_assert(type(negative).__name__ == "UnaryExpression" and negative.operand.value == "3",
+                    f"Expected -3, got: {negative}")
+
+        safe_assert(value_of("x = not (1 < 2);").value is False, "Expected a folded boolean")
+        safe_assert(type(value_of("x = 1 / 0;")).__name__ == "BinaryExpression",
+                    "Division by zero must be left to runtime")
+        safe_assert(type(value_of("x = y + 1;")).__name__ == "BinaryExpression",
+                    "Non-constant operands must not be folded")
+
+    def test_folding_large_ints(self):
+        """Ints past float range fold exactly; ones too big to write out are left to runtime."""
+        def value_of(source):
+            return self.parse_source(source).body[0].expression.value
+
+        big = value_of("y: int = 10 ** 64 * 10 ** 64 * 10 ** 64 * 10 ** 64 * 10 ** 64;")
+        safe_assert(type(big).__name__ == "LiteralExpression", f"Expected a literal, got: {big}")
+        safe_assert(big.value == "1" + "0" * 320, f"Expected 10**320, got: {big.value}")
+
+        negative = value_of("y: int = 0 - 10 ** 64 * 10 ** 64 * 10 ** 64 * 10 ** 64 * 10 ** 64;")
+        safe_assert(type(negative).__name__ == "UnaryExpression" and negative.operand.value == big.value,
+                    f"Expected -10**320, got: {negative}")
+
+        huge = value_of("y: int = (10 ** 64 * 10 ** 64) ** 64;")
+        safe_assert(type(huge).__name__ == "BinaryExpression", f"An 8000-digit int must not be folded: {huge}")
+
+    def test_declaration_modifiers_are_packed(self):
+        """static/abstract/final are bits of `modifiers`, still readable as is_* flags."""
+        source = """abstract class Shape {
+    static def make() -> None {
+        pass;
+    }
+}
+"""
+        from spice.parser.ast_nodes import Modifier
+        shape = self.parse_source(source).body[0]
+        method = shape.body[0]
+        safe_assert(shape.modifiers == Modifier.ABSTRACT and shape.is_abstract and not shape.is_final,
+                    f"Expected an abstract class, got: {shape}")
+        safe_assert(method.modifiers & Modifier.STATIC and method.is_static and not method.is_abstract,
+                    f"Expected a static method, got: {method}")
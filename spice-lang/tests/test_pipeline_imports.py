@@ -10,7 +10,8 @@ from pathlib import Path
 import pytest
 
 from spice.compilation import BuildFlags, SpicePipeline
-from spice.errors import ImportError as SpiceImportError
+from spice.compilation.pipeline_context import PipelineContext
+from spice.errors import ImportError as SpiceImportError, SpiceCompileTimeError
 
 
 def _flags(entry: Path) -> BuildFlags:
@@ -55,3 +56,70 @@ class TestImportGraph:
         entry = tmp_path / "x.spc"
         with pytest.raises(SpiceImportError):
             SpicePipeline.walk(entry, None, _flags(entry))
+
+
+    def test_parallel_walk_parses_every_module_once(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        _write(tmp_path, "d", _fn("d"))
+        _write(tmp_path, "b", "import d\n\n" + _fn("b"))
+        _write(tmp_path, "c", "import d\n\n" + _fn("c"))
+        _write(tmp_path, "a", "import b\nimport c\n\n" + _fn("a"))
+
+        entry = tmp_path / "a.spc"
+        tree = SpicePipeline.walk(entry, None, BuildFlags(source=entry, emit="py", jobs=2))
+
+        b, c = tree.spc_imports
+        assert b.ast.body and c.ast.body
+        assert b.spc_imports[0] is c.spc_imports[0]
+        assert b.spc_imports[0].ast.body
+
+    def test_repeated_module_is_resolved_once_per_build(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        _write(tmp_path, "d", _fn("d"))
+        _write(tmp_path, "b", "import d\n\n" + _fn("b"))
+        _write(tmp_path, "c", "import d\n\n" + _fn("c"))
+        _write(tmp_path, "a", "import b\nimport c\n\n" + _fn("a"))
+
+        entry = tmp_path / "a.spc"
+        ctx = PipelineContext()
+        SpicePipeline.walk(entry, None, _flags(entry), ctx)
+
+        assert set(ctx.resolved_modules) == {"b", "c", "d"}
+        assert ctx.resolved_modules["d"][1:] == ("spc", tmp_path.resolve() / "d.spc")
+
+    def test_builds_do_not_share_resolution_state(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        _write(tmp_path, "d", _fn("d"))
+        _write(tmp_path, "a", "import d\n\n" + _fn("a"))
+
+        entry = tmp_path / "a.spc"
+        ctx = PipelineContext()
+        first = SpicePipeline.walk(entry, None, _flags(entry), ctx)
+        second = SpicePipeline.walk(entry, None, _flags(entry))
+
+        assert ctx.resolved_files[(tmp_path / "d.spc").resolve()] is first.spc_imports[0]
+        assert second.spc_imports[0] is not first.spc_imports[0]
+
+
+class TestParallelChecks:
+    def test_checks_with_several_jobs_still_write_output(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        _write(tmp_path, "a", _fn("a"))
+
+        entry = tmp_path / "a.spc"
+        flags = BuildFlags(source=entry, emit="py", jobs=3)
+        SpicePipeline.verify_and_write(SpicePipeline.walk(entry, None, flags), flags)
+
+        assert "def a" in (tmp_path / "a.py").read_text(encoding="utf-8")
+
+    def test_nothing_is_written_when_an_import_fails_checks(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        _write(tmp_path, "bad", "value: str = \"hello\";\nalias = value;\n")
+        _write(tmp_path, "a", "import bad\n\n" + _fn("a"))
+
+        entry = tmp_path / "a.spc"
+        flags = BuildFlags(source=entry, emit="py", jobs=2)
+        with pytest.raises(SpiceCompileTimeError):
+            SpicePipeline.verify_and_write(SpicePipeline.walk(entry, None, flags), flags)
+
+        assert not (tmp_path / "a.py").exists()
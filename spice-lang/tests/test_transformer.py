@@ -152,6 +152,23 @@ instance = Foo();
             "instance: Foo = Foo()",
         ], "literal assignment inference")
 
+    def test_folded_assignment_keeps_written_annotation(self):
+        """Folding a constant expression must not replace the declared type."""
+        source = """ratio: float = 7 / 2;
+half: float = 1.0 / 2;
+total = 1 + 2;
+"""
+        log_test_start("test_folded_assignment_keeps_written_annotation", source)
+        result = self.transform_source(source)
+        log_test_result("test_folded_assignment_keeps_written_annotation", result)
+
+        assert_contains_all(result, [
+            "ratio: float = 3.5",
+            "half: float = 0.5",
+            "total = 3",
+        ], "folded assignment annotations")
+        assert_lacking(result, ": int =", "Folded values must not gain an inferred annotation")
+
     def test_multiple_methods(self):
         """Test interface with multiple methods."""
         source = """interface Shape {
@@ -496,6 +513,42 @@ class MyClass {
         assert "IdentifierExpression" not in result, \
             f"raw AST node leaked into output:\n{result}"
 
+    def test_switch_on_constant_emits_only_the_matching_case(self):
+        """A literal subject is matched at compile time; no if/elif chain is emitted."""
+        source = """def f() -> str {
+    switch (2) {
+        case 1:
+            return "one";
+        case 2:
+            return "two";
+        default:
+            return "many";
+    }
+}"""
+        result = self.transform_source(source)
+        presentIn(result, "return 'two'")
+        for item in ("'one'", "'many'", "if 2 =="):
+            assert_lacking(result, item, "constant switch")
+
+    def test_parameter_defaults_are_kept(self):
+        """Falsy defaults (empty string, 0) are emitted; parameters without one get none."""
+        source = """def f(a: int, s: str = "", n: int = 0) -> None {
+    pass;
+}"""
+        result = self.transform_source(source)
+        presentIn(result, "def f(a: int, s: str = '', n: int = 0)")
+
+    def test_import_aliases(self):
+        """Per-name aliases on from-imports and a module alias on plain imports."""
+        source = """from os.path import join as pjoin, exists
+import collections as col
+"""
+        result = self.transform_source(source)
+        assert_contains_all(result, [
+            "from os.path import join as pjoin, exists",
+            "import collections as col",
+        ], "import aliases")
+
     def test_elif_chain(self):
         """`elif` is parsed and emitted as a Python elif (regression)."""
         source = """def f(n: int) -> str {
@@ -81,6 +81,17 @@ alias = value;
             errors,
         )
 
+    def test_folded_constant_expression_still_requires_annotation(self):
+        """`1 + 2` is folded to a literal by the parser but was written as an expression."""
+        for expression in ("1 + 2", "not True", "False and 1"):
+            result, errors = self.run_type_check(f"total = {expression};\n")
+            safe_assert(not result, f"'total = {expression}' should need an annotation", errors)
+            safe_assert(any("total" in str(error) for error in errors),
+                        "Error should mention the variable needing annotation", errors)
+
+        result, errors = self.run_type_check("total = 3;\ntyped: int = 1 + 2;\n")
+        safe_assert(result, "Plain literals and annotated folded expressions should pass", errors)
+
     def test_subtype_argument_is_accepted(self):
         """A concrete type is accepted where its interface/base is expected."""
         source = """interface Drawable {
@@ -138,3 +149,72 @@ inst2 = B();
 """
         result, errors = self.run_type_check(source)
         safe_assert(result, "Constructor assignments should be inferred", errors)
+
+    def test_methods_get_scopes_keyed_by_class(self):
+        """Same-named methods of different classes must not share a scope."""
+        source = """class A {
+    def helper(x: int) -> None {
+        return;
+    }
+}
+
+class B {
+    def helper(x: str) -> None {
+        return;
+    }
+}
+"""
+        fake_file = self.build_file(source)
+        SymbolTableBuilder().check(fake_file)
+        scopes = fake_file.symbol_table.scopes
+        safe_assert(scopes[("A", "helper")].variables["x"].type_annotation == "int", "A.helper keeps its own param", scopes)
+        safe_assert(scopes[("B", "helper")].variables["x"].type_annotation == "str", "B.helper keeps its own param", scopes)
+        safe_assert(scopes[("A", "helper")].parent == ("A",), "Method scope is nested in its class scope", scopes)
+        safe_assert(scopes[("A",)].children["helper"] is scopes[("A", "helper")], "Class scope links its method scope", scopes)
+
+    def test_wrong_arity_reports_no_overload(self):
+        """Calls with no overload of matching arity should fail."""
+        source = """class A {
+    def func(a: int) -> None {
+        return;
+    }
+
+    def func(a: int, b: int) -> None {
+        return;
+    }
+}
+
+a = A();
+x: int = 1;
+a.func(x, x, x);
+"""
+        result, errors = self.run_type_check(source)
+        safe_assert(not result, "Type checker should fail for wrong arity", errors)
+        safe_assert(any("No overload of A.func" in str(error) for error in errors), "Error should name the overload set", errors)
+
+    def test_assignment_error_reports_assignment_line(self):
+        """Errors raised for an assignment carry the assignment's position."""
+        source = """value: str = "hello";
+alias = value;
+"""
+        result, errors = self.run_type_check(source)
+        safe_assert(not result, "Type checker should fail when assignment lacks annotation", errors)
+        safe_assert(errors[0].line == 2, "Error should point at the assignment line", errors)
+
+    def test_generic_binding_is_enforced_across_calls(self):
+        """A type parameter bound by one call must match on later calls."""
+        source = """class Box<T> {
+    def put(item: T) -> None {
+        return;
+    }
+}
+
+box = Box();
+x: int = 1;
+s: str = "s";
+box.put(x);
+box.put(s);
+"""
+        result, errors = self.run_type_check(source)
+        safe_assert(not result, "Type checker should fail when a binding is contradicted", errors)
+        safe_assert(len(errors) == 1, "Only the contradicting call should fail", errors)